@@ -1,11 +1,38 @@
+"""
+Anthropic runner — drop-in replacement for `claude -p <prompt>`.
+
+One-shot:   python anthropic_runner.py -p "prompt"
+Warm mode:  python anthropic_runner.py --serve
+            Keeps the Anthropic client and SKILL.md loaded and answers
+            prompts over a local TCP socket (one JSON object per line), so
+            the watcher skips interpreter/SDK startup for every task.
+
+The SKILL.md + Company_Handbook.md system prompt is sent as a cacheable
+prefix (cache_control: ephemeral) and its file contents are cached in-process
+by mtime. Token usage, including cache reads/writes, is printed to stderr
+and logged as "LLM Usage" in /Logs so savings can be measured per day.
+"""
+
+import json
 import os
+import socket
+import socketserver
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
-from anthropic import Anthropic
 
 VAULT = Path(__file__).parent.resolve()
 SECRETS = VAULT / "Secrets"
+MODEL = "claude-3-5-sonnet-latest"
+MAX_TOKENS = 1000
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+SYSTEM_PROMPT_FILES = ("SKILL.md", "Company_Handbook.md")
+FALLBACK_SYSTEM = "Follow the AI Employee Vault operating manual."
+
+# path -> (mtime_ns, text)
+_file_cache: dict[Path, tuple[int, str]] = {}
+
 
 def get_prompt_from_args(argv: list[str]) -> str:
     if "-p" in argv:
@@ -18,33 +45,192 @@ def get_prompt_from_args(argv: list[str]) -> str:
             return argv[i + 1]
     return "Process the requested task per SKILL.md"
 
-def main() -> None:
+
+def get_worker_address() -> tuple[str, int]:
+    """Host/port of the warm worker from config.yaml `llm_runner`."""
+    from config_loader import load_config
+    runner_cfg = load_config().get("llm_runner", {})
+    return runner_cfg.get("host", DEFAULT_HOST), int(runner_cfg.get("port", DEFAULT_PORT))
+
+
+def create_client():
+    from anthropic import Anthropic
+
     load_dotenv(SECRETS / ".env")
     api_key = os.getenv("ANTHROPIC_API_KEY", "").strip()
     if not api_key:
         print("ANTHROPIC_API_KEY missing in Secrets/.env")
         sys.exit(1)
+    return Anthropic(api_key=api_key)
+
+
+def _read_cached(path: Path) -> str:
+    """File contents, re-read only when the file's mtime changes."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        _file_cache.pop(path, None)
+        return ""
+    cached = _file_cache.get(path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        text = path.read_text(encoding="utf-8")
+    except Exception:
+        return ""
+    _file_cache[path] = (mtime_ns, text)
+    return text
+
+
+def load_system_prompt() -> str:
+    """SKILL.md followed by Company_Handbook.md — the stable prompt prefix."""
+    parts = [_read_cached(VAULT / name) for name in SYSTEM_PROMPT_FILES]
+    return "\n\n".join(p for p in parts if p)
+
+
+def build_system_blocks(system_text: str) -> list[dict]:
+    """System prompt as a single block marked as a prompt-cache breakpoint."""
+    return [{
+        "type": "text",
+        "text": system_text or FALLBACK_SYSTEM,
+        "cache_control": {"type": "ephemeral"},
+    }]
+
+
+def usage_summary(msg) -> dict:
+    usage = getattr(msg, "usage", None)
+    return {
+        "input_tokens": getattr(usage, "input_tokens", 0) or 0,
+        "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", 0) or 0,
+        "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+        "output_tokens": getattr(usage, "output_tokens", 0) or 0,
+    }
+
+
+def report_usage(usage: dict) -> None:
+    """Print token usage to stderr and append it to today's log."""
+    print(
+        f"[usage] input={usage['input_tokens']} "
+        f"cache_read={usage['cache_read_input_tokens']} "
+        f"cache_write={usage['cache_creation_input_tokens']} "
+        f"output={usage['output_tokens']}",
+        file=sys.stderr,
+    )
+    try:
+        from config_loader import log_event
+        log_event("LLM Usage", [
+            f"Model: {MODEL}",
+            f"Input tokens: {usage['input_tokens']}",
+            f"Cache read tokens: {usage['cache_read_input_tokens']}",
+            f"Cache write tokens: {usage['cache_creation_input_tokens']}",
+            f"Output tokens: {usage['output_tokens']}",
+        ])
+    except Exception:
+        pass
 
-    client = Anthropic(api_key=api_key)
-    user_prompt = get_prompt_from_args(sys.argv)
-    skill_path = VAULT / "SKILL.md"
-    system_text = ""
-    if skill_path.exists():
-        try:
-            system_text = skill_path.read_text(encoding="utf-8")
-        except Exception:
-            system_text = ""
 
+def run_prompt(client, system_text: str, user_prompt: str) -> tuple[str, dict]:
+    """Send one prompt with the cached system prefix. Returns (text, usage)."""
     msg = client.messages.create(
-        model="claude-3-5-sonnet-latest",
-        max_tokens=1000,
-        system=system_text or "Follow the AI Employee Vault operating manual.",
+        model=MODEL,
+        max_tokens=MAX_TOKENS,
+        system=build_system_blocks(system_text),
         messages=[
             {"role": "user", "content": user_prompt}
         ],
     )
-    out = "".join([blk.text for blk in msg.content if getattr(blk, "type", "") == "text"])
+    text = "".join([blk.text for blk in msg.content if getattr(blk, "type", "") == "text"])
+    return text, usage_summary(msg)
+
+
+# ── Warm worker ───────────────────────────────────────────────────────────────
+
+class _PromptHandler(socketserver.StreamRequestHandler):
+    """One JSON request per line: {"prompt": "..."} -> {"ok": bool, "output"|"error": str, "usage": dict}."""
+
+    def handle(self):
+        for raw in self.rfile:
+            try:
+                request = json.loads(raw)
+                output, usage = run_prompt(self.server.client, load_system_prompt(), request["prompt"])
+                report_usage(usage)
+                response = {"ok": True, "output": output, "usage": usage}
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+class _WorkerServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def serve(host: str, port: int) -> None:
+    """Run the warm worker until interrupted."""
+    server = _WorkerServer((host, port), _PromptHandler)
+    server.client = create_client()
+    load_system_prompt()  # warm the file cache
+    print(f"Anthropic runner worker listening on {host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+class WorkerUnavailable(ConnectionError):
+    """The worker could not be reached. Nothing was sent, so another runner may take the prompt."""
+
+
+class WorkerRequestError(RuntimeError):
+    """The prompt reached the worker but no answer came back.
+
+    The worker may have acted on it, so callers must not re-run the prompt.
+    """
+
+
+def request_worker(prompt: str, timeout: float, host: str | None = None, port: int | None = None) -> str:
+    """Send a prompt to the warm worker and return its text output.
+
+    Raises WorkerUnavailable if the worker cannot be reached (before
+    anything is sent), WorkerRequestError if the connection fails or times
+    out after sending, and RuntimeError if the worker reports an API error.
+    """
+    if host is None or port is None:
+        host, port = get_worker_address()
+    try:
+        sock = socket.create_connection((host, port), timeout=timeout)
+    except OSError as e:
+        raise WorkerUnavailable(f"worker not reachable at {host}:{port}: {e}") from e
+    with sock:
+        try:
+            sock.sendall((json.dumps({"prompt": prompt}, ensure_ascii=False) + "\n").encode("utf-8"))
+            with sock.makefile("r", encoding="utf-8") as f:
+                line = f.readline()
+        except socket.timeout as e:
+            # The worker is still running the prompt: re-sending it would duplicate the work
+            raise WorkerRequestError(f"worker did not answer within {timeout:g}s: {e}") from e
+        except OSError as e:
+            raise WorkerRequestError(f"worker connection failed after the request was sent: {e}") from e
+    if not line:
+        raise WorkerRequestError("worker closed the connection without a response")
+    response = json.loads(line)
+    if not response.get("ok"):
+        raise RuntimeError(response.get("error", "worker error"))
+    return response.get("output", "")
+
+
+def main() -> None:
+    if "--serve" in sys.argv:
+        serve(*get_worker_address())
+        return
+
+    client = create_client()
+    out, usage = run_prompt(client, load_system_prompt(), get_prompt_from_args(sys.argv))
     print(out or "(no output)")
+    report_usage(usage)
 
 if __name__ == "__main__":
     main()
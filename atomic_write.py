@@ -0,0 +1,120 @@
+"""
+AI Employee Vault — Atomic File Writes (Silver Tier)
+Write-then-rename for every task file the vault produces.
+
+Content goes to a hidden temp file in the destination folder
+(".<name>.<random>.tmp"), is fsynced, and is then renamed over the final
+name with os.replace. Readers and watchdog observers therefore only ever see
+a missing file or a complete one: the final name appears through a single
+rename (an `on_moved` event), never as an empty file that is still being
+written. Watchers ignore the temp files because they start with ".".
+
+write_many_atomic() does the same for a batch, syncing once per chunk
+(os.sync) instead of once per file where the platform allows it.
+"""
+
+import os
+import secrets
+from pathlib import Path
+from typing import Iterable
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+BATCH_CHUNK = 500
+
+
+def _temp_path(path: Path) -> str:
+    # Plain string ops: building a Path per file costs more than the write on tmpfs
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.{secrets.token_hex(4)}.tmp")
+
+
+def _discard(tmp: str) -> None:
+    try:
+        os.unlink(tmp)
+    except FileNotFoundError:
+        pass
+
+
+def _write_temp(path: Path, data: bytes, fsync: bool) -> str:
+    tmp = _temp_path(path)
+    fd = os.open(tmp, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if fsync:
+            os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        _discard(tmp)
+        raise
+    os.close(fd)
+    return tmp
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist the rename itself (POSIX only; a no-op on Windows)."""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_text_atomic(path: Path, content: str | bytes, fsync: bool = True) -> Path:
+    """Atomically replace path with content (UTF-8 for str)."""
+    if not isinstance(path, Path):
+        path = Path(path)
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    tmp = _write_temp(path, data, fsync)
+    try:
+        os.replace(tmp, path)
+    except BaseException:
+        _discard(tmp)
+        raise
+    if fsync:
+        _fsync_dir(path.parent)
+    return path
+
+
+def write_many_atomic(items: Iterable[tuple[Path, str | bytes]], fsync: bool = True) -> list[Path]:
+    """Atomically write many files, renaming each chunk once it is on disk."""
+    written: list[Path] = []
+    chunk: list[tuple[Path, bytes]] = []
+    for path, content in items:
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        chunk.append((Path(path), data))
+        if len(chunk) >= BATCH_CHUNK:
+            written += _write_chunk(chunk, fsync)
+            chunk = []
+    if chunk:
+        written += _write_chunk(chunk, fsync)
+    return written
+
+
+def _write_chunk(chunk: list[tuple[Path, bytes]], fsync: bool) -> list[Path]:
+    # One os.sync for the whole chunk instead of an fsync per file
+    sync_all = fsync and len(chunk) > 1 and hasattr(os, "sync")
+    temps: list[tuple[str, Path]] = []
+    try:
+        for path, data in chunk:
+            temps.append((_write_temp(path, data, fsync and not sync_all), path))
+        if sync_all:
+            os.sync()
+        for tmp, path in temps:
+            os.replace(tmp, path)
+    except BaseException:
+        for tmp, _ in temps:
+            _discard(tmp)
+        raise
+    if fsync:
+        for directory in {path.parent for _, path in temps}:
+            _fsync_dir(directory)
+    return [path for _, path in temps]
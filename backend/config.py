@@ -23,6 +23,8 @@ class Settings(BaseSettings):
     GMAIL_POLL_INTERVAL_SECONDS: int = 120  # 2 minutes
     GMAIL_AUTO_REPLY_ENABLED: bool = False
     GMAIL_MAX_EMAILS_PER_POLL: int = 10
+    GMAIL_FETCH_CONCURRENCY: int = 10  # parallel messages.get requests per poll
+    GMAIL_USE_HISTORY: bool = True  # poll history deltas instead of re-searching is:unread
 
     # LinkedIn OAuth2
     LINKEDIN_CLIENT_ID: str = ""
@@ -80,6 +80,8 @@ async def lifespan(app: FastAPI):
                 await task
             except asyncio.CancelledError:
                 pass
+    from backend.services.http_client import close_clients
+    await close_clients()
     logger.info("Gold-tier backend shut down.")
 
 
@@ -3,9 +3,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.core.enums import TaskStatus
 from backend.database import get_db
 from backend.schemas import (
     ApprovalRequest,
+    TaskBulkCreate,
+    TaskBulkResponse,
     TaskCreate,
     TaskListResponse,
     TaskResponse,
@@ -22,6 +25,16 @@ async def create_task(data: TaskCreate, db: AsyncSession = Depends(get_db)):
     return task
 
 
+@router.post("/bulk", response_model=TaskBulkResponse, status_code=201)
+async def create_tasks_bulk(data: TaskBulkCreate, db: AsyncSession = Depends(get_db)):
+    tasks = await task_service.create_tasks_bulk(db, data.tasks)
+    return TaskBulkResponse(
+        ids=[t.id for t in tasks],
+        created=len(tasks),
+        awaiting_approval=sum(1 for t in tasks if t.status == TaskStatus.AWAITING_APPROVAL.value),
+    )
+
+
 @router.get("", response_model=TaskListResponse)
 async def list_tasks(
     status: str | None = None,
@@ -16,6 +16,16 @@ class TaskCreate(BaseModel):
     source: str = "api"
 
 
+class TaskBulkCreate(BaseModel):
+    tasks: list[TaskCreate] = Field(..., min_length=1, max_length=5000)
+
+
+class TaskBulkResponse(BaseModel):
+    ids: list[int]
+    created: int
+    awaiting_approval: int
+
+
 class TaskUpdate(BaseModel):
     title: str | None = None
     body: str | None = None
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.models.token import Token
 from backend.config import settings
+from backend.services.http_client import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,19 +24,19 @@ FACEBOOK_SCOPES = "pages_manage_posts,pages_read_engagement,instagram_basic,inst
 
 async def _http_with_retry(method: str, url: str, **kwargs) -> httpx.Response:
     """HTTP call with exponential backoff on transient errors."""
-    async with httpx.AsyncClient(timeout=30) as client:
-        for attempt in range(3):
-            try:
-                resp = await client.request(method, url, **kwargs)
-                if resp.status_code in (429, 502, 503, 504) and attempt < 2:
-                    await _sleep(2 ** attempt)
-                    continue
-                return resp
-            except (httpx.TimeoutException, httpx.ConnectError) as exc:
-                if attempt == 2:
-                    raise
-                logger.warning("HTTP %s %s attempt %d failed: %s", method, url, attempt + 1, exc)
+    client = get_client("facebook")
+    for attempt in range(3):
+        try:
+            resp = await client.request(method, url, **kwargs)
+            if resp.status_code in (429, 502, 503, 504) and attempt < 2:
                 await _sleep(2 ** attempt)
+                continue
+            return resp
+        except (httpx.TimeoutException, httpx.ConnectError) as exc:
+            if attempt == 2:
+                raise
+            logger.warning("HTTP %s %s attempt %d failed: %s", method, url, attempt + 1, exc)
+            await _sleep(2 ** attempt)
     raise RuntimeError("Max retries exceeded")
 
 
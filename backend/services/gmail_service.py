@@ -19,6 +19,8 @@ from backend.models.gmail_message import ProcessedGmailMessage
 from backend.models.gmail_token import GmailToken
 from backend.models.log import Log
 from backend.schemas import TaskCreate
+from backend.services.http_client import get_client
+from backend.services.processed_ids import find_processed, mark_processed_many
 
 logger = logging.getLogger(__name__)
 
@@ -63,15 +65,14 @@ async def _http_with_retry(
 
     for attempt in range(max_retries):
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.request(
-                    method,
-                    url,
-                    headers=headers,
-                    params=params,
-                    json=json_body,
-                    data=form_data,
-                )
+            resp = await get_client("gmail").request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                json=json_body,
+                data=form_data,
+            )
 
             # Retry on rate-limit or server errors (not on final attempt)
             if resp.status_code == 429 or resp.status_code >= 500:
@@ -116,11 +117,17 @@ async def _log(
     action: str,
     details: dict,
     task_id: int | None = None,
+    *,
+    flush: bool = True,
 ) -> None:
-    """Persist an activity log entry to the database."""
+    """Persist an activity log entry to the database.
+
+    Batch callers pass flush=False and flush once at the end of the batch.
+    """
     entry = Log(action=action, details=json.dumps(details), task_id=task_id)
     db.add(entry)
-    await db.flush()
+    if flush:
+        await db.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -247,37 +254,166 @@ async def get_valid_token(db: AsyncSession) -> tuple[str, GmailToken] | None:
 # Email operations (Gmail REST API)
 # ---------------------------------------------------------------------------
 
-async def fetch_unread_emails(access_token: str, max_results: int = 10) -> list[dict]:
-    """Fetch unread emails from Gmail. Returns list of parsed message dicts."""
-    messages: list[dict] = []
+# Response projection for format=full: only the fields _parse_message reads.
+_FULL_MESSAGE_FIELDS = "id,threadId,payload(mimeType,headers,body/data,parts)"
+# Headers-only fetches (format=metadata) ask for just these.
+_METADATA_HEADERS = ("Subject", "From", "Message-ID")
+
 
+async def list_unread_ids(access_token: str, max_results: int = 10) -> list[str]:
+    """IDs of unread messages, newest first."""
     list_resp = await _http_with_retry(
         "GET",
         f"{GMAIL_API_BASE}/messages",
         headers={"Authorization": f"Bearer {access_token}"},
-        params={"q": "is:unread", "maxResults": max_results},
+        params={"q": "is:unread", "maxResults": max_results, "fields": "messages/id"},
     )
     list_resp.raise_for_status()
-    msg_refs = list_resp.json().get("messages", [])
+    return [ref["id"] for ref in list_resp.json().get("messages", [])]
+
+
+class HistoryExpired(Exception):
+    """The stored historyId is too old for users.history.list (HTTP 404)."""
+
 
-    for msg_ref in msg_refs:
-        msg_resp = await _http_with_retry(
+async def get_profile_history_id(access_token: str) -> str:
+    """The mailbox's current historyId (users.getProfile)."""
+    resp = await _http_with_retry(
+        "GET",
+        f"{GMAIL_API_BASE}/profile",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"fields": "historyId"},
+    )
+    resp.raise_for_status()
+    return str(resp.json()["historyId"])
+
+
+async def list_history_ids(
+    access_token: str,
+    start_history_id: str,
+    max_results: int | None = None,
+) -> tuple[list[str], str]:
+    """IDs of unread messages added since start_history_id, plus the new historyId.
+
+    With max_results, stops before the history record that would exceed it
+    and returns that record's predecessor as the cursor, so the rest of the
+    delta is listed by the next poll. Raises HistoryExpired when Gmail no
+    longer has history that far back.
+    """
+    message_ids: list[str] = []
+    seen: set[str] = set()
+    history_id = start_history_id
+    last_record_id = start_history_id
+    page_token: str | None = None
+    while True:
+        params: dict = {"startHistoryId": start_history_id, "historyTypes": "messageAdded"}
+        if page_token:
+            params["pageToken"] = page_token
+        resp = await _http_with_retry(
             "GET",
-            f"{GMAIL_API_BASE}/messages/{msg_ref['id']}",
+            f"{GMAIL_API_BASE}/history",
             headers={"Authorization": f"Bearer {access_token}"},
-            params={"format": "full"},
+            params=params,
         )
+        if resp.status_code == 404:
+            raise HistoryExpired(start_history_id)
+        resp.raise_for_status()
+        data = resp.json()
+        history_id = str(data.get("historyId", history_id))
+        for record in data.get("history", []):
+            added_ids: list[str] = []
+            for added in record.get("messagesAdded", []):
+                msg = added.get("message", {})
+                labels = msg.get("labelIds", [])
+                # Same scope as the `is:unread` search: unread, not spam/trash
+                if "UNREAD" not in labels or "SPAM" in labels or "TRASH" in labels:
+                    continue
+                if msg.get("id") and msg["id"] not in seen and msg["id"] not in added_ids:
+                    added_ids.append(msg["id"])
+            if max_results and message_ids and len(message_ids) + len(added_ids) > max_results:
+                return message_ids, last_record_id
+            seen.update(added_ids)
+            message_ids.extend(added_ids)
+            last_record_id = str(record.get("id", last_record_id))
+        page_token = data.get("nextPageToken")
+        if not page_token:
+            return message_ids, history_id
+
+
+async def list_new_message_ids(
+    access_token: str,
+    token_row: GmailToken,
+    max_results: int = 10,
+) -> tuple[list[str], str]:
+    """Message IDs to process this poll, plus the historyId to store afterwards.
+
+    Uses the history delta since token_row.history_id; with no stored ID, or
+    one Gmail has expired, falls back to a full unread search and re-seeds.
+    """
+    if token_row.history_id:
+        try:
+            return await list_history_ids(access_token, token_row.history_id, max_results)
+        except HistoryExpired:
+            logger.info(
+                "Gmail historyId %s expired; falling back to a full unread search",
+                token_row.history_id,
+            )
+    # Read the cursor before listing so mail arriving in between is not skipped
+    history_id = await get_profile_history_id(access_token)
+    return await list_unread_ids(access_token, max_results), history_id
+
+
+async def fetch_messages(
+    access_token: str,
+    message_ids: list[str],
+    *,
+    headers_only: bool = False,
+    failed: list[str] | None = None,
+) -> list[dict]:
+    """Fetch and parse messages concurrently, preserving the order of message_ids.
+
+    At most settings.GMAIL_FETCH_CONCURRENCY requests are in flight at once,
+    all sharing the pooled Gmail client. With headers_only the body is skipped
+    (format=metadata) and the parsed dicts carry an empty "body". IDs whose
+    fetch failed (any error other than 404, message deleted) are appended to
+    failed, if given.
+    """
+    if headers_only:
+        params: dict = {
+            "format": "metadata",
+            "metadataHeaders": list(_METADATA_HEADERS),
+            "fields": "id,threadId,payload/headers",
+        }
+    else:
+        params = {"format": "full", "fields": _FULL_MESSAGE_FIELDS}
+    semaphore = asyncio.Semaphore(max(settings.GMAIL_FETCH_CONCURRENCY, 1))
+
+    async def fetch_one(msg_id: str) -> dict | None:
+        async with semaphore:
+            msg_resp = await _http_with_retry(
+                "GET",
+                f"{GMAIL_API_BASE}/messages/{msg_id}",
+                headers={"Authorization": f"Bearer {access_token}"},
+                params=params,
+            )
         if msg_resp.status_code != 200:
             logger.warning(
                 "Failed to fetch Gmail message %s: HTTP %d",
-                msg_ref["id"], msg_resp.status_code,
+                msg_id, msg_resp.status_code,
             )
-            continue
-        parsed = _parse_message(msg_resp.json())
-        if parsed:
-            messages.append(parsed)
+            if failed is not None and msg_resp.status_code != 404:
+                failed.append(msg_id)
+            return None
+        return _parse_message(msg_resp.json())
+
+    results = await asyncio.gather(*(fetch_one(msg_id) for msg_id in message_ids))
+    return [parsed for parsed in results if parsed]
+
 
-    return messages
+async def fetch_unread_emails(access_token: str, max_results: int = 10) -> list[dict]:
+    """Fetch unread emails from Gmail. Returns list of parsed message dicts."""
+    message_ids = await list_unread_ids(access_token, max_results)
+    return await fetch_messages(access_token, message_ids)
 
 
 def _parse_message(raw: dict) -> dict | None:
@@ -365,20 +501,25 @@ async def send_reply(access_token: str, original_msg: dict, reply_text: str) ->
 
 async def _is_duplicate(db: AsyncSession, gmail_id: str) -> bool:
     """Return True if this Gmail message ID has already been processed."""
-    result = await db.execute(
-        select(ProcessedGmailMessage).where(
-            ProcessedGmailMessage.gmail_message_id == gmail_id
-        )
-    )
-    return result.scalar_one_or_none() is not None
+    return bool(await _find_processed(db, [gmail_id]))
 
 
 async def _mark_processed(db: AsyncSession, gmail_id: str) -> None:
     """Record this Gmail message ID as processed to block future duplicates."""
-    db.add(ProcessedGmailMessage(gmail_message_id=gmail_id))
+    await _mark_processed_many(db, [gmail_id])
     await db.flush()
 
 
+async def _find_processed(db: AsyncSession, gmail_ids: list[str]) -> set[str]:
+    """The Gmail message IDs in gmail_ids that were already processed (one query)."""
+    return await find_processed(db, ProcessedGmailMessage.gmail_message_id, gmail_ids)
+
+
+async def _mark_processed_many(db: AsyncSession, gmail_ids: list[str]) -> None:
+    """Record a batch of processed Gmail message IDs in one INSERT."""
+    await mark_processed_many(db, ProcessedGmailMessage.gmail_message_id, gmail_ids)
+
+
 # ---------------------------------------------------------------------------
 # Main polling function
 # ---------------------------------------------------------------------------
@@ -396,17 +537,33 @@ async def poll_inbox(db: AsyncSession) -> dict:
         return result
 
     access_token, token_row = token_info
-    emails = await fetch_unread_emails(access_token, settings.GMAIL_MAX_EMAILS_PER_POLL)
+    next_history_id: str | None = None
+    if settings.GMAIL_USE_HISTORY:
+        message_ids, next_history_id = await list_new_message_ids(
+            access_token, token_row, settings.GMAIL_MAX_EMAILS_PER_POLL,
+        )
+    else:
+        message_ids = await list_unread_ids(access_token, settings.GMAIL_MAX_EMAILS_PER_POLL)
+
+    # ── Duplicate prevention: one query for the whole batch ─────────────────
+    already = await _find_processed(db, message_ids)
+    for gmail_id in message_ids:
+        if gmail_id in already:
+            logger.debug("Skipping already-processed Gmail message %s", gmail_id)
+            await mark_as_read(access_token, gmail_id)
+    failed: list[str] = []
+    emails = await fetch_messages(
+        access_token, [gmail_id for gmail_id in message_ids if gmail_id not in already],
+        failed=failed,
+    )
+    # Recorded as errors, so the history cursor stays put and they are retried
+    for gmail_id in failed:
+        result["errors"].append(f"Email {gmail_id}: could not be fetched")
 
+    processed_ids: list[str] = []
     for email in emails:
         gmail_id = email.get("id", "")
         try:
-            # ── Duplicate prevention ─────────────────────────────────────────
-            if await _is_duplicate(db, gmail_id):
-                logger.debug("Skipping already-processed Gmail message %s", gmail_id)
-                await mark_as_read(access_token, gmail_id)
-                continue
-
             # ── Create task ──────────────────────────────────────────────────
             task_data = TaskCreate(
                 title=f"[Gmail] {email['subject'][:450]}",
@@ -416,8 +573,8 @@ async def poll_inbox(db: AsyncSession) -> dict:
             task = await create_task(db, task_data)
             result["tasks_created"] += 1
 
-            # Record ID immediately so a crash mid-loop can't reprocess later
-            await _mark_processed(db, gmail_id)
+            # Recorded with the batch below, in the same transaction as the task
+            processed_ids.append(gmail_id)
 
             # ── Auto-reply ───────────────────────────────────────────────────
             should_reply = (
@@ -435,7 +592,7 @@ async def poll_inbox(db: AsyncSession) -> dict:
                         "to": email["sender"],
                         "task_id": task.id,
                         "reply_text": reply_text[:200],
-                    }, task.id)
+                    }, task.id, flush=False)
 
             await mark_as_read(access_token, gmail_id)
             result["processed"] += 1
@@ -447,7 +604,7 @@ async def poll_inbox(db: AsyncSession) -> dict:
                 "task_id": task.id,
                 "task_status": task.status,
                 "auto_replied": should_reply,
-            }, task.id)
+            }, task.id, flush=False)
 
         except Exception as e:
             logger.error(
@@ -456,6 +613,12 @@ async def poll_inbox(db: AsyncSession) -> dict:
             )
             result["errors"].append(f"Email {gmail_id}: {str(e)}")
 
+    await _mark_processed_many(db, processed_ids)
+
+    # Keep the old cursor after a failure so the next poll replays the delta;
+    # messages that did succeed are skipped by the duplicate check.
+    if next_history_id and not result["errors"]:
+        token_row.history_id = next_history_id
     token_row.last_polled_at = datetime.now(timezone.utc)
     await db.flush()
     return result
@@ -0,0 +1,62 @@
+"""Shared pooled HTTP clients — one keep-alive httpx.AsyncClient per provider.
+
+Creating an AsyncClient per request pays a fresh TCP + TLS handshake every
+time. get_client(provider) hands out one long-lived client per provider
+(gmail, linkedin, twitter, facebook) so concurrent requests to the same API
+share pooled connections. HTTP/2 is enabled when the optional `h2` package is
+installed (httpx[http2]); otherwise the pool falls back to HTTP/1.1 keep-alive.
+
+Clients are bound to the event loop that created them; a client requested
+from a different loop (e.g. a fresh loop per test) is replaced. close_clients()
+is awaited on application shutdown.
+"""
+
+import asyncio
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_TIMEOUT = 30.0
+POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+
+# provider -> (client, loop it was created on)
+_clients: dict[str, tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+
+
+def get_client(provider: str) -> httpx.AsyncClient:
+    """The pooled client for a provider, created on first use."""
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(provider)
+    if entry is not None:
+        client, client_loop = entry
+        if client_loop is loop and not client.is_closed:
+            return client
+    client = httpx.AsyncClient(
+        timeout=DEFAULT_TIMEOUT,
+        limits=POOL_LIMITS,
+        http2=HTTP2_AVAILABLE,
+    )
+    _clients[provider] = (client, loop)
+    return client
+
+
+async def close_clients() -> None:
+    """Close every pooled client (called from the app lifespan shutdown)."""
+    loop = asyncio.get_running_loop()
+    entries = list(_clients.values())
+    _clients.clear()
+    for client, client_loop in entries:
+        if client_loop is not loop or client.is_closed:
+            continue
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("Failed to close pooled HTTP client: %s", e)
@@ -15,6 +15,7 @@ from backend.database import async_session
 from backend.models.linkedin_post import ProcessedLinkedInPost
 from backend.models.log import Log
 from backend.models.token import Token
+from backend.services.http_client import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -47,15 +48,14 @@ async def _http_with_retry(
 
     for attempt in range(max_retries):
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.request(
-                    method,
-                    url,
-                    headers=headers,
-                    params=params,
-                    json=json_body,
-                    data=form_data,
-                )
+            resp = await get_client("linkedin").request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                json=json_body,
+                data=form_data,
+            )
 
             if resp.status_code == 429 or resp.status_code >= 500:
                 if attempt < max_retries - 1:
@@ -0,0 +1,58 @@
+"""Batch helpers for the processed-message tables (Gmail IDs, WhatsApp SIDs).
+
+A poll checks its whole batch with one SELECT ... WHERE <id> IN (...) and
+records the IDs it handled with one multi-row INSERT that ignores IDs
+already present, instead of a SELECT and an INSERT + flush per message.
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+# Stays well under SQLite's bound-parameter limit
+IN_CLAUSE_CHUNK = 500
+
+
+async def find_processed(
+    db: AsyncSession,
+    column: InstrumentedAttribute,
+    ids: Iterable[str],
+) -> set[str]:
+    """The subset of ids already recorded in column's table."""
+    unique = list(dict.fromkeys(i for i in ids if i))
+    found: set[str] = set()
+    for start in range(0, len(unique), IN_CLAUSE_CHUNK):
+        chunk = unique[start:start + IN_CLAUSE_CHUNK]
+        result = await db.execute(select(column).where(column.in_(chunk)))
+        found.update(result.scalars())
+    return found
+
+
+async def mark_processed_many(
+    db: AsyncSession,
+    column: InstrumentedAttribute,
+    ids: Iterable[str],
+) -> None:
+    """Record ids in column's table with multi-row INSERTs, skipping existing rows."""
+    rows = [{column.key: i} for i in dict.fromkeys(ids) if i]
+    if not rows:
+        return
+    table = column.class_.__table__
+    dialect = db.bind.dialect.name if db.bind is not None else ""
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(table).on_conflict_do_nothing()
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        stmt = dialect_insert(table).on_conflict_do_nothing()
+    else:
+        # No portable upsert: drop ids another writer already recorded
+        existing = await find_processed(db, column, [r[column.key] for r in rows])
+        rows = [r for r in rows if r[column.key] not in existing]
+        if not rows:
+            return
+        stmt = insert(table)
+    for start in range(0, len(rows), IN_CLAUSE_CHUNK):
+        await db.execute(stmt.values(rows[start:start + IN_CLAUSE_CHUNK]))
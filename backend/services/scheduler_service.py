@@ -19,13 +19,29 @@ logger = logging.getLogger(__name__)
 STATE_FILE = "scheduler_state.json"
 
 
+# (path, mtime_ns, size) -> parsed schedules; config.yaml is re-parsed only when it changes
+_schedule_cache: tuple[tuple, list[dict]] | None = None
+
+
 def _load_config() -> list[dict]:
+    global _schedule_cache
     config_path = Path(settings.VAULT_PATH) / "config.yaml"
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
         return []
-    with open(config_path) as f:
-        cfg = yaml.safe_load(f)
-    return cfg.get("scheduler", [])
+    key = (str(config_path), st.st_mtime_ns, st.st_size)
+    if _schedule_cache is not None and _schedule_cache[0] == key:
+        return _schedule_cache[1]
+    try:
+        with open(config_path) as f:
+            cfg = yaml.safe_load(f) or {}
+    except yaml.YAMLError as e:
+        logger.warning("config.yaml parse error — keeping previous schedules: %s", e)
+        return _schedule_cache[1] if _schedule_cache else []
+    schedules = cfg.get("scheduler", []) or []
+    _schedule_cache = (key, schedules)
+    return schedules
 
 
 def _load_state() -> dict:
@@ -19,15 +19,19 @@ from backend.models.approval import Approval
 from backend.models.log import Log
 from backend.models.sla import SLARecord
 from backend.schemas import TaskCreate, TaskUpdate
-from backend.services.sensitivity import score_sensitivity
+from backend.services.sensitivity import score_sensitivity, score_sensitivity_batch
+from keyword_match import PriorityDetector
+
+RESCORE_CHUNK_SIZE = 1000
+
+_PRIORITY_DETECTOR = PriorityDetector({kw: prio.value for kw, prio in PRIORITY_KEYWORDS.items()})
 
 
 def _detect_priority(text: str, explicit: str) -> str:
     """Auto-detect priority from text keywords if not explicitly set high."""
-    text_lower = text.lower()
-    for kw, prio in PRIORITY_KEYWORDS.items():
-        if kw in text_lower and prio.value < explicit:
-            return prio.value
+    detected = _PRIORITY_DETECTOR.detect(text)
+    if detected and detected < explicit:
+        return detected
     return explicit
 
 
@@ -35,20 +39,17 @@ async def _log(db: AsyncSession, action: str, details: dict, task_id: int | None
     db.add(Log(action=action, details=json.dumps(details, default=str), task_id=task_id))
 
 
-async def create_task(db: AsyncSession, data: TaskCreate) -> Task:
-    combined_text = f"{data.title} {data.body}"
-    sens = score_sensitivity(combined_text, threshold=settings.SENSITIVITY_THRESHOLD)
-
-    priority = _detect_priority(combined_text, data.priority.value)
-    sla_hours = SLA_HOURS.get(priority, 24)
-    sla_deadline = datetime.now(timezone.utc) + timedelta(hours=sla_hours)
+def _new_task(data: TaskCreate, sens: dict, now: datetime) -> Task:
+    """A Task row for data, routed by its sensitivity result (not yet added)."""
+    priority = _detect_priority(f"{data.title} {data.body}", data.priority.value)
+    sla_deadline = now + timedelta(hours=SLA_HOURS.get(priority, 24))
 
     if sens["requires_approval"]:
         status = TaskStatus.AWAITING_APPROVAL.value
     else:
         status = TaskStatus.IN_PROGRESS.value
 
-    task = Task(
+    return Task(
         title=data.title,
         body=data.body,
         priority=priority,
@@ -58,23 +59,52 @@ async def create_task(db: AsyncSession, data: TaskCreate) -> Task:
         sla_deadline=sla_deadline,
         source=data.source,
     )
+
+
+def _task_created_rows(task: Task, sens: dict) -> list:
+    """The SLA record and task_created log row that accompany a new task."""
+    return [
+        SLARecord(task_id=task.id, priority=task.priority, sla_deadline=task.sla_deadline),
+        Log(
+            action="task_created",
+            details=json.dumps({
+                "title": task.title,
+                "priority": task.priority,
+                "status": task.status,
+                "sensitivity": sens,
+            }, default=str),
+            task_id=task.id,
+        ),
+    ]
+
+
+async def create_task(db: AsyncSession, data: TaskCreate) -> Task:
+    sens = score_sensitivity(f"{data.title} {data.body}", threshold=settings.SENSITIVITY_THRESHOLD)
+    task = _new_task(data, sens, datetime.now(timezone.utc))
     db.add(task)
     await db.flush()
 
-    db.add(SLARecord(
-        task_id=task.id,
-        priority=priority,
-        sla_deadline=sla_deadline,
-    ))
+    db.add_all(_task_created_rows(task, sens))
+    return task
 
-    await _log(db, "task_created", {
-        "title": data.title,
-        "priority": priority,
-        "status": status,
-        "sensitivity": sens,
-    }, task.id)
 
-    return task
+async def create_tasks_bulk(db: AsyncSession, items: list[TaskCreate]) -> list[Task]:
+    """Create many tasks at once: one sensitivity pass over every item, one
+    flush for the task rows (a single multi-row INSERT), then the SLA and log
+    rows added together for the caller's commit. Tasks come back in input order.
+    """
+    if not items:
+        return []
+    results = score_sensitivity_batch(
+        [f"{d.title} {d.body}" for d in items], threshold=settings.SENSITIVITY_THRESHOLD
+    )
+    now = datetime.now(timezone.utc)
+    tasks = [_new_task(d, sens, now) for d, sens in zip(items, results)]
+    db.add_all(tasks)
+    await db.flush()
+
+    db.add_all([row for task, sens in zip(tasks, results) for row in _task_created_rows(task, sens)])
+    return tasks
 
 
 async def get_task(db: AsyncSession, task_id: int) -> Task | None:
@@ -198,3 +228,44 @@ async def complete_task(db: AsyncSession, task_id: int) -> Task | None:
     await db.flush()
     await db.refresh(task)
     return task
+
+
+async def rescore_tasks(db: AsyncSession, threshold: float | None = None) -> dict:
+    """Re-score every task's sensitivity (e.g. after the keyword weights or
+    threshold change), scoring each chunk of rows in one batch call.
+
+    Updates sensitivity_score/category only; statuses are left alone so
+    existing approvals are not reopened. Returns scan/update counts and how
+    many tasks would now require approval.
+    """
+    if threshold is None:
+        threshold = settings.SENSITIVITY_THRESHOLD
+    scanned = updated = flagged = 0
+    last_id = 0
+    while True:
+        q = (
+            select(Task)
+            .where(Task.id > last_id)
+            .order_by(Task.id)
+            .limit(RESCORE_CHUNK_SIZE)
+        )
+        tasks = list((await db.execute(q)).scalars().all())
+        if not tasks:
+            break
+        results = score_sensitivity_batch(
+            [f"{t.title} {t.body or ''}" for t in tasks], threshold=threshold
+        )
+        for task, sens in zip(tasks, results):
+            if (task.sensitivity_score, task.sensitivity_category) != (sens["score"], sens["category"]):
+                task.sensitivity_score = sens["score"]
+                task.sensitivity_category = sens["category"]
+                updated += 1
+            if sens["requires_approval"]:
+                flagged += 1
+        scanned += len(tasks)
+        last_id = tasks[-1].id
+        await db.flush()
+
+    summary = {"scanned": scanned, "updated": updated, "requires_approval": flagged, "threshold": threshold}
+    await _log(db, "tasks_rescored", summary)
+    return summary
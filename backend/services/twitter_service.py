@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.models.token import Token
 from backend.config import settings
+from backend.services.http_client import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,21 +24,21 @@ TWITTER_SCOPES = "tweet.read tweet.write users.read offline.access"
 
 async def _http_with_retry(method: str, url: str, **kwargs) -> httpx.Response:
     """HTTP call with exponential backoff on rate limits / transient errors."""
-    async with httpx.AsyncClient(timeout=30) as client:
-        for attempt in range(3):
-            try:
-                resp = await client.request(method, url, **kwargs)
-                if resp.status_code in (429, 502, 503, 504) and attempt < 2:
-                    retry_after = int(resp.headers.get("x-rate-limit-reset", "1"))
-                    wait = max(2 ** attempt, min(retry_after, 60))
-                    await _sleep(wait)
-                    continue
-                return resp
-            except (httpx.TimeoutException, httpx.ConnectError) as exc:
-                if attempt == 2:
-                    raise
-                logger.warning("HTTP %s %s attempt %d failed: %s", method, url, attempt + 1, exc)
-                await _sleep(2 ** attempt)
+    client = get_client("twitter")
+    for attempt in range(3):
+        try:
+            resp = await client.request(method, url, **kwargs)
+            if resp.status_code in (429, 502, 503, 504) and attempt < 2:
+                retry_after = int(resp.headers.get("x-rate-limit-reset", "1"))
+                wait = max(2 ** attempt, min(retry_after, 60))
+                await _sleep(wait)
+                continue
+            return resp
+        except (httpx.TimeoutException, httpx.ConnectError) as exc:
+            if attempt == 2:
+                raise
+            logger.warning("HTTP %s %s attempt %d failed: %s", method, url, attempt + 1, exc)
+            await _sleep(2 ** attempt)
     raise RuntimeError("Max retries exceeded")
 
 
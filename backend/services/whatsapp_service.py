@@ -15,6 +15,7 @@ from backend.core.enums import TaskStatus
 from backend.models.log import Log
 from backend.models.whatsapp_message import ProcessedWhatsappMessage
 from backend.schemas import TaskCreate
+from backend.services.processed_ids import find_processed, mark_processed_many
 
 logger = logging.getLogger(__name__)
 
@@ -60,17 +61,12 @@ async def _log(
 
 async def _is_duplicate(db: AsyncSession, message_sid: str) -> bool:
     """Return True if this Twilio SID has already been processed."""
-    result = await db.execute(
-        select(ProcessedWhatsappMessage).where(
-            ProcessedWhatsappMessage.message_sid == message_sid
-        )
-    )
-    return result.scalar_one_or_none() is not None
+    return bool(await find_processed(db, ProcessedWhatsappMessage.message_sid, [message_sid]))
 
 
 async def _mark_processed(db: AsyncSession, message_sid: str) -> None:
     """Record this Twilio SID as processed to block future duplicates."""
-    db.add(ProcessedWhatsappMessage(message_sid=message_sid))
+    await mark_processed_many(db, ProcessedWhatsappMessage.message_sid, [message_sid])
     await db.flush()
 
 
@@ -143,9 +139,15 @@ async def process_incoming_message(
     message_sid: str,
     sender: str,
     body: str,
+    *,
+    processed_batch: list[str] | None = None,
 ) -> dict:
     """Deduplicate, create task, optionally auto-reply, and log one inbound message.
 
+    With processed_batch the caller has already filtered duplicates for its
+    whole batch: the SID is appended to the list instead of being checked and
+    inserted here, and the caller records the batch in one INSERT.
+
     Returns a result dict with keys: processed, task_id, auto_replied, skipped_duplicate.
     """
     from backend.services.task_service import create_task
@@ -159,7 +161,7 @@ async def process_incoming_message(
     }
 
     # ── Duplicate prevention ─────────────────────────────────────────────────
-    if message_sid and await _is_duplicate(db, message_sid):
+    if processed_batch is None and message_sid and await _is_duplicate(db, message_sid):
         logger.debug("Skipping duplicate WhatsApp SID %s", message_sid)
         result["skipped_duplicate"] = True
         return result
@@ -175,7 +177,9 @@ async def process_incoming_message(
     result["task_id"] = task.id
 
     # Record SID immediately so a crash mid-flow can't reprocess later
-    if message_sid:
+    if processed_batch is not None:
+        processed_batch.append(message_sid)
+    elif message_sid:
         await _mark_processed(db, message_sid)
 
     await _log(db, "whatsapp_message_ingested", {
@@ -273,13 +277,20 @@ async def poll_inbox(db: AsyncSession) -> dict:
         key=lambda m: m.date_sent or datetime.min.replace(tzinfo=timezone.utc),
     )
 
+    # One query for the whole batch instead of one per message
+    already = await find_processed(
+        db, ProcessedWhatsappMessage.message_sid, [m.sid for m in inbound]
+    )
+    processed_sids: list[str] = []
+
     for msg in inbound:
+        if msg.sid in already:
+            continue
         try:
             result = await process_incoming_message(
-                db, msg.sid, msg.from_ or "", msg.body or ""
+                db, msg.sid, msg.from_ or "", msg.body or "",
+                processed_batch=processed_sids,
             )
-            if result["skipped_duplicate"]:
-                continue
             if result["processed"]:
                 summary["processed"] += 1
                 summary["tasks_created"] += 1
@@ -292,6 +303,9 @@ async def poll_inbox(db: AsyncSession) -> dict:
             )
             summary["errors"].append(f"SID {msg.sid}: processing error")
 
+    await mark_processed_many(db, ProcessedWhatsappMessage.message_sid, processed_sids)
+    await db.flush()
+
     _last_poll_at = poll_start
     return summary
 
@@ -210,3 +210,216 @@ async def test_weekly_report_counts_tasks(db_session, client):
 
     report = await generate_weekly_report(db_session)
     assert "awaiting approval: 1" in report.lower() or "awaiting_approval" in report.lower() or "1" in report
+
+
+# ── 9. Sensitivity matcher ──────────────────────────────────────────────────
+
+def test_sensitivity_context_pairs_match_whole_words_only():
+    """Context modifiers need whole words; keyword weights match substrings."""
+    from backend.services.sensitivity import score_sensitivity
+
+    whole = score_sensitivity("Email the client about the draft")
+    partial = score_sensitivity("Emails for clients about the drafts")
+
+    assert any(s.startswith("context(email+client)") for s in whole["signals"])
+    assert not any(s.startswith("context(") for s in partial["signals"])
+    assert "email (+0.6)" in partial["signals"]
+
+
+def test_sensitivity_batch_matches_single_scoring():
+    """score_sensitivity_batch returns the same dicts as per-text scoring, in order."""
+    from backend.services.sensitivity import score_sensitivity, score_sensitivity_batch
+
+    texts = [
+        "Send an invoice to the client for $500 payment",
+        "",
+        "Delete the temp draft",
+        "Emails for clients about the drafts",
+        "Reset password for admin account",
+    ]
+    assert score_sensitivity_batch(texts, threshold=0.5) == [
+        score_sensitivity(t, threshold=0.5) for t in texts
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rescore_tasks_updates_stale_scores(db_session, client):
+    """rescore_tasks recomputes sensitivity for existing rows."""
+    from backend.models.task import Task
+    from backend.services.task_service import rescore_tasks
+
+    resp = await client.post("/tasks", json={"title": "Reset password", "body": "admin access"})
+    task = await db_session.get(Task, resp.json()["id"])
+    expected = task.sensitivity_score
+    task.sensitivity_score = 0.0
+    task.sensitivity_category = "none"
+    await db_session.flush()
+
+    summary = await rescore_tasks(db_session)
+    assert summary["updated"] >= 1
+    assert task.sensitivity_score == expected
+
+
+@pytest.mark.asyncio
+async def test_gmail_fetch_messages_is_concurrent_and_ordered():
+    import asyncio
+    import httpx
+    from backend.services import gmail_service
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_request(method, url, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        msg_id = url.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={
+            "id": msg_id,
+            "threadId": "t",
+            "payload": {"headers": [{"name": "Subject", "value": f"s{msg_id}"}]},
+        })
+
+    ids = [str(i) for i in range(25)]
+    with patch.object(gmail_service, "_http_with_retry", side_effect=fake_request), \
+         patch.object(gmail_service.settings, "GMAIL_FETCH_CONCURRENCY", 5):
+        messages = await gmail_service.fetch_messages("token", ids)
+
+    assert [m["id"] for m in messages] == ids
+    assert messages[3]["subject"] == "s3"
+    assert peak == 5
+
+
+@pytest.mark.asyncio
+async def test_gmail_history_mode_uses_deltas_and_falls_back_when_expired():
+    import httpx
+    from backend.models.gmail_token import GmailToken
+    from backend.services import gmail_service
+
+    calls = []
+
+    async def fake_request(method, url, **kwargs):
+        endpoint = url.rsplit("/", 1)[-1]
+        calls.append(endpoint)
+        params = kwargs.get("params") or {}
+        request = httpx.Request(method, url)
+        if endpoint == "profile":
+            return httpx.Response(200, json={"historyId": "500"}, request=request)
+        if endpoint == "messages":
+            return httpx.Response(200, json={"messages": [{"id": "a"}, {"id": "b"}]}, request=request)
+        if params.get("startHistoryId") == "1":
+            return httpx.Response(404, json={}, request=request)
+        return httpx.Response(200, request=request, json={"historyId": "510", "history": [
+            {"messagesAdded": [{"message": {"id": "c", "labelIds": ["INBOX", "UNREAD"]}}]},
+            {"messagesAdded": [{"message": {"id": "d", "labelIds": ["SPAM", "UNREAD"]}}]},
+            {"messagesAdded": [{"message": {"id": "e", "labelIds": ["INBOX"]}}]},
+        ]})
+
+    with patch.object(gmail_service, "_http_with_retry", side_effect=fake_request):
+        ids, cursor = await gmail_service.list_new_message_ids("t", GmailToken(history_id="500"))
+        assert (ids, cursor) == (["c"], "510")
+        assert calls == ["history"]
+
+        calls.clear()
+        ids, cursor = await gmail_service.list_new_message_ids("t", GmailToken(history_id="1"))
+        assert (ids, cursor) == (["a", "b"], "500")
+        assert calls == ["history", "profile", "messages"]
+
+
+@pytest.mark.asyncio
+async def test_gmail_history_mode_caps_the_delta_and_keeps_failed_fetches(db_session):
+    import httpx
+    from backend.models.gmail_token import GmailToken
+    from backend.services import gmail_service
+
+    async def fake_request(method, url, **kwargs):
+        request = httpx.Request(method, url)
+        if url.endswith("/history"):
+            return httpx.Response(200, request=request, json={"historyId": "510", "history": [
+                {"id": "501", "messagesAdded": [{"message": {"id": "c", "labelIds": ["UNREAD"]}}]},
+                {"id": "502", "messagesAdded": [{"message": {"id": "d", "labelIds": ["UNREAD"]}}]},
+                {"id": "503", "messagesAdded": [{"message": {"id": "f", "labelIds": ["UNREAD"]}}]},
+            ]})
+        return httpx.Response(503, json={}, request=request)
+
+    with patch.object(gmail_service, "_http_with_retry", side_effect=fake_request):
+        # The rest of the delta is resumed from the last record taken
+        assert await gmail_service.list_history_ids("t", "500", max_results=2) == (["c", "d"], "502")
+
+        token_row = GmailToken(history_id="500")
+        with patch.object(gmail_service, "get_valid_token", return_value=("t", token_row)), \
+             patch.object(gmail_service.settings, "GMAIL_USE_HISTORY", True), \
+             patch.object(gmail_service.settings, "GMAIL_MAX_EMAILS_PER_POLL", 10):
+            result = await gmail_service.poll_inbox(db_session)
+
+    # A message that could not be fetched is an error and holds the cursor back
+    assert result["tasks_created"] == 0
+    assert len(result["errors"]) == 3
+    assert token_row.history_id == "500"
+
+
+@pytest.mark.asyncio
+async def test_processed_ids_batch_check_and_insert(db_session):
+    from backend.services.gmail_service import _find_processed, _mark_processed_many
+
+    await _mark_processed_many(db_session, ["m1", "m2"])
+    # Re-recording a known ID alongside new ones must not raise
+    await _mark_processed_many(db_session, ["m2", "m3", "m3"])
+    await db_session.flush()
+
+    assert await _find_processed(db_session, ["m1", "m3", "m4"]) == {"m1", "m3"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_task_creation_matches_single_create(client):
+    items = [
+        {"title": "Reset password for admin account", "body": "credential access change"},
+        {"title": "Update meeting notes", "body": "Just a simple note"},
+        {"title": "Urgent: server down", "body": ""},
+    ]
+    resp = await client.post("/tasks/bulk", json={"tasks": items})
+    assert resp.status_code == 201
+    data = resp.json()
+    assert data["created"] == 3
+    assert data["awaiting_approval"] == 1
+
+    for item, task_id in zip(items, data["ids"]):
+        bulk = (await client.get(f"/tasks/{task_id}")).json()
+        single = (await client.post("/tasks", json=item)).json()
+        for field in ("priority", "status", "sensitivity_score", "sensitivity_category"):
+            assert bulk[field] == single[field]
+
+
+# ── 10. Vault log sidecar ──────────────────────────────────────────────────
+
+def test_log_sidecar_picks_up_entries_appended_to_markdown(tmp_path):
+    """Entries appended to <day>.md without log_writer still reach readers, once."""
+    from datetime import datetime
+
+    from log_records import entry_header, read_day, tail_day
+    from log_writer import flush_logs, write_entry
+    from weekly_audit import summarize
+
+    day = datetime.now().strftime("%Y-%m-%d")
+    write_entry(tmp_path, "Task Processed", ["Task: first", "Priority: P2"])
+    flush_logs()
+    assert (tmp_path / f"{day}.jsonl").exists()
+
+    # The agent's own log step appends straight to the Markdown file
+    with (tmp_path / f"{day}.md").open("a", encoding="utf-8") as f:
+        f.write(f"## {datetime.now():%H:%M} - Approval Requested\n- Task: second\n")
+
+    records = read_day(tmp_path, day)
+    assert [r["event"] for r in records] == ["Task Processed", "Approval Requested"]
+    assert read_day(tmp_path, day) == records  # synced once, not duplicated
+    assert tail_day(tmp_path, day, 1)[0]["event"] == "Approval Requested"
+    summary = summarize([(entry_header(r), r["details"]) for r in records])
+    assert summary["approvals_requested"] == 1
+
+    write_entry(tmp_path, "Task Processed", ["Task: third"])
+    flush_logs()
+    assert [r["event"] for r in read_day(tmp_path, day)] == [
+        "Task Processed", "Approval Requested", "Task Processed",
+    ]
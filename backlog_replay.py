@@ -0,0 +1,272 @@
+"""
+AI Employee Vault — Inbox Backlog Replay (Silver Tier)
+Works through the files already sitting in an inbox at startup without
+holding up new arrivals.
+
+BacklogReplay streams the folder with os.scandir (no full listing or sort up
+front) into a small pool of `replay.concurrency` worker threads, with at
+most a few batches' worth of entries read ahead. Files that arrive while the
+replay is running are handed over with offer() and go to the front of the
+queue, so after a long downtime a fresh P0 message waits behind at most the
+files already being processed, not behind the whole backlog.
+
+Progress is checkpointed to Secrets/replay_<name>.json as {file name: mtime}
+every `replay.checkpoint_every` files (atomic write). After a crash
+mid-replay, or for channels that leave converted files in place, the next
+start skips files that were already handled and have not changed since.
+Callers record files they handle on their live path with record(), and
+close() writes the final checkpoint.
+"""
+
+import itertools
+import json
+import os
+import queue
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from atomic_write import write_text_atomic
+from config_loader import load_config, log_event
+
+VAULT_PATH = Path(__file__).parent.resolve()
+CHECKPOINT_DIR = VAULT_PATH / "Secrets"
+DEFAULT_CONCURRENCY = 4
+DEFAULT_CHECKPOINT_EVERY = 100
+
+_FRESH, _BACKLOG = 0, 1
+_STOP = (2, 0, None)
+
+
+def log(msg: str) -> None:
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] [Replay] {msg}")
+
+
+def replay_settings() -> tuple[int, int]:
+    """(concurrency, checkpoint_every) from config.yaml's replay section."""
+    cfg = load_config().get("replay", {}) or {}
+    return (
+        max(int(cfg.get("concurrency", DEFAULT_CONCURRENCY)), 1),
+        max(int(cfg.get("checkpoint_every", DEFAULT_CHECKPOINT_EVERY)), 1),
+    )
+
+
+def scan_inbox(directory: Path, suffixes: tuple[str, ...]):
+    """Yield the inbox files to replay, one os.DirEntry at a time."""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith((".", "~")) or not name.endswith(suffixes):
+                    continue
+                try:
+                    if entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+    except FileNotFoundError:
+        return
+
+
+class BacklogReplay:
+    """Replays one inbox folder through handle(path) with bounded concurrency."""
+
+    def __init__(
+        self,
+        name: str,
+        directory: Path,
+        handle: Callable[[Path], object],
+        suffixes: tuple[str, ...] = (".json",),
+        concurrency: int | None = None,
+        checkpoint: bool = True,
+        checkpoint_every: int | None = None,
+    ):
+        default_concurrency, default_every = replay_settings()
+        self.name = name
+        self.directory = Path(directory)
+        self.handle = handle
+        self.suffixes = suffixes
+        self.concurrency = max(concurrency or default_concurrency, 1)
+        self.checkpoint_every = checkpoint_every or default_every
+        self.checkpoint_path = CHECKPOINT_DIR / f"replay_{name}.json" if checkpoint else None
+        self.stats = {"replayed": 0, "skipped": 0, "fresh": 0, "errors": 0}
+
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._order = itertools.count()
+        # Read-ahead bound: the feeder stops scanning while this many files wait
+        self._slots = threading.BoundedSemaphore(self.concurrency * 4)
+        self._lock = threading.Lock()
+        self._done: dict[str, int] = self._load_checkpoint()
+        self._dirty = 0
+        self._pending: set[str] = set()  # queued or in progress, by file name
+        self._stopping = False  # set once the workers are gone: offer() refuses
+        self._finished = threading.Event()  # set once the final checkpoint is written
+        self._threads: list[threading.Thread] = []
+
+    # ── Checkpoint ────────────────────────────────────────────────────────────
+
+    def _load_checkpoint(self) -> dict[str, int]:
+        if self.checkpoint_path is None:
+            return {}
+        try:
+            data = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+            return {str(k): int(v) for k, v in data.items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            log(f"{self.name}: ignoring unreadable checkpoint ({e})")
+            return {}
+
+    def _save_checkpoint(self) -> None:
+        if self.checkpoint_path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = json.dumps(self._done, separators=(",", ":"))
+            self._dirty = 0
+        CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
+        write_text_atomic(self.checkpoint_path, snapshot, fsync=False)
+
+    def record(self, path: Path, mtime_ns: int | None = None) -> None:
+        """Mark path as handled so later replays skip it while it is unchanged."""
+        if self.checkpoint_path is None:
+            return
+        if mtime_ns is None:
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                return  # archived or claimed by the handler: nothing left to skip
+        with self._lock:
+            self._done[Path(path).name] = mtime_ns
+            self._dirty += 1
+            due = self._dirty >= self.checkpoint_every
+        if due:
+            self._save_checkpoint()
+
+    # ── Replay ────────────────────────────────────────────────────────────────
+
+    def start(self) -> "BacklogReplay":
+        """Begin replaying in the background; returns self."""
+        for i in range(self.concurrency):
+            t = threading.Thread(target=self._work, name=f"replay-{self.name}-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        feeder = threading.Thread(target=self._feed, name=f"replay-{self.name}", daemon=True)
+        feeder.start()
+        return self
+
+    def run(self) -> dict[str, int]:
+        """Replay the whole backlog, blocking until it is done."""
+        self.start()
+        self.wait()
+        return self.stats
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._finished.wait(timeout)
+
+    @property
+    def active(self) -> bool:
+        return bool(self._threads) and not self._stopping
+
+    def offer(self, path: Path) -> bool:
+        """Queue a newly arrived file ahead of the backlog.
+
+        False once the replay has finished: the caller handles it itself.
+        """
+        with self._lock:
+            if not self.active:
+                return False
+            path = Path(path)
+            if path.name not in self._pending:
+                self._pending.add(path.name)
+                self._queue.put((_FRESH, next(self._order), (path, None)))
+        return True
+
+    def _feed(self) -> None:
+        seen: set[str] = set()
+        queued = 0
+        try:
+            for entry in scan_inbox(self.directory, self.suffixes):
+                seen.add(entry.name)
+                try:
+                    mtime_ns = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                if self._done.get(entry.name) == mtime_ns:
+                    self.stats["skipped"] += 1
+                    continue
+                self._slots.acquire()
+                with self._lock:
+                    if entry.name in self._pending:  # already offered as a fresh file
+                        self._slots.release()
+                        continue
+                    self._pending.add(entry.name)
+                self._queue.put((_BACKLOG, next(self._order), (Path(entry.path), mtime_ns)))
+                queued += 1
+            if queued:
+                log(f"{self.name}: replaying {queued} file(s) from {self.directory}")
+        finally:
+            for _ in self._threads:
+                self._queue.put(_STOP)
+            for t in self._threads:
+                t.join()
+            with self._lock:
+                self._stopping = True
+            # Files offered while the workers were stopping
+            while not self._queue.empty():
+                kind, _, item = self._queue.get_nowait()
+                if item is not None:
+                    self._handle(kind, *item)
+            self._prune(seen)
+            self._save_checkpoint()
+            if queued or self.stats["fresh"]:
+                log(f"{self.name}: replay done — {self.stats}")
+                log_event("Backlog Replayed", [f"Inbox: {self.name}"] + [f"{k}: {v}" for k, v in self.stats.items()])
+            self._finished.set()
+
+    def _prune(self, seen: set[str]) -> None:
+        """Drop checkpoint entries for files that are no longer in the inbox."""
+        with self._lock:
+            gone = [name for name in self._done if name not in seen]
+            # Fresh files that arrived after the scan passed are still on disk
+            gone = [name for name in gone if not (self.directory / name).exists()]
+            for name in gone:
+                del self._done[name]
+            self._dirty += len(gone)
+
+    def _work(self) -> None:
+        # The stop marker sorts after every file, so workers drain the queue first
+        while True:
+            kind, _, item = self._queue.get()
+            if item is None:
+                return
+            self._handle(kind, *item)
+
+    def _handle(self, kind: int, path: Path, mtime_ns: int | None) -> None:
+        try:
+            if kind == _FRESH or os.path.exists(path):
+                if mtime_ns is None:
+                    try:
+                        mtime_ns = os.stat(path).st_mtime_ns
+                    except OSError:
+                        mtime_ns = None
+                self.handle(path)
+                with self._lock:
+                    self.stats["fresh" if kind == _FRESH else "replayed"] += 1
+                if mtime_ns is not None and os.path.exists(path):
+                    self.record(path, mtime_ns)
+        except Exception as e:
+            with self._lock:
+                self.stats["errors"] += 1
+            log(f"{self.name}: failed to replay {path.name}: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(path.name)
+            if kind == _BACKLOG:
+                self._slots.release()
+
+    def close(self) -> None:
+        """Write any checkpoint progress not yet saved."""
+        self._save_checkpoint()
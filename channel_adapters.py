@@ -0,0 +1,429 @@
+"""
+AI Employee Vault — Channel Adapter Registry (Silver Tier)
+One place that turns channel events into /Needs_Action task files.
+
+Each channel registers a ChannelAdapter declaring:
+  fields    — task field → event keys tried in order, plus a default
+  derive    — extra template values computed from the fields (URLs, slugs…)
+  filename  — template for the task file stem
+  template  — the task file body (str.format_map template, field names are
+              checked once at registration)
+
+Priority rules are the same for every channel: the event's own "priority"
+(P0–P3, or high/medium/low) or the channel's configured priority, raised to
+the most urgent keyword hit from priority_detector.get_detector(channel) over
+the adapter's priority_text fields.
+
+convert(path) handles one event file; convert_many(paths) parses a whole
+backlog (orjson when installed), renders every task and writes them in one
+pass — output folder created once, atomic write-then-rename with one sync
+per chunk (atomic_write.py), one summary line.
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+try:
+    import orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+except ImportError:
+    import json
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
+from atomic_write import write_many_atomic, write_text_atomic
+from config_loader import load_config
+from priority_detector import PRIORITY_LEVELS, get_detector
+
+VAULT_PATH = Path(__file__).parent.resolve()
+NEEDS_ACTION = VAULT_PATH / "Needs_Action"
+
+_PRIORITY_ALIASES = {"urgent": "P0", "high": "P1", "medium": "P2", "normal": "P2", "low": "P3"}
+_FIELD_NAME_RE = re.compile(r"(?<!\{)\{(\w+)\}")
+
+
+def slugify(text: str) -> str:
+    s = re.sub(r"[^a-zA-Z0-9]+", "-", text).strip("-").lower()
+    return s or "event"
+
+
+def normalize_priority(value, default: str = "P2") -> str:
+    """A P0–P3 level for an event's priority field (aliases mapped, junk → default)."""
+    prio = str(value or "").strip()
+    if prio.upper() in PRIORITY_LEVELS:
+        return prio.upper()
+    return _PRIORITY_ALIASES.get(prio.lower(), default)
+
+
+@dataclass
+class ChannelAdapter:
+    name: str
+    template: str
+    filename: str
+    fields: dict[str, tuple[tuple[str, ...], str]]
+    priority_text: tuple[str, ...] = ()
+    default_priority: str = "P2"
+    derive: Callable[[dict, Path | None], dict] | None = None
+    label: str = field(default="")
+    raw_text: bool = False  # accept non-JSON drops as the event text
+
+    def __post_init__(self):
+        self.label = self.label or self.name.capitalize()
+        self._base_cache: tuple[dict, str] | None = None  # (config snapshot, priority)
+        self._ready_dirs: set[Path] = set()
+
+    # ── Rendering ─────────────────────────────────────────────────────────────
+
+    def base_priority(self) -> str:
+        """The channel's configured priority (config.yaml channels.<name>.priority)."""
+        cfg = load_config()
+        cached = self._base_cache
+        if cached is not None and cached[0] is cfg:  # same snapshot until config.yaml changes
+            return cached[1]
+        channel_cfg = cfg.get("channels", {}).get(self.name, {})
+        priority = normalize_priority(channel_cfg.get("priority"), self.default_priority)
+        self._base_cache = (cfg, priority)
+        return priority
+
+    def values(
+        self,
+        data: dict,
+        source: Path | None = None,
+        now: datetime | None = None,
+        base_priority: str | None = None,
+    ) -> dict:
+        """Template values for one event: mapped fields, priority, derived values."""
+        now = now or datetime.now()
+        values = {"stem": source.stem if source else "", "now": now}
+        for name, (keys, default) in self.fields.items():
+            value = default
+            for key in keys:
+                if data.get(key) not in (None, ""):
+                    value = data[key]
+                    break
+            values[name] = str(value)
+
+        priority = normalize_priority(data.get("priority"), base_priority or self.base_priority())
+        if self.priority_text:
+            detected = get_detector(self.name).detect(" ".join(values[f] for f in self.priority_text))
+            if detected and detected < priority:
+                priority = detected
+        values["priority"] = priority
+
+        if self.derive:
+            values.update(self.derive(values, source))
+        return values
+
+    def render(
+        self,
+        data: dict,
+        source: Path | None = None,
+        now: datetime | None = None,
+        base_priority: str | None = None,
+    ) -> tuple[str, str]:
+        """(task file name, task file content) for one event."""
+        return self.render_values(self.values(data, source, now, base_priority))
+
+    def render_values(self, values: dict) -> tuple[str, str]:
+        """(task file name, task file content) from values() output."""
+        return self.filename.format_map(values) + ".md", self.template.format_map(values)
+
+    # ── Conversion ────────────────────────────────────────────────────────────
+
+    def convert(self, path: Path, out_dir: Path | None = None) -> Path | None:
+        """Convert one event file into a task file. None if it cannot be read.
+
+        The live path: one atomic write-then-rename, no fsync (readers only
+        need the rename to see a complete file) and no per-file mkdir.
+        """
+        out_dir = NEEDS_ACTION if out_dir is None else Path(out_dir)
+        if not isinstance(path, Path):
+            path = Path(path)
+        data = self._load(path)
+        if data is None:
+            return None
+        name, content = self.render(data, path, base_priority=self.base_priority())
+        if out_dir not in self._ready_dirs:
+            out_dir.mkdir(parents=True, exist_ok=True)
+            self._ready_dirs.add(out_dir)
+        try:
+            task = write_text_atomic(out_dir / name, content, fsync=False)
+        except FileNotFoundError:  # output folder removed since it was created
+            out_dir.mkdir(parents=True, exist_ok=True)
+            task = write_text_atomic(out_dir / name, content, fsync=False)
+        print(f"[{self.label}] Created task: {task.name}")
+        return task
+
+    def convert_many(self, paths, out_dir: Path | None = None, quiet: bool = False) -> list[Path]:
+        """Convert a batch of event files in one pass. Returns the task files written."""
+        out_dir = NEEDS_ACTION if out_dir is None else Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        now = datetime.now()
+        base_priority = self.base_priority()
+        rendered: list[tuple[Path, str]] = []
+        for path in paths:
+            if not isinstance(path, Path):
+                path = Path(path)
+            data = self._load(path)
+            if data is None:
+                continue
+            name, content = self.render(data, path, now, base_priority)
+            rendered.append((out_dir / name, content))
+        written = write_many_atomic(rendered)
+        if written and not quiet:
+            print(f"[{self.label}] Created {len(written)} task(s) in {out_dir}")
+        return written
+
+    def _load(self, path: Path) -> dict | None:
+        """The event in path, or None (reported) if it cannot be read or parsed."""
+        try:
+            raw = path.read_bytes()
+        except OSError as e:  # vanished or unreadable: skip it, not the batch
+            print(f"[{self.label}] Could not read {path.name}: {e}")
+            return None
+        try:
+            data = _loads(raw)
+            if not isinstance(data, dict):
+                raise ValueError("event is not a JSON object")
+            return data
+        except Exception as e:
+            if not self.raw_text:
+                print(f"[{self.label}] Could not parse {path.name}: {e}")
+                return None
+            # Generic channels accept plain-text drops as the message body
+            return {"text": raw.decode("utf-8", errors="replace")}
+
+
+# ── Registry ──────────────────────────────────────────────────────────────────
+
+ADAPTERS: dict[str, ChannelAdapter] = {}
+
+
+def register(adapter: ChannelAdapter) -> ChannelAdapter:
+    """Add an adapter, checking that both templates only use known values."""
+    known = set(adapter.fields) | {"stem", "now", "priority"}
+    if adapter.derive:
+        known |= set(adapter.derive({k: "" for k in known} | {"now": datetime.now()}, None))
+    for tmpl in (adapter.template, adapter.filename):
+        unknown = set(_FIELD_NAME_RE.findall(tmpl)) - known
+        if unknown:
+            raise ValueError(f"Adapter {adapter.name}: unknown template fields {sorted(unknown)}")
+    ADAPTERS[adapter.name] = adapter
+    return adapter
+
+
+def get_adapter(name: str) -> ChannelAdapter:
+    try:
+        return ADAPTERS[name]
+    except KeyError:
+        raise KeyError(f"No channel adapter registered for {name!r}") from None
+
+
+# ── Channel declarations ──────────────────────────────────────────────────────
+
+GENERIC_TEMPLATE = """---
+type: task
+priority: {priority}
+status: new
+created: {created}
+source: {source}
+sensitivity: external_communication
+---
+
+# Incoming {source} Message
+- From: {sender}
+- Subject: {subject}
+
+## Requested Action
+- Draft an appropriate reply and route for approval per handbook.
+"""
+
+
+def _derive_generic(values: dict, source: Path | None) -> dict:
+    now = values["now"]
+    return {
+        "source": values["source"] or (source.parent.name if source else "event"),
+        "created": now.strftime("%Y-%m-%d"),
+        "time": now.strftime("%H%M%S"),
+        "subject_slug": slugify(values["subject"])[:32],
+    }
+
+
+def _generic_adapter(name: str, label: str) -> ChannelAdapter:
+    # source defaults to the inbox folder name (e.g. "WhatsApp_Inbox"), as the
+    # original channel_event_to_task did, so task file names stay the same
+    return ChannelAdapter(
+        name=name,
+        label=label,
+        template=GENERIC_TEMPLATE,
+        filename="{source}-{subject_slug}-{time}",
+        fields={
+            "source": (("source",), ""),
+            "sender": (("from", "sender"), "unknown"),
+            "subject": (("subject", "text"), "New message"),
+        },
+        priority_text=("subject",),
+        derive=_derive_generic,
+        raw_text=True,
+    )
+
+
+FACEBOOK_TEMPLATE = """---
+type: social_event
+source: {platform}
+event_type: {event_type}
+from: {sender}
+page: {page}
+received: {timestamp}
+priority: {priority}
+status: pending
+---
+
+## {platform} {event_title} from {sender}
+
+**Page/Account:** {page}
+**Message:**
+> {message}
+
+## Suggested Actions
+- [ ] Review and respond to {event_type}
+- [ ] Draft a reply for approval (if external communication)
+- [ ] Log engagement metrics
+- [ ] Update social media activity report
+"""
+
+
+def _derive_facebook(values: dict, source: Path | None) -> dict:
+    return {
+        "timestamp": values["timestamp"] or datetime.now().isoformat(),
+        "platform": values["platform"].capitalize(),
+        "event_title": values["event_type"].replace("_", " ").title(),
+    }
+
+
+TWITTER_TEMPLATE = """---
+type: social_event
+source: Twitter/X
+event_type: {event_type}
+from: {sender}
+tweet_id: {tweet_id}
+received: {timestamp}
+priority: {priority}
+status: pending
+---
+
+## Twitter/X {event_title} from {sender}
+
+**Tweet URL:** {tweet_url}
+**Message:**
+> {message}
+
+## Suggested Actions
+- [ ] Review and craft a reply (max 280 chars)
+- [ ] Route reply for approval (external communication)
+- [ ] Like or retweet if appropriate
+- [ ] Log to social media engagement report
+"""
+
+
+def _derive_twitter(values: dict, source: Path | None) -> dict:
+    tweet_id = values["tweet_id"]
+    return {
+        "timestamp": values["timestamp"] or datetime.now().isoformat(),
+        "event_title": values["event_type"].replace("_", " ").title(),
+        "tweet_url": f"https://twitter.com/i/web/status/{tweet_id}" if tweet_id else "N/A",
+    }
+
+
+GMAIL_TEMPLATE = """---
+type: email
+source: gmail
+from: {sender}
+subject: "{subject}"
+received: {received}
+priority: {priority}
+status: pending
+---
+
+## Email from {sender}
+
+**Subject:** {subject}
+**Received:** {received}
+**Priority:** {priority}
+
+### Snippet
+{snippet}
+
+## Suggested Actions
+- [ ] Read full email and determine required action
+- [ ] Draft reply if needed → route through Pending_Approval if external
+- [ ] Log outcome in /Logs/{log_date}.md
+"""
+
+
+def _derive_gmail(values: dict, source: Path | None) -> dict:
+    now = values["now"]
+    return {
+        "received": values["received"] or now.isoformat(),
+        "safe_id": re.sub(r"\W+", "_", values["msg_id"])[:20],
+        "timestamp": now.strftime("%Y%m%d_%H%M%S"),
+        "log_date": now.strftime("%Y-%m-%d"),
+    }
+
+
+register(_generic_adapter("generic", "Channel Watcher"))
+register(_generic_adapter("whatsapp", "WhatsApp Watcher"))
+register(_generic_adapter("social_linkedin", "Social Watcher"))
+register(ChannelAdapter(
+    name="facebook",
+    label="Facebook Watcher",
+    template=FACEBOOK_TEMPLATE,
+    filename="FACEBOOK_{stem}",
+    fields={
+        "event_type": (("type",), "unknown"),
+        "sender": (("from",), "Unknown"),
+        "message": (("message",), ""),
+        "page": (("page",), ""),
+        "platform": (("platform",), "facebook"),
+        "timestamp": (("timestamp",), ""),
+    },
+    priority_text=("message",),
+    derive=_derive_facebook,
+))
+register(ChannelAdapter(
+    name="twitter",
+    label="Twitter Watcher",
+    template=TWITTER_TEMPLATE,
+    filename="TWITTER_{stem}",
+    fields={
+        "event_type": (("type",), "mention"),
+        "sender": (("from",), "Unknown"),
+        "message": (("message",), ""),
+        "tweet_id": (("tweet_id",), ""),
+        "timestamp": (("timestamp",), ""),
+    },
+    priority_text=("message",),
+    derive=_derive_twitter,
+))
+register(ChannelAdapter(
+    name="gmail",
+    label="GmailWatcher",
+    template=GMAIL_TEMPLATE,
+    filename="EMAIL_{safe_id}_{timestamp}",
+    fields={
+        "msg_id": (("id",), "unknown"),
+        "sender": (("from",), "unknown"),
+        "subject": (("subject",), "(No Subject)"),
+        "received": (("date", "received_at"), ""),
+        "snippet": (("snippet",), ""),
+    },
+    priority_text=("subject", "snippet"),
+    default_priority="P1",
+    derive=_derive_gmail,
+))
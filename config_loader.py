@@ -1,32 +1,132 @@
 """
 AI Employee Vault — Config Loader (Silver Tier)
 Shared configuration utility. All scripts read settings from config.yaml through this module.
+
+config.yaml is hot-reloadable: load_config() returns the current parsed
+snapshot and, at most once per CHECK_INTERVAL seconds, compares the file's
+mtime/size with the snapshot's. A changed file is re-parsed once it has been
+stable for one check (so a half-saved file is never picked up), validated,
+and swapped in atomically; an invalid edit is reported and the previous
+snapshot stays live. Modules that precompute from config register with
+subscribe() to be told about each new snapshot.
 """
 
+import threading
+import time
 import yaml
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from log_writer import write_entry
+
 VAULT_PATH = Path(__file__).parent.resolve()
 CONFIG_FILE = VAULT_PATH / "config.yaml"
+CHECK_INTERVAL = 1.0  # seconds between config.yaml mtime checks
+REQUIRED_SECTIONS = ("folders", "priority", "sensitivity")
+PRIORITY_LEVELS = ("P0", "P1", "P2", "P3")
 
 _config_cache: dict | None = None
+_config_stamp: tuple[int, int] | None = None   # (mtime_ns, size) of the live snapshot's file
+_pending_stamp: tuple[int, int] | None = None  # changed stamp waiting to settle
+_last_check = 0.0
+_config_lock = threading.RLock()
+_subscribers: list = []
 
 
 def load_config() -> dict:
-    """Load and cache config.yaml. Returns the full config dict."""
-    global _config_cache
-    if _config_cache is None:
-        with CONFIG_FILE.open("r", encoding="utf-8") as f:
-            _config_cache = yaml.safe_load(f)
+    """Return the current config.yaml snapshot (parsed once per file change)."""
+    if _config_cache is None or time.monotonic() - _last_check >= CHECK_INTERVAL:
+        _refresh()
     return _config_cache
 
 
 def reload_config() -> dict:
-    """Force-reload config.yaml (clears cache)."""
-    global _config_cache
-    _config_cache = None
-    return load_config()
+    """Force-reload config.yaml now, skipping the settle check."""
+    _refresh(force=True)
+    return _config_cache
+
+
+def subscribe(callback) -> None:
+    """Call callback(new_config, old_config) whenever a new snapshot goes live."""
+    with _config_lock:
+        if callback not in _subscribers:
+            _subscribers.append(callback)
+
+
+def unsubscribe(callback) -> None:
+    with _config_lock:
+        if callback in _subscribers:
+            _subscribers.remove(callback)
+
+
+def validate_config(cfg) -> list[str]:
+    """Problems that make a config unsafe to swap in (empty list if valid)."""
+    if not isinstance(cfg, dict):
+        return ["config.yaml must be a mapping"]
+    errors = [f"missing section '{s}'" for s in REQUIRED_SECTIONS if not isinstance(cfg.get(s), dict)]
+    sens = cfg.get("sensitivity")
+    if isinstance(sens, dict):
+        threshold = sens.get("threshold", 0.6)
+        if not isinstance(threshold, (int, float)) or not 0 <= threshold <= 1:
+            errors.append(f"sensitivity.threshold must be a number in 0..1, got {threshold!r}")
+        weights = sens.get("keywords_weighted", {})
+        if not isinstance(weights, dict) or not all(isinstance(w, (int, float)) for w in weights.values()):
+            errors.append("sensitivity.keywords_weighted must map keywords to numbers")
+    prio = cfg.get("priority")
+    if isinstance(prio, dict):
+        keywords = prio.get("keywords", {})
+        if not isinstance(keywords, dict) or not all(p in PRIORITY_LEVELS for p in keywords.values()):
+            errors.append(f"priority.keywords values must be one of {PRIORITY_LEVELS}")
+    return errors
+
+
+def _refresh(force: bool = False) -> None:
+    global _config_cache, _config_stamp, _pending_stamp, _last_check
+    with _config_lock:
+        _last_check = time.monotonic()
+        try:
+            st = CONFIG_FILE.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            if _config_cache is None:
+                raise
+            return  # mid-replace or deleted: keep serving the last snapshot
+        if _config_cache is not None and not force:
+            if stamp == _config_stamp:
+                return
+            if stamp != _pending_stamp:
+                _pending_stamp = stamp  # wait one more check for the write to finish
+                return
+
+        try:
+            with CONFIG_FILE.open("r", encoding="utf-8") as f:
+                new_cfg = yaml.safe_load(f)
+        except yaml.YAMLError as e:
+            if _config_cache is None:
+                raise
+            print(f"[config] config.yaml not reloaded (parse error), keeping previous config: {e}")
+            _config_stamp = stamp
+            return
+        errors = validate_config(new_cfg)
+        if errors:
+            if _config_cache is not None:
+                print(f"[config] config.yaml not reloaded, keeping previous config: {'; '.join(errors)}")
+                _config_stamp = stamp
+                return
+            for err in errors:
+                print(f"[config] WARNING: {err}")
+
+        old_cfg = _config_cache
+        _config_cache, _config_stamp, _pending_stamp = new_cfg, stamp, None
+        subscribers = list(_subscribers)
+
+    if old_cfg is not None:
+        print("[config] config.yaml reloaded")
+        for callback in subscribers:
+            try:
+                callback(new_cfg, old_cfg)
+            except Exception as e:
+                print(f"[config] subscriber {getattr(callback, '__name__', callback)} failed: {e}")
 
 
 def get_agent_role() -> str:
@@ -67,26 +167,17 @@ def get_sla_deadline(priority: str, start_time: datetime | None = None) -> datet
 
 def get_priority_from_keywords(text: str) -> str | None:
     """Scan text for priority keywords, return highest priority found or None."""
-    cfg = load_config()
-    keywords = cfg.get("priority", {}).get("keywords", {})
-    text_lower = text.lower()
-    best = None
-    for word, prio in keywords.items():
-        if word in text_lower:
-            if best is None or prio < best:
-                best = prio
-    return best
+    from priority_detector import get_detector
+    return get_detector().detect(text)
 
 
 def log_event(title: str, details: list[str] | None = None) -> None:
-    """Shared logging function — appends to /Logs/<date>.md."""
-    logs_dir = get_path("logs")
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    log_file = logs_dir / f"{datetime.now().strftime('%Y-%m-%d')}.md"
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(f"## {datetime.now().strftime('%H:%M')} - {title}\n")
-        for d in (details or []):
-            f.write(f"- {d}\n")
+    """Shared logging function — queues an entry for /Logs/<date>.md.
+
+    Entries go through the buffered log writer (log_writer.py) and reach
+    disk within logging.flush_interval_ms; call flush_logs() to force it.
+    """
+    write_entry(get_path("logs"), title, details)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+"""
+AI Employee Vault — Persistent Dedup Store (Silver Tier)
+"Have we already turned this message into a task?" — shared by the Gmail
+and WhatsApp watchers and kept across restarts.
+
+Keys are stored as 16-byte BLAKE2b digests in one SQLite table
+(Secrets/dedup.sqlite, WAL mode so several watcher processes can share it),
+one namespace per channel. Entries older than the namespace's TTL are
+treated as unseen and pruned, so the table stays bounded; a small in-memory
+LRU answers repeat lookups for hot keys without touching SQLite.
+
+DedupStore supports `key in store` and `store.add(key)`, so it drops in
+where a watcher used a plain set.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+VAULT_PATH = Path(__file__).parent.resolve()
+DEDUP_DB = VAULT_PATH / "Secrets" / "dedup.sqlite"
+DEFAULT_TTL_DAYS = 30
+DEFAULT_CACHE_SIZE = 10000
+PRUNE_EVERY = 500  # adds between TTL sweeps
+
+
+def _digest(key: str) -> bytes:
+    return hashlib.blake2b(str(key).encode("utf-8"), digest_size=16).digest()
+
+
+class DedupStore:
+    """Persistent set of seen keys for one namespace, with TTL eviction."""
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: float = DEFAULT_TTL_DAYS * 86400,
+        db_path: Path = DEDUP_DB,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.cache_size = cache_size
+        self._cache: OrderedDict[bytes, float] = OrderedDict()  # digest -> seen_at
+        self._adds_since_prune = 0
+        self._lock = threading.Lock()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            " namespace TEXT NOT NULL, digest BLOB NOT NULL, seen_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, digest)) WITHOUT ROWID"
+        )
+        self._conn.commit()
+        self.prune()
+
+    def __contains__(self, key: str) -> bool:
+        digest = _digest(key)
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            seen_at = self._cache.get(digest)
+            if seen_at is None:
+                row = self._conn.execute(
+                    "SELECT seen_at FROM seen WHERE namespace = ? AND digest = ?",
+                    (self.namespace, digest),
+                ).fetchone()
+                if row is None:
+                    return False
+                seen_at = row[0]
+                self._remember(digest, seen_at)
+            else:
+                self._cache.move_to_end(digest)
+            return seen_at >= cutoff
+
+    def add(self, key: str) -> None:
+        self.add_many([key])
+
+    def add_many(self, keys) -> None:
+        now = time.time()
+        rows = [(self.namespace, _digest(k), now) for k in keys]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO seen VALUES (?, ?, ?)", rows)
+            self._conn.commit()
+            for _, digest, seen_at in rows:
+                self._remember(digest, seen_at)
+            self._adds_since_prune += len(rows)
+            due = self._adds_since_prune >= PRUNE_EVERY
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        """Delete entries past the TTL. Returns the number removed."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM seen WHERE namespace = ? AND seen_at < ?", (self.namespace, cutoff)
+            )
+            self._conn.commit()
+            self._adds_since_prune = 0
+            return cur.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM seen WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _remember(self, digest: bytes, seen_at: float) -> None:
+        self._cache[digest] = seen_at
+        self._cache.move_to_end(digest)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+def open_store(channel: str) -> DedupStore:
+    """Dedup store for a channel, with its TTL from config.yaml `dedup.ttl_days`."""
+    from config_loader import load_config
+    ttl_days = load_config().get("dedup", {}).get("ttl_days", {}).get(channel, DEFAULT_TTL_DAYS)
+    return DedupStore(channel, ttl_seconds=float(ttl_days) * 86400)
@@ -26,6 +26,20 @@ module.exports = {
       error_file: "D:/AI_Employee_Vault/Logs/file_watcher_error.log",
       time: true,
     },
+    {
+      name: "llm-runner",
+      script: "anthropic_runner.py",
+      args: "--serve",
+      interpreter: "D:\\AI_Employee_Vault\\.venv\\Scripts\\pythonw.exe",
+      cwd: "D:/AI_Employee_Vault",
+      watch: false,
+      autorestart: true,
+      restart_delay: 5000,
+      max_restarts: 10,
+      log_file: "D:/AI_Employee_Vault/Logs/llm_runner.log",
+      error_file: "D:/AI_Employee_Vault/Logs/llm_runner_error.log",
+      time: true,
+    },
     {
       name: "odoo-mcp",
       script: "MCP/odoo_mcp.js",
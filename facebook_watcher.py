@@ -13,7 +13,6 @@ Drop a JSON file like this to simulate an incoming event:
 }
 """
 
-import json
 import time
 from pathlib import Path
 from datetime import datetime
@@ -21,6 +20,9 @@ from datetime import datetime
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+from backlog_replay import BacklogReplay
+from channel_adapters import get_adapter
+
 VAULT_PATH = Path(__file__).parent.resolve()
 INBOX = VAULT_PATH / "Channels" / "Facebook_Inbox"
 NEEDS_ACTION = VAULT_PATH / "Needs_Action"
@@ -28,78 +30,36 @@ NEEDS_ACTION = VAULT_PATH / "Needs_Action"
 
 def facebook_event_to_task(json_path: Path) -> Path | None:
     """Convert a Facebook/Instagram event JSON file into a /Needs_Action task."""
-    try:
-        data = json.loads(json_path.read_text(encoding="utf-8"))
-    except Exception as e:
-        print(f"[Facebook Watcher] Could not parse {json_path.name}: {e}")
-        return None
-
-    event_type = data.get("type", "unknown")
-    sender = data.get("from", "Unknown")
-    message = data.get("message", "")
-    page = data.get("page", "")
-    platform = data.get("platform", "facebook").capitalize()
-    timestamp = data.get("timestamp", datetime.now().isoformat())
-    priority = data.get("priority", "P2")
-
-    # Detect urgency keywords
-    body_lower = message.lower()
-    if any(kw in body_lower for kw in ("urgent", "critical", "asap", "help")):
-        priority = "P1"
-
-    task_name = f"FACEBOOK_{json_path.stem}"
-    task_path = NEEDS_ACTION / f"{task_name}.md"
-
-    content = f"""---
-type: social_event
-source: {platform}
-event_type: {event_type}
-from: {sender}
-page: {page}
-received: {timestamp}
-priority: {priority}
-status: pending
----
-
-## {platform} {event_type.replace('_', ' ').title()} from {sender}
-
-**Page/Account:** {page}
-**Message:**
-> {message}
-
-## Suggested Actions
-- [ ] Review and respond to {event_type}
-- [ ] Draft a reply for approval (if external communication)
-- [ ] Log engagement metrics
-- [ ] Update social media activity report
-"""
-    NEEDS_ACTION.mkdir(parents=True, exist_ok=True)
-    task_path.write_text(content, encoding="utf-8")
-    print(f"[Facebook Watcher] Created task: {task_path.name}")
-    return task_path
+    return get_adapter("facebook").convert(json_path)
 
 
 class FacebookInboxHandler(FileSystemEventHandler):
+    def __init__(self, replay: BacklogReplay):
+        self.replay = replay
+
     def on_created(self, event):
         if event.is_directory:
             return
         if not event.src_path.endswith(".json"):
             return
-        facebook_event_to_task(Path(event.src_path))
+        path = Path(event.src_path)
+        # While the startup backlog is replaying, new events jump its queue
+        if not self.replay.offer(path):
+            facebook_event_to_task(path)
+            self.replay.record(path)
 
 
 def main():
     INBOX.mkdir(parents=True, exist_ok=True)
     print(f"[{datetime.now().strftime('%H:%M:%S')}] Facebook/Instagram watcher online: {INBOX}")
 
-    # Process existing files
-    for json_file in INBOX.glob("*.json"):
-        facebook_event_to_task(json_file)
-
-    handler = FacebookInboxHandler()
+    # Existing files replay in the background; the observer is live meanwhile
+    replay = BacklogReplay("facebook", INBOX, facebook_event_to_task)
+    handler = FacebookInboxHandler(replay)
     observer = Observer()
     observer.schedule(handler, str(INBOX), recursive=False)
     observer.start()
+    replay.start()
 
     try:
         while True:
@@ -108,6 +68,7 @@ def main():
         observer.stop()
 
     observer.join()
+    replay.close()
     print("Facebook/Instagram watcher offline.")
 
 
@@ -0,0 +1,99 @@
+"""
+AI Employee Vault — Completed-File Events (Silver Tier)
+When a watched folder's new file is complete enough to read.
+
+Handlers pick files up on `on_moved` (atomic write-then-rename, see
+atomic_write.py) and, on inotify, `on_closed` (close-after-write for files
+written in place). A file moved in from a folder the observer does not watch
+reports neither: inotify only sends IN_MOVED_TO, which watchdog turns into a
+bare `on_created`. SettleTimers covers that case: on_created arms a timer
+that is pushed back by every `on_modified`, and if no close has arrived
+after SETTLE_SECONDS of quiet the file is dispatched anyway. A close that
+follows a timer dispatch of the same (unchanged) file is then dropped.
+
+Where the observer reports no close events (non-inotify platforms),
+handlers keep dispatching on on_created directly.
+"""
+
+import os
+import threading
+import time
+from typing import Callable
+
+from watchdog.observers import Observer
+
+# inotify (Linux) reports close-after-write; other observers do not
+CLOSE_EVENTS = Observer.__name__ == "InotifyObserver"
+SETTLE_SECONDS = 1.0
+_FIRED_TTL = 60.0  # how long a timer dispatch waits for a matching close
+
+
+def _mtime_ns(path: str) -> int | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    # An empty file is still being written: its close will dispatch it
+    return st.st_mtime_ns if st.st_size else None
+
+
+class SettleTimers:
+    """Dispatches created-only files once they have been quiet for a while."""
+
+    def __init__(self, dispatch: Callable[[str], object], delay: float = SETTLE_SECONDS):
+        self._dispatch = dispatch
+        self._delay = delay
+        self._due: dict[str, float] = {}
+        self._fired: dict[str, tuple[int, float]] = {}  # path -> (mtime_ns, when)
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def created(self, path: str) -> None:
+        """A file appeared without a close (yet): dispatch it if none follows."""
+        with self._cond:
+            self._due[path] = time.monotonic() + self._delay
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="settle-timers", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def modified(self, path: str) -> None:
+        """Still being written: push its timer back."""
+        with self._cond:
+            if path in self._due:
+                self._due[path] = time.monotonic() + self._delay
+
+    def settled(self, path: str) -> bool:
+        """The file closed or moved away: cancel its timer.
+
+        False if the timer already dispatched this version of the file, so
+        the caller should not dispatch it again.
+        """
+        with self._cond:
+            self._due.pop(path, None)
+            fired = self._fired.pop(path, None)
+        return fired is None or fired[0] != _mtime_ns(path)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                now = time.monotonic()
+                ready = [path for path, due in self._due.items() if due <= now]
+                for path in ready:
+                    del self._due[path]
+                if not ready:
+                    self._cond.wait(min(self._due.values()) - now if self._due else None)
+                    continue
+                for path, (_, when) in list(self._fired.items()):
+                    if now - when > _FIRED_TTL:
+                        del self._fired[path]
+            for path in ready:
+                mtime_ns = _mtime_ns(path)
+                if mtime_ns is None:
+                    continue  # gone, or empty and still open
+                with self._cond:
+                    self._fired[path] = (mtime_ns, time.monotonic())
+                try:
+                    self._dispatch(path)
+                except Exception as e:
+                    print(f"[SettleTimers] dispatch failed for {os.path.basename(path)}: {e}")
@@ -0,0 +1,163 @@
+"""
+AI Employee Vault — Frontmatter Index (Silver Tier)
+Shared, cached frontmatter parser for task Markdown files.
+
+Parsed metadata is keyed by (path, mtime, size): a file is only re-read when
+it changes. Entries are kept in an LRU and persisted to .frontmatter_index.json
+so a fresh process (dashboard, weekly audit) doesn't re-read all of /Done.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+VAULT_PATH = Path(__file__).parent.resolve()
+INDEX_FILE = VAULT_PATH / ".frontmatter_index.json"
+MAX_ENTRIES = 20000
+
+
+def parse_frontmatter(text: str) -> tuple[dict, str]:
+    """Split a Markdown document into (frontmatter dict, body)."""
+    if text.lstrip("\r\n").startswith("---"):
+        text = text.lstrip("\r\n")
+        parts = text.split("\n---", 1)
+        fm_block = parts[0].strip("-\n") if len(parts) > 1 else ""
+        body = parts[1] if len(parts) > 1 else text
+    else:
+        fm_block = ""
+        body = text
+    meta: dict[str, str] = {}
+    for line in fm_block.splitlines():
+        if ":" in line:
+            k, v = line.split(":", 1)
+            meta[k.strip()] = v.strip()
+    return meta, body
+
+
+class FrontmatterIndex:
+    """LRU cache of parsed frontmatter, validated against file mtime + size."""
+
+    def __init__(self, index_file: Path | None = INDEX_FILE, max_entries: int = MAX_ENTRIES):
+        self.index_file = index_file
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        if self.index_file is not None:
+            self._load()
+
+    def get(self, path: Path, stat: os.stat_result | None = None) -> dict:
+        """Return frontmatter for path, re-parsing only if the file changed.
+
+        The returned dict is shared with the cache — copy before mutating.
+        """
+        key = str(path)
+        try:
+            stat = stat or os.stat(key)
+        except OSError:
+            with self._lock:
+                if self._entries.pop(key, None) is not None:
+                    self._dirty = True
+            return {}
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                self._entries.move_to_end(key)
+                return cached[2]
+
+        try:
+            meta, _ = parse_frontmatter(Path(key).read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError):
+            return {}
+
+        with self._lock:
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, meta)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+        return meta
+
+    def scan(self, folder: Path, suffix: str | None = ".md") -> list[tuple[Path, dict]]:
+        """Frontmatter for every visible file in folder (non-recursive).
+
+        Uses os.scandir so each file costs one cached stat; files that have
+        disappeared from the folder are dropped from the index.
+        """
+        results: list[tuple[Path, dict]] = []
+        if not folder.exists():
+            return results
+        seen: set[str] = set()
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+                if suffix and not entry.name.endswith(suffix):
+                    continue
+                seen.add(entry.path)
+                results.append((Path(entry.path), self.get(Path(entry.path), entry.stat())))
+        prefix = str(folder) + os.sep
+        with self._lock:
+            stale = [k for k in self._entries
+                     if k.startswith(prefix) and os.sep not in k[len(prefix):] and k not in seen]
+            for k in stale:
+                del self._entries[k]
+            if stale:
+                self._dirty = True
+        return results
+
+    def save(self) -> None:
+        """Persist the index if it changed since the last load/save."""
+        if self.index_file is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {k: list(v) for k, v in self._entries.items()}
+            self._dirty = False
+        tmp = self.index_file.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(self.index_file)
+        except OSError:
+            pass
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        for key, value in list(data.items())[-self.max_entries:]:
+            try:
+                mtime_ns, size, meta = value
+                self._entries[key] = (int(mtime_ns), int(size), dict(meta))
+            except (TypeError, ValueError):
+                continue
+
+
+_index: FrontmatterIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> FrontmatterIndex:
+    """Process-wide shared index (loaded from disk on first use)."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = FrontmatterIndex()
+        return _index
+
+
+def get_frontmatter(path: Path) -> dict:
+    return get_index().get(path)
+
+
+def scan_frontmatter(folder: Path, suffix: str | None = ".md") -> list[tuple[Path, dict]]:
+    return get_index().scan(folder, suffix)
+
+
+def save_index() -> None:
+    get_index().save()
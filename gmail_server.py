@@ -8,6 +8,8 @@ from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 from datetime import datetime, timedelta
 
+from log_writer import write_entry
+
 VAULT = Path(__file__).parent.resolve()
 SECRETS = VAULT / "Secrets"
 SECRETS.mkdir(parents=True, exist_ok=True)
@@ -23,12 +25,7 @@ DONE = VAULT / "Done"
 LOGS = VAULT / "Logs"
 
 def write_log(title: str, details: list[str]) -> None:
-    LOGS.mkdir(parents=True, exist_ok=True)
-    f = LOGS / f"{datetime.now().strftime('%Y-%m-%d')}.md"
-    with f.open("a", encoding="utf-8") as fh:
-        fh.write(f"## {datetime.now().strftime('%H:%M')} - {title}\n")
-        for d in details:
-            fh.write(f"- {d}\n")
+    write_entry(LOGS, title, details)
 
 def json_response(handler: BaseHTTPRequestHandler, code: int, payload: dict):
     data = json.dumps(payload).encode("utf-8")
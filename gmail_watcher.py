@@ -6,6 +6,16 @@ Two modes (config-driven):
   "json"  — watches Channels/Gmail_Inbox/*.json dropped by an external agent (default)
   "imap"  — polls Gmail directly via IMAP4_SSL every check_interval seconds
 
+IMAP sync is UID-based and incremental: UIDVALIDITY and the last processed
+UID are persisted in Secrets/gmail_imap_sync.json, so only newer messages are
+searched after a restart. New messages are fetched in batched `UID FETCH`
+commands asking only for the header and the first bytes of the body
+(BODY.PEEK — messages are not marked as read). With `imap_idle: true` the
+watcher waits in IMAP IDLE between syncs and picks up new mail in seconds.
+
+In both modes every ingested email is recorded in the shared persistent
+dedup store (dedup_store.py), so no email becomes a task twice.
+
 IMAP setup (Secrets/.env):
   GMAIL_ADDRESS=you@gmail.com
   GMAIL_APP_PASSWORD=xxxx-xxxx-xxxx-xxxx   # 16-char Google App Password
@@ -21,10 +31,13 @@ JSON event format (for "json" mode):
 """
 
 import email
+import email.message
 import imaplib
 import json
 import os
 import re
+import select
+import time
 from datetime import datetime
 from email.header import decode_header
 from pathlib import Path
@@ -32,15 +45,23 @@ from pathlib import Path
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
+from atomic_write import write_text_atomic
+from backlog_replay import BacklogReplay
 from base_watcher import BaseWatcher
+from channel_adapters import get_adapter
 from config_loader import (
     get_path,
-    get_priority_from_keywords,
     load_config,
     log_event,
 )
+from dedup_store import open_store
 
 VAULT_PATH = Path(__file__).parent.resolve()
+IMAP_SYNC_FILE = VAULT_PATH / "Secrets" / "gmail_imap_sync.json"
+IMAP_FETCH_BATCH = 50        # UIDs per UID FETCH command
+IMAP_BODY_BYTES = 8192       # body prefix fetched per message (snippet source)
+IMAP_IDLE_MAX_SECONDS = 29 * 60  # servers drop IDLE after ~30 minutes
+IMAP_MAX_ATTEMPTS = 5        # polls a failing message is retried before it is skipped
 
 
 # ── JSON inbox mode ────────────────────────────────────────────────────────────
@@ -54,25 +75,7 @@ class _JsonInboxHandler(FileSystemEventHandler):
     def on_created(self, event):
         if event.is_directory or not event.src_path.endswith(".json"):
             return
-        path = Path(event.src_path)
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            event_dict = {
-                "id": data.get("id", path.stem),
-                "from": data.get("from", "unknown"),
-                "subject": data.get("subject", "(No Subject)"),
-                "date": data.get("received_at", datetime.now().isoformat()),
-                "snippet": data.get("snippet", ""),
-                "_source_file": path,
-            }
-            self.watcher.process_event(event_dict)
-            # Archive processed file so it isn't re-read after restart
-            done_dir = path.parent / "processed"
-            done_dir.mkdir(exist_ok=True)
-            path.rename(done_dir / path.name)
-        except Exception as e:
-            self.watcher.log(f"JSON inbox error ({path.name}): {e}")
-            log_event("GmailWatcher JSON Error", [f"File: {path.name}", f"Error: {e}"])
+        self.watcher.on_inbox_file(Path(event.src_path))
 
 
 # ── Main watcher class ─────────────────────────────────────────────────────────
@@ -91,13 +94,24 @@ class GmailWatcher(BaseWatcher):
         self.imap_query: str = gmail_cfg.get("imap_query", "is:unread is:important")
         self.default_priority: str = gmail_cfg.get("priority", "P1")
         self.inbox_dir = VAULT_PATH / gmail_cfg.get("watch_folder", "Channels/Gmail_Inbox")
+        self.imap_idle: bool = bool(gmail_cfg.get("imap_idle", False))
+        self.idle_timeout: int = min(int(gmail_cfg.get("imap_idle_timeout", 300)), IMAP_IDLE_MAX_SECONDS)
+        if self.mode == "imap" and self.imap_idle:
+            self.check_interval = 1  # IDLE itself paces the loop
 
-        # IMAP state
+        # IMAP state (UID sync is persisted across restarts)
         self.imap: imaplib.IMAP4_SSL | None = None
-        self.processed_ids: set[str] = set()
+        self.sync_state: dict = _load_sync_state()
+        self._sync_uids: list[int] = []       # this sync's UIDs not yet behind last_uid
+        self._done_uids: set[int] = set()     # processed, waiting on an earlier UID
+        self._uid_attempts: dict[int, int] = {}
+
+        # Emails already turned into tasks (both modes, persisted)
+        self.seen = open_store("gmail")
 
         # JSON mode state
         self._observer: Observer | None = None
+        self._replay: BacklogReplay | None = None
 
     # ── Lifecycle ─────────────────────────────────────────────────────────────
 
@@ -121,6 +135,8 @@ class GmailWatcher(BaseWatcher):
             except Exception:
                 pass
             self._observer = None
+        if self._replay:
+            self._replay.close()
 
     def before_loop(self) -> None:
         if self.mode == "json":
@@ -132,12 +148,8 @@ class GmailWatcher(BaseWatcher):
             self._observer.start()
             self.log(f"Watchdog observer started on {self.inbox_dir}")
 
-            # Process any pre-existing JSON files
-            existing = list(self.inbox_dir.glob("*.json"))
-            if existing:
-                self.log(f"Processing {len(existing)} existing JSON file(s) ...")
-                for f in existing:
-                    handler.on_created(type("E", (), {"is_directory": False, "src_path": str(f)})())
+            # Replay pre-existing JSON files in the background; new arrivals go first
+            self._replay = BacklogReplay("gmail", self.inbox_dir, self.ingest_json_file).start()
 
     # ── Core interface ────────────────────────────────────────────────────────
 
@@ -156,43 +168,21 @@ class GmailWatcher(BaseWatcher):
 
         sender = event.get("from", "unknown")
         subject = event.get("subject", "(No Subject)")
-        received = event.get("date", datetime.now().isoformat())
-        snippet = event.get("snippet", "")
         msg_id = event.get("id", "unknown")
 
-        priority = get_priority_from_keywords(f"{subject} {snippet}") or self.default_priority
-
-        safe_id = re.sub(r"\W+", "_", str(msg_id))[:20]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filepath = self.needs_action / f"EMAIL_{safe_id}_{timestamp}.md"
-
-        filepath.write_text(
-            f"""---
-type: email
-source: gmail
-from: {sender}
-subject: "{subject}"
-received: {received}
-priority: {priority}
-status: pending
----
-
-## Email from {sender}
-
-**Subject:** {subject}
-**Received:** {received}
-**Priority:** {priority}
-
-### Snippet
-{snippet}
-
-## Suggested Actions
-- [ ] Read full email and determine required action
-- [ ] Draft reply if needed → route through Pending_Approval if external
-- [ ] Log outcome in /Logs/{datetime.now().strftime('%Y-%m-%d')}.md
-""",
-            encoding="utf-8",
-        )
+        dedup_key = event.get("dedup_key") or f"json:{msg_id}"
+        if dedup_key in self.seen:
+            self.log(f"Skipping already-ingested email {msg_id}")
+            if "_uid" in event:
+                self._commit_uid(event["_uid"])
+            return
+
+        adapter = get_adapter("gmail")
+        values = adapter.values(event)
+        priority = values["priority"]
+        name, content = adapter.render_values(values)
+        filepath = self.needs_action / name
+        write_text_atomic(filepath, content)
         self.log(f"Task created: {filepath.name}")
         log_event("GmailWatcher Task Created", [
             f"From: {sender}",
@@ -200,6 +190,35 @@ status: pending
             f"Priority: {priority}",
             f"File: {filepath.name}",
         ])
+        self.seen.add(dedup_key)
+        if "_uid" in event:
+            self._commit_uid(event["_uid"])
+
+    def on_inbox_file(self, path: Path) -> None:
+        """JSON mode: a new inbox file, queued ahead of any startup backlog."""
+        if self._replay is None or not self._replay.offer(path):
+            self.ingest_json_file(path)
+
+    def ingest_json_file(self, path: Path) -> None:
+        """JSON mode: turn one inbox file into a task, then archive it to processed/."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            event_dict = {
+                "id": data.get("id", path.stem),
+                "from": data.get("from", "unknown"),
+                "subject": data.get("subject", "(No Subject)"),
+                "date": data.get("received_at", datetime.now().isoformat()),
+                "snippet": data.get("snippet", ""),
+                "_source_file": path,
+            }
+            self.process_event(event_dict)
+            # Archive processed file so it isn't re-read after restart
+            done_dir = path.parent / "processed"
+            done_dir.mkdir(exist_ok=True)
+            path.rename(done_dir / path.name)
+        except Exception as e:
+            self.log(f"JSON inbox error ({path.name}): {e}")
+            log_event("GmailWatcher JSON Error", [f"File: {path.name}", f"Error: {e}"])
 
     # ── IMAP internals ────────────────────────────────────────────────────────
 
@@ -232,45 +251,178 @@ status: pending
 
     def _fetch_imap_events(self) -> list[dict]:
         self._ensure_imap()
-        events = []
+        events = self._sync_new_messages()
+        if not events and self.imap_idle and self._idle_wait(self.idle_timeout):
+            events = self._sync_new_messages()
+        return events
+
+    def _sync_new_messages(self) -> list[dict]:
+        """Search and fetch messages newer than the last processed UID."""
         try:
-            self.imap.select("INBOX")
+            self.imap.select("INBOX", readonly=True)
+            _, validity = self.imap.response("UIDVALIDITY")
+            uidvalidity = validity[0].decode() if validity and validity[0] else ""
+            if uidvalidity != self.sync_state.get("uidvalidity"):
+                if self.sync_state.get("uidvalidity"):
+                    self.log("IMAP UIDVALIDITY changed — resyncing from scratch")
+                self.sync_state = {"uidvalidity": uidvalidity, "last_uid": 0}
+                _save_sync_state(self.sync_state)
+
+            last_uid = int(self.sync_state.get("last_uid", 0))
             # X-GM-RAW lets us use native Gmail search queries
-            _, raw_ids = self.imap.search(None, f'X-GM-RAW "{self.imap_query}"')
+            _, raw_ids = self.imap.uid("SEARCH", None, f"UID {last_uid + 1}:*", f'X-GM-RAW "{self.imap_query}"')
         except imaplib.IMAP4.error as e:
             self.log(f"IMAP search failed: {e}")
             raise
 
-        new_ids = [
-            mid.decode()
-            for mid in raw_ids[0].split()
-            if mid.decode() not in self.processed_ids
-        ]
-        if new_ids:
-            self.log(f"Found {len(new_ids)} new email(s).")
+        # "n:*" always matches the newest message, even when its UID is < n
+        uids = sorted(u for u in (int(x) for x in raw_ids[0].split()) if u > last_uid)
+        self._sync_uids = list(uids)
+        self._done_uids = set()
+        if not uids:
+            return []
+        self.log(f"Found {len(uids)} new email(s).")
+
+        # A message that keeps failing must not pin last_uid forever
+        self._uid_attempts = {uid: self._uid_attempts.get(uid, 0) + 1 for uid in uids}
+        for uid in uids:
+            if self._uid_attempts[uid] > IMAP_MAX_ATTEMPTS:
+                self.log(f"Giving up on email UID {uid} after {IMAP_MAX_ATTEMPTS} attempts")
+                log_event("GmailWatcher Email Skipped", [f"UID: {uid}", f"Attempts: {IMAP_MAX_ATTEMPTS}"])
+                self._commit_uid(uid)
+        uids = [u for u in uids if u not in self._done_uids and u > int(self.sync_state.get("last_uid", 0))]
 
-        for msg_id in new_ids:
+        events = []
+        for i in range(0, len(uids), IMAP_FETCH_BATCH):
+            chunk = uids[i:i + IMAP_FETCH_BATCH]
             try:
-                _, data = self.imap.fetch(msg_id, "(RFC822)")
-                if not data or not data[0]:
+                _, data = self.imap.uid(
+                    "FETCH",
+                    ",".join(map(str, chunk)),
+                    f"(UID BODY.PEEK[HEADER] BODY.PEEK[TEXT]<0.{IMAP_BODY_BYTES}>)",
+                )
+            except imaplib.IMAP4.error as e:
+                self.log(f"Error fetching emails {chunk[0]}..{chunk[-1]}: {e}")
+                continue
+            parts = _parse_fetch_response(data)
+            for uid in chunk:
+                sections = parts.get(uid)
+                if not sections:
                     continue
-                msg = email.message_from_bytes(data[0][1])
-                events.append({
-                    "id": msg_id,
-                    "from": _decode_header_str(msg.get("From", "")),
-                    "subject": _decode_header_str(msg.get("Subject", "")),
-                    "date": msg.get("Date", ""),
-                    "snippet": _extract_snippet(msg),
-                })
-                self.processed_ids.add(msg_id)
-            except Exception as e:
-                self.log(f"Error fetching email {msg_id}: {e}")
-
+                try:
+                    msg = email.message_from_bytes(sections.get("HEADER", b"") + sections.get("TEXT", b""))
+                    message_id = msg.get("Message-ID", "").strip()
+                    events.append({
+                        "id": str(uid),
+                        "message_id": message_id,
+                        "dedup_key": message_id or f"imap:{self.sync_state['uidvalidity']}:{uid}",
+                        "from": _decode_header_str(msg.get("From", "")),
+                        "subject": _decode_header_str(msg.get("Subject", "")),
+                        "date": msg.get("Date", ""),
+                        "snippet": _extract_snippet(msg),
+                        "_uid": uid,
+                    })
+                except Exception as e:
+                    self.log(f"Error parsing email {uid}: {e}")
         return events
 
+    def _commit_uid(self, uid: int) -> None:
+        """Mark a UID processed; last_uid (persisted) advances only past an
+        unbroken run of processed UIDs, so one that failed is fetched again."""
+        self._done_uids.add(uid)
+        self._uid_attempts.pop(uid, None)
+        last_uid = int(self.sync_state.get("last_uid", 0))
+        advanced = last_uid
+        while self._sync_uids and self._sync_uids[0] in self._done_uids:
+            advanced = self._sync_uids.pop(0)
+        if advanced > last_uid:
+            self.sync_state["last_uid"] = advanced
+            _save_sync_state(self.sync_state)
+
+    def _idle_wait(self, timeout: float) -> bool:
+        """Wait in IMAP IDLE until the server reports new mail or timeout.
+
+        imaplib has no IDLE command before Python 3.14, so this speaks the
+        protocol directly on the open connection. Returns True on new mail.
+        """
+        if "IDLE" not in self.imap.capabilities:
+            time.sleep(timeout)
+            return True
+        tag = self.imap._new_tag()
+        self.imap.send(tag + b" IDLE\r\n")
+        if not self.imap.readline().startswith(b"+"):
+            raise imaplib.IMAP4.abort("server refused IDLE")
+
+        sock = self.imap.sock
+        deadline = time.monotonic() + timeout
+        activity = False
+        while not activity:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            pending = sock.pending() if hasattr(sock, "pending") else 0
+            if not pending and not select.select([sock], [], [], remaining)[0]:
+                break
+            line = self.imap.readline()
+            if not line:
+                raise imaplib.IMAP4.abort("connection closed during IDLE")
+            activity = b"EXISTS" in line
+
+        self.imap.send(b"DONE\r\n")
+        while True:
+            line = self.imap.readline()
+            if not line:
+                raise imaplib.IMAP4.abort("connection closed ending IDLE")
+            if line.startswith(tag):
+                break
+        return activity
+
 
 # ── Standalone helpers ─────────────────────────────────────────────────────────
 
+def _load_sync_state() -> dict:
+    try:
+        return json.loads(IMAP_SYNC_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_sync_state(state: dict) -> None:
+    IMAP_SYNC_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = IMAP_SYNC_FILE.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state), encoding="utf-8")
+    tmp.replace(IMAP_SYNC_FILE)
+
+
+def _parse_fetch_response(data: list) -> dict[int, dict[str, bytes]]:
+    """Group a UID FETCH response into {uid: {"HEADER": bytes, "TEXT": bytes}}.
+
+    imaplib returns (prefix, literal) tuples per section plus plain bytes
+    for the closing ")"; the UID item may appear in either.
+    """
+    messages: dict[int, dict[str, bytes]] = {}
+    sections: dict[str, bytes] = {}
+    uid: int | None = None
+    for item in data:
+        if isinstance(item, tuple):
+            meta, payload = item
+            if re.match(rb"\d+ \(", meta):  # first section of the next message
+                if uid is not None:
+                    messages[uid] = sections
+                sections, uid = {}, None
+            section = re.search(rb"BODY\[(HEADER|TEXT)\]", meta)
+            if section:
+                sections[section.group(1).decode()] = payload
+        else:
+            meta = item or b""
+        found = re.search(rb"UID (\d+)", meta)
+        if found:
+            uid = int(found.group(1))
+    if uid is not None:
+        messages[uid] = sections
+    return messages
+
+
 def _decode_header_str(value: str) -> str:
     parts = decode_header(value or "")
     out = []
@@ -0,0 +1,264 @@
+"""
+AI Employee Vault — Channel Ingestion Daemon (Silver Tier)
+One process that hosts every channel inbox (Channels/*_Inbox) and turns
+dropped event files into /Needs_Action tasks.
+
+All inbox folders are scheduled on a single watchdog Observer. Each channel is
+a handler plugin (a converter: event file → task file) registered in
+CHANNEL_PLUGINS; file channels convert through their channel_adapters.py
+adapter, the same one the standalone watchers use. New files from any
+channel go through one shared pipeline: a thread pool of `ingestion.workers`
+converter threads (started on demand, so an idle daemon holds one or two),
+fed by the Observer. At most `ingestion.max_pending` events are queued across all
+channels — past that the Observer thread waits, so a flood on one channel
+applies backpressure instead of growing memory without bound.
+
+Files already waiting in a replay_existing inbox at startup are replayed by a
+backlog_replay.BacklogReplay per channel (its own `replay.concurrency`
+threads, checkpointed), so new events keep flowing through the shared pool
+instead of queueing behind a backlog left over from downtime.
+
+Gmail in IMAP mode has no inbox folder; its watcher loop runs in a thread of
+this process instead.
+
+Usage:
+  python ingestion_daemon.py
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+from backlog_replay import BacklogReplay
+from config_loader import load_config, log_event
+from file_events import CLOSE_EVENTS, SettleTimers
+
+VAULT_PATH = Path(__file__).parent.resolve()
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_PENDING = 256
+
+
+def log(msg: str) -> None:
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] [Ingestion] {msg}")
+
+
+# ── Channel plugins ───────────────────────────────────────────────────────────
+
+@dataclass
+class ChannelPlugin:
+    """How one channel's inbox files become tasks.
+
+    load() imports the channel's converter lazily and returns it (or None if
+    the channel needs no folder handler); replay_existing converts files
+    already in the inbox at startup, skipping those its replay checkpoint
+    shows were converted before.
+    """
+    name: str
+    default_folder: str
+    load: Callable[[], Callable[[Path], object] | None]
+    replay_existing: bool = False
+
+
+def _adapter_loader(channel: str):
+    """Plugin loader for a channel handled by a channel_adapters adapter."""
+    def load():
+        from channel_adapters import get_adapter
+        return get_adapter(channel).convert
+    return load
+
+
+def _load_gmail():
+    from gmail_watcher import GmailWatcher
+    watcher = GmailWatcher()
+    if watcher.mode == "json":
+        return watcher.ingest_json_file
+    # IMAP mode polls Gmail itself: host its loop here instead of a folder handler
+    threading.Thread(target=watcher.run, name="gmail-imap", daemon=True).start()
+    log("Gmail IMAP watcher started in-process")
+    return None
+
+
+CHANNEL_PLUGINS: dict[str, ChannelPlugin] = {
+    "whatsapp": ChannelPlugin("whatsapp", "Channels/WhatsApp_Inbox", _adapter_loader("whatsapp")),
+    "social_linkedin": ChannelPlugin("social_linkedin", "Channels/Social_Inbox", _adapter_loader("social_linkedin")),
+    "facebook": ChannelPlugin("facebook", "Channels/Facebook_Inbox", _adapter_loader("facebook"), replay_existing=True),
+    "twitter": ChannelPlugin("twitter", "Channels/Twitter_Inbox", _adapter_loader("twitter"), replay_existing=True),
+    "gmail": ChannelPlugin("gmail", "Channels/Gmail_Inbox", _load_gmail, replay_existing=True),
+}
+
+
+# ── Shared pipeline ───────────────────────────────────────────────────────────
+
+class IngestionDaemon:
+    """One Observer + one bounded worker pool for every channel inbox."""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, max_pending: int = DEFAULT_MAX_PENDING):
+        self.workers = max(workers, 1)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ingest")
+        self._slots = threading.BoundedSemaphore(max(max_pending, self.workers))
+        self._observer = Observer()
+        self._converters: dict[Path, tuple[str, Callable[[Path], object]]] = {}
+        self._inflight: set[Path] = set()
+        self._replays: dict[str, BacklogReplay] = {}
+        self._lock = threading.Lock()
+        self.stats: dict[str, int] = {}
+
+    def add_channel(self, plugin: ChannelPlugin, inbox: Path) -> bool:
+        """Load a channel's converter and watch its inbox. False if it failed to load."""
+        try:
+            convert = plugin.load()
+        except Exception as e:
+            log(f"Channel {plugin.name} disabled: {e}")
+            log_event("Ingestion Channel Disabled", [f"Channel: {plugin.name}", f"Error: {e}"])
+            return False
+        if convert is None:
+            return True
+        inbox.mkdir(parents=True, exist_ok=True)
+        self._converters[inbox.resolve()] = (plugin.name, convert)
+        self._observer.schedule(_InboxHandler(self), str(inbox), recursive=False)
+        self.stats.setdefault(plugin.name, 0)
+        log(f"Watching {plugin.name}: {inbox}")
+        if plugin.replay_existing:
+            self._replays[plugin.name] = BacklogReplay(
+                f"ingest_{plugin.name}", inbox,
+                lambda path, name=plugin.name, convert=convert: self._replay_one(name, convert, path),
+            )
+        return True
+
+    def submit(self, path: Path) -> None:
+        """Queue one inbox file. Blocks while max_pending events are waiting."""
+        path = Path(path)
+        entry = self._converters.get(path.parent.resolve())
+        if entry is None:
+            return
+        with self._lock:
+            if path in self._inflight:
+                return
+            self._inflight.add(path)
+        self._slots.acquire()
+        self._pool.submit(self._convert, entry[0], entry[1], path)
+
+    def _replay_one(self, channel: str, convert: Callable[[Path], object], path: Path) -> None:
+        """Backlog replay handler: skip files a live event already picked up."""
+        with self._lock:
+            if path in self._inflight:
+                return
+            self._inflight.add(path)
+        try:
+            convert(path)
+            with self._lock:
+                self.stats[channel] = self.stats.get(channel, 0) + 1
+        finally:
+            with self._lock:
+                self._inflight.discard(path)
+
+    def _convert(self, channel: str, convert: Callable[[Path], object], path: Path) -> None:
+        try:
+            convert(path)
+            with self._lock:
+                self.stats[channel] = self.stats.get(channel, 0) + 1
+            replay = self._replays.get(channel)
+            if replay is not None:
+                replay.record(path)
+        except Exception as e:
+            log(f"{channel}: failed to ingest {path.name}: {e}")
+            log_event("Ingestion Error", [f"Channel: {channel}", f"File: {path.name}", f"Error: {e}"])
+        finally:
+            with self._lock:
+                self._inflight.discard(path)
+            self._slots.release()
+
+    def start(self) -> None:
+        self._observer.start()
+        for replay in self._replays.values():
+            replay.start()
+
+    def stop(self) -> None:
+        self._observer.stop()
+        self._observer.join(timeout=5)
+        self._pool.shutdown(wait=True)
+        for replay in self._replays.values():
+            replay.close()
+
+    def is_alive(self) -> bool:
+        return self._observer.is_alive()
+
+
+class _InboxHandler(FileSystemEventHandler):
+    """Submits event files once complete (see file_events.py)."""
+
+    def __init__(self, daemon: IngestionDaemon):
+        self.daemon = daemon
+        self.settle = SettleTimers(self._submit)
+
+    def on_created(self, event):
+        if event.is_directory:
+            return
+        if CLOSE_EVENTS:
+            self.settle.created(event.src_path)  # moved in from an unwatched folder
+        else:
+            self._submit(event.src_path)
+
+    def on_modified(self, event):
+        if CLOSE_EVENTS and not event.is_directory:
+            self.settle.modified(event.src_path)
+
+    def on_closed(self, event):
+        if self.settle.settled(event.src_path):
+            self._submit(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.settle.settled(event.src_path)
+            self._submit(event.dest_path)  # submit() ignores folders it does not watch
+
+    def _submit(self, src_path: str) -> None:
+        if src_path.endswith(".json") and not os.path.basename(src_path).startswith("."):
+            self.daemon.submit(Path(src_path))
+
+
+def build_daemon(config: dict | None = None) -> IngestionDaemon:
+    """A daemon with every configured channel plugin attached (not yet started)."""
+    cfg = config or load_config()
+    ingest_cfg = cfg.get("ingestion", {}) or {}
+    daemon = IngestionDaemon(
+        workers=int(ingest_cfg.get("workers", DEFAULT_WORKERS)),
+        max_pending=int(ingest_cfg.get("max_pending", DEFAULT_MAX_PENDING)),
+    )
+    channels_cfg = cfg.get("channels", {})
+    for name in ingest_cfg.get("channels", list(CHANNEL_PLUGINS)):
+        plugin = CHANNEL_PLUGINS.get(name)
+        if plugin is None:
+            log(f"Unknown channel in ingestion.channels: {name}")
+            continue
+        folder = channels_cfg.get(name, {}).get("watch_folder", plugin.default_folder)
+        daemon.add_channel(plugin, VAULT_PATH / folder)
+    return daemon
+
+
+def main():
+    daemon = build_daemon()
+    daemon.start()
+    log(f"Ingestion daemon online ({daemon.workers} workers max)")
+    try:
+        while True:
+            time.sleep(1)
+            if not daemon.is_alive():
+                log("Observer stopped unexpectedly — exiting")
+                break
+    except KeyboardInterrupt:
+        pass
+    daemon.stop()
+    log(f"Ingestion daemon offline — ingested {daemon.stats}")
+
+
+if __name__ == "__main__":
+    main()
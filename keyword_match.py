@@ -0,0 +1,247 @@
+"""
+AI Employee Vault — Whole-Word Keyword Matching (Silver Tier)
+Pure text helpers shared by the vault scripts and the backend: whole-word
+search, the PriorityDetector keyword engine and the SensitivityMatcher
+scoring algorithm.
+
+No imports from the vault or the backend: sensitivity_scorer.py,
+priority_detector.py and backend/services/* all use these, so this module
+must stay importable on its own. Where the weights and thresholds come from
+is up to the caller: config.yaml (hot-reloaded) in the vault, built-in
+defaults in the backend.
+"""
+
+from bisect import bisect_right
+
+
+def is_word_char(c: str) -> bool:
+    """Same character class as the regex word class used by re.findall(r"\\w+", ...)."""
+    return c.isalnum() or c == "_"
+
+
+def has_word(text: str, word: str) -> bool:
+    """True if word occurs in text with no word character on either side."""
+    start = text.find(word)
+    while start != -1:
+        end = start + len(word)
+        if (start == 0 or not is_word_char(text[start - 1])) and (
+            end == len(text) or not is_word_char(text[end])
+        ):
+            return True
+        start = text.find(word, start + 1)
+    return False
+
+
+PRIORITY_LEVELS = ("P0", "P1", "P2", "P3")
+
+
+class PriorityDetector:
+    """Highest priority whose keyword appears (as a whole word) in a text."""
+
+    def __init__(self, keywords: dict[str, str]):
+        by_level: dict[str, list[str]] = {}
+        for word, prio in keywords.items():
+            word = str(word).strip().lower()
+            if word:
+                by_level.setdefault(str(prio), []).append(word)
+        self._levels = tuple(
+            (prio, tuple(by_level[prio]))
+            for prio in sorted(by_level, key=lambda p: (p not in PRIORITY_LEVELS, p))
+        )
+
+    def detect(self, text: str) -> str | None:
+        """The most urgent matching priority, or None if no keyword matches."""
+        text_lower = text.lower()
+        for prio, words in self._levels:
+            for word in words:
+                # `in` rejects the common no-match case without a Python call
+                if word in text_lower and has_word(text_lower, word):
+                    return prio
+        return None
+
+
+# ── Sensitivity scoring ───────────────────────────────────────────────────────
+
+# Context modifiers: pairs of words that boost or reduce score
+CONTEXT_BOOST: dict[tuple[str, str], float] = {
+    ("email", "client"): 0.3,
+    ("email", "external"): 0.2,
+    ("payment", "invoice"): 0.2,
+    ("delete", "database"): 0.3,
+    ("delete", "production"): 0.3,
+    ("access", "admin"): 0.3,
+    ("password", "reset"): 0.2,
+    ("credential", "share"): 0.3,
+}
+
+CONTEXT_REDUCE: dict[tuple[str, str], float] = {
+    ("email", "internal"): -0.2,
+    ("email", "notification"): -0.15,
+    ("delete", "draft"): -0.2,
+    ("delete", "temp"): -0.2,
+    ("access", "read"): -0.1,
+}
+
+# Map keywords to sensitivity categories
+KEYWORD_CATEGORIES: dict[str, str] = {
+    "invoice": "financial",
+    "payment": "financial",
+    "refund": "financial",
+    "email": "external_communication",
+    "client": "external_communication",
+    "delete": "data_deletion",
+    "password": "access_change",
+    "credential": "access_change",
+    "permission": "access_change",
+    "access": "access_change",
+}
+
+
+class SensitivityMatcher:
+    """Precompiled sensitivity matcher for one keyword/threshold configuration.
+
+    Built once per configuration and reused for every message. Keywords keep
+    their substring semantics (C-level `in` scans); context pairs need whole
+    words, which are confirmed by checking the characters around each
+    `str.find` hit — so the text is never tokenized or run through a regex.
+    """
+
+    def __init__(
+        self,
+        weights: dict[str, float],
+        threshold: float = 0.6,
+        boost: dict[tuple[str, str], float] = CONTEXT_BOOST,
+        reduce: dict[tuple[str, str], float] = CONTEXT_REDUCE,
+    ):
+        self.threshold = threshold
+        self._keywords = [
+            (kw, weight, KEYWORD_CATEGORIES.get(kw, "unknown"), f"{kw} (+{weight})")
+            for kw, weight in weights.items()
+        ]
+        self._pairs = [
+            (w1, w2, modifier, f"context({w1}+{w2}) (+{modifier})")
+            for (w1, w2), modifier in boost.items()
+        ] + [
+            (w1, w2, modifier, f"context({w1}+{w2}) ({modifier})")
+            for (w1, w2), modifier in reduce.items()
+        ]
+
+    def score(self, text: str, threshold: float | None = None) -> dict:
+        """Score one text; threshold defaults to the matcher's own."""
+        text_lower = text.lower()
+
+        signals: list[str] = []
+        category_scores: dict[str, float] = {}
+        total_score = 0.0
+
+        # Score each weighted keyword
+        for keyword, weight, cat, signal in self._keywords:
+            if keyword in text_lower:
+                signals.append(signal)
+                total_score += weight
+                category_scores[cat] = category_scores.get(cat, 0) + weight
+
+        # Apply context boosters, then reducers
+        word_hits: dict[str, bool] = {}
+
+        def word(w: str) -> bool:
+            hit = word_hits.get(w)
+            if hit is None:
+                hit = has_word(text_lower, w)
+                word_hits[w] = hit
+            return hit
+
+        for w1, w2, modifier, signal in self._pairs:
+            if word(w1) and word(w2):
+                total_score += modifier
+                signals.append(signal)
+
+        return self._result(total_score, category_scores, signals, threshold)
+
+    def score_many(self, texts: list[str], threshold: float | None = None) -> list[dict]:
+        """Score a list of texts in one pass per term, in input order.
+
+        The lowercased texts are joined into a single NUL-separated corpus and
+        each term is located with repeated `str.find` over the whole corpus,
+        skipping to the next text after every hit. That fills a texts x terms
+        presence matrix with work proportional to the number of hits rather
+        than texts x terms, then the matrix is folded into scores.
+        """
+        lowered = [t.lower() for t in texts]
+        corpus = "\0".join(lowered)
+        starts = []
+        offset = 0
+        for text in lowered:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        totals = [0.0] * len(lowered)
+        signals: list[list[str]] = [[] for _ in lowered]
+        category_scores: list[dict[str, float]] = [{} for _ in lowered]
+
+        substring_rows: dict[str, list[int]] = {}
+        for keyword, weight, cat, signal in self._keywords:
+            hits = _rows_containing(corpus, starts, keyword, whole_word=False)
+            substring_rows[keyword] = hits
+            for i in hits:
+                signals[i].append(signal)
+                totals[i] += weight
+                category_scores[i][cat] = category_scores[i].get(cat, 0) + weight
+
+        word_rows: dict[str, set[int]] = {}
+
+        def rows(w: str) -> set[int]:
+            hits = word_rows.get(w)
+            if hits is None:
+                candidates = substring_rows.get(w)
+                if candidates is None:
+                    hits = set(_rows_containing(corpus, starts, w, whole_word=True))
+                else:
+                    # Whole-word hits are a subset of the keyword's substring hits
+                    hits = {i for i in candidates if has_word(lowered[i], w)}
+                word_rows[w] = hits
+            return hits
+
+        for w1, w2, modifier, signal in self._pairs:
+            first = rows(w1)
+            if not first:
+                continue
+            for i in sorted(first & rows(w2)):
+                totals[i] += modifier
+                signals[i].append(signal)
+
+        return [
+            self._result(total, cats, sigs, threshold)
+            for total, sigs, cats in zip(totals, signals, category_scores)
+        ]
+
+    def _result(self, total: float, category_scores: dict, signals: list, threshold: float | None) -> dict:
+        # Normalize score to 0.0-1.0 range
+        score = min(1.0, max(0.0, total))
+        return {
+            "score": round(score, 2),
+            "category": max(category_scores, key=category_scores.get) if category_scores else "none",
+            "signals": signals,
+            "requires_approval": score >= (self.threshold if threshold is None else threshold),
+        }
+
+
+def _rows_containing(corpus: str, starts: list[int], term: str, whole_word: bool) -> list[int]:
+    """Indices of the NUL-joined texts that contain term (as a whole word if asked)."""
+    rows = []
+    n = len(starts)
+    pos = corpus.find(term)
+    while pos != -1:
+        row = bisect_right(starts, pos) - 1
+        end = pos + len(term)
+        if whole_word and not (
+            (pos == 0 or not is_word_char(corpus[pos - 1]))
+            and (end == len(corpus) or not is_word_char(corpus[end]))
+        ):
+            pos = corpus.find(term, pos + 1)
+            continue
+        rows.append(row)
+        if row + 1 >= n:
+            break
+        pos = corpus.find(term, starts[row + 1])
+    return rows
@@ -9,27 +9,16 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+from atomic_write import write_text_atomic
 from config_loader import load_config, get_path, get_sla_deadline, get_priority_from_keywords, log_event
+from frontmatter_index import parse_frontmatter
 from sensitivity_scorer import score_sensitivity
 
 VAULT = Path(__file__).parent.resolve()
 
 
 def read_frontmatter(path: Path) -> tuple[dict, str]:
-    text = path.read_text(encoding="utf-8")
-    if text.startswith("---"):
-        parts = text.split("\n---", 1)
-        fm_block = parts[0].strip("-\n") if len(parts) > 1 else ""
-        body = parts[1] if len(parts) > 1 else text
-    else:
-        fm_block = ""
-        body = text
-    meta: dict[str, str] = {}
-    for line in fm_block.splitlines():
-        if ":" in line:
-            k, v = line.split(":", 1)
-            meta[k.strip()] = v.strip()
-    return meta, body
+    return parse_frontmatter(path.read_text(encoding="utf-8"))
 
 
 def detect_priority(meta: dict, body: str) -> str:
@@ -69,7 +58,7 @@ def write_plan(stem: str, summary: str, sensitivity_result: dict, priority: str)
         "- Route approvals if sensitive",
         "- Save to /Done and update dashboard",
     ]
-    p.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    write_text_atomic(p, "\n".join(lines) + "\n")
 
 
 def write_approval(stem: str, summary: str, sensitivity_result: dict, priority: str) -> None:
@@ -90,7 +79,7 @@ def write_approval(stem: str, summary: str, sensitivity_result: dict, priority:
         "- Draft prepared per plan",
         "- Await manager sign-off before sending/posting",
     ]
-    p.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    write_text_atomic(p, "\n".join(lines) + "\n")
 
 
 def write_done(stem: str, priority: str, sensitivity_result: dict, body: str) -> None:
@@ -115,10 +104,10 @@ def write_done(stem: str, priority: str, sensitivity_result: dict, body: str) ->
         "",
         body.strip() or f"# Completed: {stem}",
     ]
-    p.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    write_text_atomic(p, "\n".join(lines) + "\n")
 
 
-def process_task(path: Path) -> None:
+def process_task(path: Path, refresh_dashboard: bool = True) -> None:
     cfg = load_config()
     stem = path.stem
     meta, body = read_frontmatter(path)
@@ -158,6 +147,11 @@ def process_task(path: Path) -> None:
     except Exception:
         pass
 
+    if refresh_dashboard:
+        _write_dashboard()
+
+
+def _write_dashboard() -> None:
     try:
         from update_dashboard import write_dashboard
         write_dashboard()
@@ -171,15 +165,21 @@ def main() -> None:
     inbox.mkdir(parents=True, exist_ok=True)
     in_progress.mkdir(parents=True, exist_ok=True)
     
+    processed = 0
     for md in inbox.glob("*.md"):
         # Claim file
         new_path = in_progress / md.name
         try:
             os.rename(md, new_path)
-            process_task(new_path)
+            process_task(new_path, refresh_dashboard=False)
+            processed += 1
         except Exception as e:
             print(f"Error claiming {md.name}: {e}")
 
+    # One dashboard rewrite for the whole batch
+    if processed:
+        _write_dashboard()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,366 @@
+"""
+AI Employee Vault — Structured Log Records (Silver Tier)
+JSONL sidecar for /Logs/<date>.md plus a per-day hour → byte-offset index.
+
+Every Markdown log entry is mirrored as one JSON line in /Logs/<date>.jsonl:
+
+  {"ts": "2026-03-02T14:05:09", "event": "Task Processed", "task": "client_email",
+   "priority": "P1", "details": ["Task: client_email", "Priority: P1", ...]}
+
+`task` and `priority` are lifted from "Task: ..." / "Priority: ..." detail
+lines so reports can aggregate by field. /Logs/<date>.idx.json records the
+byte offset where each hour starts; readers extend it incrementally from the
+last indexed size, so seeking to a time range never re-reads earlier lines.
+Days logged before the sidecar existed are read from the Markdown file.
+
+The Markdown stays the source of truth. Entries appended to <date>.md
+without log_writer (the agent's own log step, hand edits, other scripts)
+have no record, so readers first call sync_sidecar(): it parses only the
+Markdown past the last synced offset (kept in the index as "md_size"),
+matches those entries against the records log_writer wrote, and appends
+records for the ones that are missing.
+"""
+
+import json
+import os
+import re
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+RECORD_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx.json"
+SYNC_LOCK_SUFFIX = ".sync.lock"
+SYNC_LOCK_STALE_SECONDS = 30
+
+_FIELD_PREFIXES = {"task": "task:", "priority": "priority:"}
+
+
+def build_record(title: str, details: list[str] | None, when: datetime) -> dict:
+    """The structured form of one log entry."""
+    details = [str(d) for d in (details or [])]
+    record = {"ts": when.isoformat(timespec="seconds"), "event": title, "task": "", "priority": ""}
+    for d in details:
+        lowered = d.lower()
+        for field, prefix in _FIELD_PREFIXES.items():
+            if not record[field] and lowered.startswith(prefix):
+                record[field] = d[len(prefix):].strip()
+    record["details"] = details
+    return record
+
+
+def record_line(record: dict) -> str:
+    return json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def record_file(logs_dir: Path, day: str) -> Path:
+    return Path(logs_dir) / f"{day}{RECORD_SUFFIX}"
+
+
+def index_file(logs_dir: Path, day: str) -> Path:
+    return Path(logs_dir) / f"{day}{INDEX_SUFFIX}"
+
+
+def entry_header(record: dict) -> str:
+    """The Markdown header text ("HH:MM - Event") for a record."""
+    if record.get("untimed"):
+        return record["event"]
+    return f"{record['ts'][11:16]} - {record['event']}"
+
+
+# ── Markdown (legacy days and backfill) ───────────────────────────────────────
+
+def parse_markdown_entries(content: str) -> list[tuple[str, list[str]]]:
+    """(header, details) for every "## HH:MM - Title" block in a log file."""
+    entries: list[tuple[str, list[str]]] = []
+    for block in re.split(r"\n(?=## )", content):
+        if not block.strip().startswith("## "):
+            continue
+        lines = block.strip().splitlines()
+        header = lines[0][3:].strip()
+        details = [l.strip("- ").strip() for l in lines[1:]]
+        entries.append((header, details))
+    return entries
+
+
+def _records_from_markdown(md_file: Path, day: str) -> list[dict]:
+    return _records_from_text(md_file.read_text(encoding="utf-8"), day)
+
+
+def _records_from_text(content: str, day: str) -> list[dict]:
+    records = []
+    for header, details in parse_markdown_entries(content):
+        stamp, _, title = header.partition(" - ")
+        try:
+            when = datetime.strptime(f"{day} {stamp.strip()}", "%Y-%m-%d %H:%M")
+            records.append(build_record(title, details, when))
+        except ValueError:
+            # Hand-written header without a time: keep it verbatim
+            record = build_record(header, details, datetime.strptime(day, "%Y-%m-%d"))
+            record["untimed"] = True
+            records.append(record)
+    return records
+
+
+def backfill_sidecar(logs_dir: Path, day: str) -> bool:
+    """Create <day>.jsonl from an existing <day>.md written before the sidecar.
+
+    Uses exclusive create, so only one process backfills a given day.
+    Returns True if this call created the file.
+    """
+    md_file = Path(logs_dir) / f"{day}.md"
+    try:
+        data = md_file.read_bytes()
+    except OSError:
+        return False
+    data = data[:data.rfind(b"\n") + 1]
+    lines = [record_line(r) for r in _records_from_text(data.decode("utf-8", errors="replace"), day)]
+    try:
+        with record_file(logs_dir, day).open("x", encoding="utf-8") as f:
+            f.writelines(lines)
+    except (FileExistsError, OSError):
+        return False
+    size = record_file(logs_dir, day).stat().st_size
+    _save_index(index_file(logs_dir, day), {"size": 0, "hours": {}, "md_size": len(data), "md_records": size})
+    return True
+
+
+# ── Markdown → sidecar sync ───────────────────────────────────────────────────
+
+def _entry_key(header: str, details: list[str]) -> tuple:
+    # Compare the way parse_markdown_entries reads entries back
+    return header.strip(), tuple(d for d in (x.strip("- ").strip() for x in details) if d)
+
+
+def sync_sidecar(logs_dir: Path, day: str) -> bool:
+    """Add records for Markdown entries that were written without log_writer.
+
+    Returns False if another process is syncing this day right now; the
+    caller should then read the Markdown instead.
+    """
+    logs_dir = Path(logs_dir)
+    md_file = logs_dir / f"{day}.md"
+    rec_file = record_file(logs_dir, day)
+    idx_file = index_file(logs_dir, day)
+    try:
+        md_size = md_file.stat().st_size
+    except OSError:
+        return True
+    index = _read_index(idx_file)
+    synced = index.get("md_size", 0)
+    if md_size == synced:
+        return True
+
+    lock = logs_dir / f"{day}{SYNC_LOCK_SUFFIX}"
+    if not _acquire_lock(lock):
+        return False
+    try:
+        index = _read_index(idx_file)
+        synced = index.get("md_size", 0)
+        rec_from = index.get("md_records", 0)
+        if md_size < synced:
+            synced = rec_from = 0  # Markdown was rewritten: match it all again
+        with md_file.open("rb") as f:
+            f.seek(synced)
+            data = f.read(md_size - synced)
+        data = data[:data.rfind(b"\n") + 1]  # complete lines only
+        md_records = _records_from_text(data.decode("utf-8", errors="replace"), day)
+
+        # Records log_writer wrote since the last sync, with their offsets
+        written: list[tuple[int, tuple]] = []
+        offset = rec_from
+        with rec_file.open("rb") as f:
+            f.seek(rec_from)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    r = json.loads(raw)
+                    written.append((offset, _entry_key(entry_header(r), r.get("details", []))))
+                except ValueError:
+                    pass
+                offset += len(raw)
+        end = offset
+
+        available = Counter(key for _, key in written)
+        missing = []
+        for r in md_records:
+            key = _entry_key(entry_header(r), r["details"])
+            if available[key]:
+                available[key] -= 1
+            else:
+                missing.append(r)
+
+        # Records whose Markdown is not written yet are matched on the next sync
+        pending = available.copy()
+        cursor = end
+        for off, key in reversed(written):
+            if pending[key]:
+                pending[key] -= 1
+                cursor = off
+        if missing:
+            with rec_file.open("a", encoding="utf-8") as f:
+                f.writelines(record_line(r) for r in missing)
+            if cursor == end:
+                cursor = rec_file.stat().st_size
+
+        index = _read_index(idx_file)
+        index["md_size"] = synced + len(data)
+        index["md_records"] = cursor
+        _save_index(idx_file, index)
+        return True
+    finally:
+        try:
+            os.unlink(lock)
+        except OSError:
+            pass
+
+
+def _acquire_lock(lock: Path) -> bool:
+    for _ in range(2):
+        try:
+            os.close(os.open(lock, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - lock.stat().st_mtime < SYNC_LOCK_STALE_SECONDS:
+                    return False
+                os.unlink(lock)  # left behind by a crashed reader
+            except OSError:
+                pass
+        except OSError:
+            return False
+    return False
+
+
+# ── Index ─────────────────────────────────────────────────────────────────────
+
+def _read_index(idx_file: Path) -> dict:
+    try:
+        index = json.loads(idx_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        index = {}
+    index.setdefault("size", 0)
+    index.setdefault("hours", {})
+    return index
+
+
+def _save_index(idx_file: Path, index: dict) -> None:
+    tmp = idx_file.with_suffix(".tmp")
+    try:
+        tmp.write_text(json.dumps(index), encoding="utf-8")
+        tmp.replace(idx_file)
+    except OSError:
+        pass
+
+
+def load_index(logs_dir: Path, day: str) -> dict:
+    """The day's hour → offset index, extended to cover the whole sidecar."""
+    rec_file = record_file(logs_dir, day)
+    idx_file = index_file(logs_dir, day)
+    index = _read_index(idx_file)
+    try:
+        size = rec_file.stat().st_size
+    except OSError:
+        return {"size": 0, "hours": {}}
+    if size < index["size"]:
+        index = {"size": 0, "hours": {}}  # file was rewritten
+    if size == index["size"]:
+        return index
+
+    offset = index["size"]
+    with rec_file.open("rb") as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break  # partially written line — index it next time
+            hour = _hour_of(raw)
+            if hour is not None and hour not in index["hours"]:
+                index["hours"][hour] = offset
+            offset += len(raw)
+    index["size"] = offset
+    _save_index(idx_file, index)
+    return index
+
+
+def _hour_of(raw: bytes) -> str | None:
+    # "ts" is always the first key: {"ts": "YYYY-MM-DDTHH:...
+    pos = raw.find(b'"ts": "')
+    if pos == -1:
+        return None
+    return raw[pos + 18:pos + 20].decode("ascii", errors="replace")
+
+
+# ── Reading ───────────────────────────────────────────────────────────────────
+
+def read_day(logs_dir: Path, day: str, start_hour: int = 0) -> list[dict]:
+    """Records for one day from start_hour on (Markdown fallback for old days)."""
+    rec_file = record_file(logs_dir, day)
+    if not rec_file.exists() or not sync_sidecar(logs_dir, day):
+        md_file = Path(logs_dir) / f"{day}.md"
+        if not md_file.exists():
+            return []
+        return [r for r in _records_from_markdown(md_file, day) if int(r["ts"][11:13]) >= start_hour]
+
+    offset = 0
+    if start_hour > 0:
+        hours = load_index(logs_dir, day)["hours"]
+        later = [off for h, off in hours.items() if int(h) >= start_hour]
+        if not later:
+            return []
+        offset = min(later)
+    with rec_file.open("rb") as f:
+        f.seek(offset)
+        data = f.read().decode("utf-8", errors="replace")
+    data = data[:data.rfind("\n") + 1]  # drop a partially written last line
+    records = _parse_lines(data)
+    if start_hour > 0:
+        min_hour = f"{start_hour:02d}"
+        records = [r for r in records if r["ts"][11:13] >= min_hour]
+    return records
+
+
+def _parse_lines(data: str) -> list[dict]:
+    """Parse JSONL in one json.loads call; per line only if a line is damaged."""
+    if not data:
+        return []
+    try:
+        return json.loads("[" + data[:-1].replace("\n", ",") + "]")
+    except ValueError:
+        records = []
+        for line in data.splitlines():
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+        return records
+
+
+def read_range(logs_dir: Path, start: datetime, end: datetime) -> list[dict]:
+    """Records with start <= ts <= end, seeking into the first day by hour."""
+    start_iso = start.isoformat(timespec="seconds")
+    end_iso = end.isoformat(timespec="seconds")
+    records = []
+    day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    while day.date() <= end.date():
+        day_str = day.strftime("%Y-%m-%d")
+        start_hour = start.hour if day.date() == start.date() else 0
+        records.extend(
+            r for r in read_day(logs_dir, day_str, start_hour)
+            if start_iso <= r["ts"] <= end_iso
+        )
+        day += timedelta(days=1)
+    return records
+
+
+def tail_day(logs_dir: Path, day: str, count: int) -> list[dict]:
+    """The last `count` records of a day, reading only the hours needed."""
+    if not record_file(logs_dir, day).exists() or not sync_sidecar(logs_dir, day):
+        return read_day(logs_dir, day)[-count:]
+    hours = sorted(load_index(logs_dir, day)["hours"], reverse=True)
+    for hour in hours:
+        records = read_day(logs_dir, day, int(hour))
+        if len(records) >= count:
+            return records[-count:]
+    return read_day(logs_dir, day)[-count:]
@@ -0,0 +1,181 @@
+"""
+AI Employee Vault — Buffered Log Writer (Silver Tier)
+One writer for every /Logs/<date>.md entry in the process.
+
+Entries are formatted at call time (so the HH:MM stamp and the date file are
+exact) and queued in memory, together with their JSONL record for the
+structured sidecar (log_records.py). A background flusher thread appends them
+grouped per file — one open() per file per flush — every `flush_interval_ms`
+or as soon as `max_buffered_entries` are waiting. Pending entries are flushed on
+interpreter exit (atexit) and by close().
+
+fsync policy (config.yaml `logging.fsync`):
+  none   — leave it to the OS (default)
+  batch  — fsync each file once per flush
+  always — write and fsync synchronously on every entry (no buffering)
+"""
+
+import atexit
+import os
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+from log_records import backfill_sidecar, build_record, record_file, record_line
+
+FSYNC_POLICIES = ("none", "batch", "always")
+DEFAULT_FLUSH_INTERVAL_MS = 200
+DEFAULT_MAX_BUFFERED = 50
+DEFAULT_CAPACITY = 10000
+
+
+def format_entry(title: str, details: list[str] | None = None, when: datetime | None = None) -> str:
+    """A Markdown log entry in the vault's standard format."""
+    when = when or datetime.now()
+    lines = [f"## {when.strftime('%H:%M')} - {title}\n"]
+    lines.extend(f"- {d}\n" for d in (details or []))
+    return "".join(lines)
+
+
+class LogWriter:
+    """Thread-safe buffered appender for Markdown log files."""
+
+    def __init__(
+        self,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        max_buffered: int = DEFAULT_MAX_BUFFERED,
+        fsync: str = "none",
+        capacity: int = DEFAULT_CAPACITY,
+    ):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        self.flush_interval = max(flush_interval_ms, 1) / 1000
+        self.max_buffered = max(max_buffered, 1)
+        self.fsync = fsync
+        self.capacity = max(capacity, self.max_buffered)
+        self._buffer: deque[tuple[Path, str]] = deque()
+        self._lock = threading.Lock()        # guards _buffer
+        self._write_lock = threading.Lock()  # serializes file writes (keeps entry order)
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def append(self, log_file: Path, text: str) -> None:
+        """Queue text for log_file. Never blocks on disk unless the buffer is full."""
+        if self.fsync == "always" or self._stopped.is_set():
+            with self._write_lock:
+                self._write_grouped([(Path(log_file), text)])
+            return
+        with self._lock:
+            self._buffer.append((Path(log_file), text))
+            pending = len(self._buffer)
+        self._ensure_thread()
+        if pending >= self.capacity:
+            self.flush()  # backpressure instead of dropping entries
+        elif pending >= self.max_buffered:
+            self._wake.set()
+
+    def flush(self) -> None:
+        """Write every queued entry now."""
+        with self._write_lock:
+            with self._lock:
+                batch = list(self._buffer)
+                self._buffer.clear()
+            if batch:
+                self._write_grouped(batch)
+
+    def close(self) -> None:
+        """Stop the flusher thread and write anything still queued."""
+        self._stopped.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self.flush()
+
+    # ── Internals ─────────────────────────────────────────────────────────────
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[log_writer] flush failed: {e}")
+
+    def _write_grouped(self, batch: list[tuple[Path, str]]) -> None:
+        grouped: dict[Path, list[str]] = {}
+        for log_file, text in batch:
+            grouped.setdefault(log_file, []).append(text)
+        for log_file, texts in grouped.items():
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            with log_file.open("a", encoding="utf-8") as f:
+                f.write("".join(texts))
+                if self.fsync != "none":
+                    f.flush()
+                    os.fsync(f.fileno())
+
+
+_writer: LogWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> LogWriter:
+    """The process-wide writer, configured from config.yaml `logging`."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                try:
+                    from config_loader import load_config
+                    cfg = load_config().get("logging", {}) or {}
+                except Exception:
+                    cfg = {}
+                _writer = LogWriter(
+                    flush_interval_ms=int(cfg.get("flush_interval_ms", DEFAULT_FLUSH_INTERVAL_MS)),
+                    max_buffered=int(cfg.get("max_buffered_entries", DEFAULT_MAX_BUFFERED)),
+                    fsync=str(cfg.get("fsync", "none")),
+                )
+                atexit.register(_writer.close)
+    return _writer
+
+
+def write_entry(logs_dir: Path, title: str, details: list[str] | None = None) -> None:
+    """Queue a standard entry for today's log file in logs_dir, plus its
+    structured record in the JSONL sidecar (see log_records.py)."""
+    now = datetime.now()
+    day = now.strftime("%Y-%m-%d")
+    logs_dir = Path(logs_dir)
+    writer = get_writer()
+    _ensure_sidecar(logs_dir, day)
+    writer.append(record_file(logs_dir, day), record_line(build_record(title, details, now)))
+    writer.append(logs_dir / f"{day}.md", format_entry(title, details, now))
+
+
+_sidecar_days: set[tuple[Path, str]] = set()
+
+
+def _ensure_sidecar(logs_dir: Path, day: str) -> None:
+    """Once per day: backfill the sidecar from a Markdown log that predates it."""
+    key = (logs_dir, day)
+    if key in _sidecar_days:
+        return
+    _sidecar_days.add(key)
+    if not record_file(logs_dir, day).exists():
+        backfill_sidecar(logs_dir, day)
+
+
+def flush_logs() -> None:
+    """Write all queued entries now (e.g. before a process hands off or exits)."""
+    if _writer is not None:
+        _writer.flush()
@@ -0,0 +1,44 @@
+"""
+AI Employee Vault — Priority Keyword Detector (Silver Tier)
+Config-driven priority detectors for every tier and channel.
+
+The detector itself lives in keyword_match.py (no vault imports, so the
+backend uses it too). A PriorityDetector is built once from a keyword → priority map and groups
+the keywords by level, most urgent first. detect() scans each level with
+C-level str.find and stops at the first whole-word hit, so the answer is
+always the highest priority present and most texts cost a handful of
+substring scans. Keywords only match as whole words ("help" does not fire
+on "helpful").
+
+Detectors built from config.yaml are cached per channel and rebuilt when
+config.yaml is hot-reloaded:
+  get_detector()            — priority.keywords
+  get_detector("facebook")  — channels.facebook.priority_keywords (falls
+                              back to priority.keywords when unset)
+"""
+
+from config_loader import load_config, subscribe
+from keyword_match import PRIORITY_LEVELS, PriorityDetector  # noqa: F401 (re-exported)
+
+# channel (None = global) -> detector for the live config snapshot
+_detectors: dict[str | None, PriorityDetector] = {}
+
+
+def get_detector(channel: str | None = None) -> PriorityDetector:
+    detector = _detectors.get(channel)
+    if detector is None:
+        cfg = load_config()
+        keywords = cfg.get("priority", {}).get("keywords", {})
+        if channel is not None:
+            channel_cfg = cfg.get("channels", {}).get(channel, {})
+            keywords = channel_cfg.get("priority_keywords") or keywords
+        detector = PriorityDetector(keywords)
+        _detectors[channel] = detector
+    return detector
+
+
+def _on_config_reload(_new_config: dict, _old_config: dict) -> None:
+    _detectors.clear()
+
+
+subscribe(_on_config_reload)
@@ -4,18 +4,15 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+from log_writer import write_entry
+
 VAULT_PATH = Path(__file__).parent.resolve()
 WATCHER_PATH = VAULT_PATH / "watcher.py"
 
 def log(msg: str) -> None:
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     print(f"[{timestamp}] {msg}")
-    logs_dir = VAULT_PATH / "Logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
-    log_file = logs_dir / f"{datetime.now().strftime('%Y-%m-%d')}.md"
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(f"## {datetime.now().strftime('%H:%M')} - Process Manager\n")
-        f.write(f"- {msg}\n")
+    write_entry(VAULT_PATH / "Logs", "Process Manager", [msg])
 
 def main() -> None:
     if not WATCHER_PATH.exists():
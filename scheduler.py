@@ -9,6 +9,7 @@ from datetime import datetime
 from pathlib import Path
 
 from croniter import croniter
+from atomic_write import write_text_atomic
 from config_loader import load_config, get_path, log_event
 
 VAULT_PATH = Path(__file__).parent.resolve()
@@ -69,7 +70,7 @@ def create_scheduled_task(name: str, template: str, priority: str) -> Path:
         "",
         f"*Auto-generated by scheduler at {now.strftime('%H:%M')}*",
     ]
-    filepath.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    write_text_atomic(filepath, "\n".join(lines) + "\n")
     return filepath
 
 
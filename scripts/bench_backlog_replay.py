@@ -0,0 +1,112 @@
+"""
+Inbox Backlog Replay Benchmark
+Writes a synthetic Facebook inbox backlog to a temp folder and replays it the
+old way (glob, then convert every file serially before new events are read)
+and with BacklogReplay. In both runs one fresh event arrives shortly after
+startup; reports total replay time and how long that fresh event waited for
+its task file. A second BacklogReplay pass shows the checkpoint skipping the
+files it already converted.
+
+Usage:
+  python scripts/bench_backlog_replay.py [--events 5000] [--concurrency 4]
+"""
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+VAULT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(VAULT))
+
+import backlog_replay  # noqa: E402
+from backlog_replay import BacklogReplay  # noqa: E402
+from channel_adapters import get_adapter  # noqa: E402
+
+
+def make_backlog(inbox: Path, events: int) -> None:
+    inbox.mkdir(parents=True)
+    for i in range(events):
+        (inbox / f"event_{i:06d}.json").write_text(json.dumps({
+            "type": "comment", "from": f"User {i}", "page": "Bench Page",
+            "message": "Is this still available?", "timestamp": "2026-01-01T00:00:00",
+        }))
+
+
+def drop_fresh(inbox: Path) -> Path:
+    path = inbox / "fresh_p0.json"
+    path.write_text(json.dumps({"type": "message", "from": "VIP", "message": "URGENT: site is down"}))
+    return path
+
+
+def serial(inbox: Path, out: Path, convert) -> tuple[float, float]:
+    start = time.perf_counter()
+    fresh = None
+    for i, path in enumerate(sorted(inbox.glob("*.json"))):
+        if i == 10:
+            fresh = drop_fresh(inbox)
+            arrived = time.perf_counter()
+        convert(path, out)
+    # The observer only starts after the backlog, so the fresh event is read now
+    convert(fresh, out)
+    done = time.perf_counter()
+    return done - start, done - arrived
+
+
+def replayed(inbox: Path, out: Path, convert, concurrency: int) -> tuple[float, float, BacklogReplay]:
+    fresh_done = threading.Event()
+
+    def handle(path: Path) -> None:
+        convert(path, out)
+        if path.name == "fresh_p0.json":
+            fresh_done.set()
+
+    replay = BacklogReplay("bench", inbox, handle, concurrency=concurrency)
+    start = time.perf_counter()
+    replay.start()
+    time.sleep(0.01)
+    fresh = drop_fresh(inbox)
+    arrived = time.perf_counter()
+    if not replay.offer(fresh):
+        handle(fresh)
+    fresh_done.wait()
+    waited = time.perf_counter() - arrived
+    replay.wait()
+    return time.perf_counter() - start, waited, replay
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark inbox backlog replay")
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    adapter = get_adapter("facebook")
+    print(f"Backlog: {args.events} Facebook events, concurrency {args.concurrency}")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        backlog_replay.CHECKPOINT_DIR = tmp / "Secrets"
+        backlog_replay.log_event = lambda *args, **kwargs: None  # keep the vault log clean
+        with contextlib.redirect_stdout(io.StringIO()):
+            make_backlog(tmp / "serial_inbox", args.events)
+            total, waited = serial(tmp / "serial_inbox", tmp / "serial_out", adapter.convert)
+        print(f"{'Serial':<14} total {total:7.2f} s   fresh event waited {waited * 1000:8.1f} ms")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            make_backlog(tmp / "inbox", args.events)
+            total, waited, replay = replayed(tmp / "inbox", tmp / "out", adapter.convert, args.concurrency)
+        print(f"{'BacklogReplay':<14} total {total:7.2f} s   fresh event waited {waited * 1000:8.1f} ms   {replay.stats}")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            again = BacklogReplay("bench", tmp / "inbox", lambda p: adapter.convert(p, tmp / "out"),
+                                  concurrency=args.concurrency).run()
+        print(f"{'Restart':<14} total {time.perf_counter() - start:7.2f} s   {again}")
+
+
+if __name__ == "__main__":
+    main()
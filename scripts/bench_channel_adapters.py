@@ -0,0 +1,134 @@
+"""
+Channel Adapter Throughput Benchmark
+Writes a synthetic Channels backlog of Facebook events to a temp folder and
+converts it three ways: the original facebook_event_to_task (loaded from
+git, the repository's first commit by default), the adapter one file at a
+time, and the adapter's convert_many batch. Reports events/sec and how many
+task files differ from the original's output.
+
+The adapter's priority rule is not the original's: keywords are matched as
+whole words from config.yaml and can only raise the event's own priority,
+where the original matched four hard-coded substrings and always set P1.
+Differing files are expected wherever those rules disagree.
+
+convert_many syncs each chunk to disk (atomic_write.write_many_atomic);
+the original and the per-file path do not, so on a real disk the batch
+number includes that durability cost.
+
+Usage:
+  python scripts/bench_channel_adapters.py [--events 10000] [--baseline REF]
+"""
+import argparse
+import contextlib
+import io
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+VAULT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(VAULT))
+
+from channel_adapters import get_adapter  # noqa: E402
+
+MESSAGES = [
+    "Love your product! Where can I buy?",
+    "My order is late, please help asap",
+    "Great post, thanks for sharing",
+    "Is this still available?",
+    "Critical issue with checkout page",
+    "Very helpful video, thanks",  # "help" substring: P1 originally, P2 as a whole word
+]
+
+
+def load_baseline(ref: str):
+    """The original facebook_watcher module, read from git at ref.
+
+    Its facebook_event_to_task is the pre-adapter converter, unmodified; it
+    writes to the module's NEEDS_ACTION, which the caller points elsewhere.
+    """
+    source = subprocess.run(
+        ["git", "-C", str(VAULT), "show", f"{ref}:facebook_watcher.py"],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    module = types.ModuleType("baseline_facebook_watcher")
+    module.__file__ = str(VAULT / "facebook_watcher.py")
+    exec(compile(source, f"{ref}:facebook_watcher.py", "exec"), module.__dict__)
+    return module
+
+
+def root_commit() -> str:
+    return subprocess.run(
+        ["git", "-C", str(VAULT), "rev-list", "--max-parents=0", "HEAD"],
+        capture_output=True, text=True, check=True,
+    ).stdout.split()[0]
+
+
+def make_backlog(inbox: Path, count: int) -> list[Path]:
+    rng = random.Random(22)
+    inbox.mkdir(parents=True)
+    paths = []
+    for i in range(count):
+        path = inbox / f"evt_{i:06d}.json"
+        path.write_text(json.dumps({
+            "type": rng.choice(["comment", "message", "page_mention"]),
+            "from": f"User {i}",
+            "message": rng.choice(MESSAGES),
+            "page": "My Business Page",
+            "timestamp": "2026-02-19T10:00:00Z",
+        }), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def without_priority(task: str) -> str:
+    return "\n".join(line for line in task.splitlines() if not line.startswith("priority:"))
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark channel adapters")
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--baseline", default=None, help="git ref of the original converter (default: first commit)")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline or root_commit())
+    adapter = get_adapter("facebook")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        paths = make_backlog(tmp / "Facebook_Inbox", args.events)
+        legacy_out, single_out, batch_out = tmp / "legacy", tmp / "single", tmp / "batch"
+
+        baseline.NEEDS_ACTION = legacy_out
+        legacy = timed(lambda: [baseline.facebook_event_to_task(p) for p in paths])
+        single = timed(lambda: [adapter.convert(p, single_out) for p in paths])
+        batch = timed(lambda: adapter.convert_many(paths, batch_out))
+
+        differing = other = 0
+        for p in paths:
+            original = (legacy_out / f"FACEBOOK_{p.stem}.md").read_text(encoding="utf-8")
+            converted = (batch_out / f"FACEBOOK_{p.stem}.md").read_text(encoding="utf-8")
+            if original != converted:
+                differing += 1
+                other += without_priority(original) != without_priority(converted)
+
+    n = args.events
+    print(f"Events: {n}")
+    print(f"Original converter:    {n / legacy:10,.0f} events/s")
+    print(f"Adapter, per file:     {n / single:10,.0f} events/s  ({legacy / single:.1f}x)")
+    print(f"Adapter convert_many:  {n / batch:10,.0f} events/s  ({legacy / batch:.1f}x, synced)")
+    print(f"Task files differing:  {differing}  ({other} outside the priority line)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Priority Detector Micro-Benchmark
+Compares the shared PriorityDetector against the per-module keyword loops it
+replaced (config_loader.get_priority_from_keywords and the Gold-tier
+_detect_priority), on WhatsApp-sized messages (~80 chars) and email bodies
+(~2KB), and reports where the two disagree (whole-word matching is stricter).
+
+Usage:
+  python scripts/bench_priority.py [--messages 20000] [--emails 3000]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+VAULT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(VAULT))
+
+from config_loader import load_config  # noqa: E402
+from keyword_match import PriorityDetector  # noqa: E402
+
+VOCAB = (
+    "hi team please find the attached report for this week we reviewed the "
+    "client feedback and the internal notes meeting tomorrow at noon thanks "
+    "regards update schedule project timeline budget review approval invoice "
+    "payment call back when you can let me know"
+).split()
+
+
+def legacy_detect(text: str, keywords: dict[str, str]) -> str | None:
+    """The pre-detector loop, kept here as the reference implementation."""
+    text_lower = text.lower()
+    best = None
+    for word, prio in keywords.items():
+        if word in text_lower:
+            if best is None or prio < best:
+                best = prio
+    return best
+
+
+def make_texts(count: int, words: int, keywords: list[str], hit_rate: float) -> list[str]:
+    rng = random.Random(207)
+    texts = []
+    for _ in range(count):
+        body = [rng.choice(VOCAB) for _ in range(words)]
+        if rng.random() < hit_rate:
+            body[rng.randrange(words)] = rng.choice(keywords).capitalize()
+        texts.append(" ".join(body))
+    return texts
+
+
+def bench(fn, texts: list[str]) -> float:
+    start = time.perf_counter()
+    for t in texts:
+        fn(t)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark priority keyword detection")
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--emails", type=int, default=3000)
+    args = parser.parse_args()
+
+    keywords = load_config().get("priority", {}).get("keywords", {})
+    detector = PriorityDetector(keywords)
+    corpora = {
+        "WhatsApp (~80 chars)": make_texts(args.messages, 14, list(keywords), 0.1),
+        "Email (~2KB)": make_texts(args.emails, 350, list(keywords), 0.3),
+    }
+
+    for label, texts in corpora.items():
+        legacy_rate = bench(lambda t: legacy_detect(t, keywords), texts)
+        detector_rate = bench(detector.detect, texts)
+        mismatches = sum(1 for t in texts if legacy_detect(t, keywords) != detector.detect(t))
+        print(label)
+        print(f"  Legacy loop:       {legacy_rate:12,.0f} texts/s")
+        print(f"  PriorityDetector:  {detector_rate:12,.0f} texts/s  ({detector_rate / legacy_rate:.1f}x)")
+        print(f"  Disagreements:     {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
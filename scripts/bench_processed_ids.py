@@ -0,0 +1,101 @@
+"""
+Processed-ID Dedup Benchmark
+Polls synthetic Gmail message IDs against a temporary SQLite database and
+compares the per-message path (one SELECT + one INSERT/flush per message)
+with the batch path (one IN (...) SELECT + one multi-row INSERT per batch),
+counting the SQL statements each one sends.
+
+Usage:
+  python scripts/bench_processed_ids.py [--messages 500] [--seen 100]
+"""
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+VAULT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(VAULT))
+
+from sqlalchemy import event, func, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from backend.database import Base  # noqa: E402
+from backend.models.gmail_message import ProcessedGmailMessage  # noqa: E402
+from backend.services.gmail_service import (  # noqa: E402
+    _find_processed,
+    _is_duplicate,
+    _mark_processed,
+    _mark_processed_many,
+)
+
+
+async def per_message(db: AsyncSession, ids: list[str]) -> int:
+    created = 0
+    for gmail_id in ids:
+        if await _is_duplicate(db, gmail_id):
+            continue
+        await _mark_processed(db, gmail_id)
+        created += 1
+    return created
+
+
+async def batched(db: AsyncSession, ids: list[str]) -> int:
+    already = await _find_processed(db, ids)
+    new_ids = [i for i in ids if i not in already]
+    await _mark_processed_many(db, new_ids)
+    await db.flush()
+    return len(new_ids)
+
+
+async def run(name: str, fn, messages: int, seen: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/bench.db")
+        Session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        ids = [f"msg{i:06d}" for i in range(messages)]
+        async with Session() as db:
+            await _mark_processed_many(db, ids[:seen])
+            await db.commit()
+
+        statements = 0
+
+        def count(*_args):
+            nonlocal statements
+            statements += 1
+
+        event.listen(engine.sync_engine, "before_cursor_execute", count)
+        async with Session() as db:
+            start = time.perf_counter()
+            created = await fn(db, ids)
+            await db.commit()
+            elapsed = time.perf_counter() - start
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+        async with Session() as db:
+            total = (await db.execute(select(func.count(ProcessedGmailMessage.id)))).scalar_one()
+        await engine.dispose()
+
+    print(f"{name:<12} {statements:6d} statements  {elapsed * 1000:8.1f} ms  "
+          f"new={created} rows={total}")
+
+
+async def main_async(messages: int, seen: int) -> None:
+    print(f"Messages: {messages} ({seen} already processed)")
+    await run("Per-message", per_message, messages, seen)
+    await run("Batched", batched, messages, seen)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark processed-ID dedup")
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--seen", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.messages, args.seen))
+
+
+if __name__ == "__main__":
+    main()
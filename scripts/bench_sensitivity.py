@@ -0,0 +1,114 @@
+"""
+Sensitivity Scorer Micro-Benchmark
+Compares the precompiled SensitivityMatcher against the original per-keyword
+loop + full re.findall tokenization on ~5KB email bodies (the Gmail poller
+passes up to 5000 chars per message), and checks both give identical results.
+
+Usage:
+  python scripts/bench_sensitivity.py [--messages 2000] [--size 5000]
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+VAULT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(VAULT))
+
+from config_loader import load_config  # noqa: E402
+from sensitivity_scorer import (  # noqa: E402
+    CONTEXT_BOOST,
+    CONTEXT_REDUCE,
+    KEYWORD_CATEGORIES,
+    get_matcher,
+)
+
+VOCAB = (
+    "hi team please find the attached report for this week we reviewed the "
+    "client feedback and the internal notes meeting tomorrow at noon thanks "
+    "invoice payment email access draft production database reset share "
+    "regards update schedule project timeline budget review approval"
+).split()
+
+
+def legacy_score(text: str, config: dict) -> dict:
+    """The pre-matcher algorithm, kept here as the reference implementation."""
+    sens_cfg = config.get("sensitivity", {})
+    weights = sens_cfg.get("keywords_weighted", {})
+    threshold = sens_cfg.get("threshold", 0.6)
+    text_lower = text.lower()
+    words = set(re.findall(r"\w+", text_lower))
+    signals = []
+    category_scores: dict[str, float] = {}
+    total_score = 0.0
+    for keyword, weight in weights.items():
+        if keyword in text_lower:
+            signals.append(f"{keyword} (+{weight})")
+            total_score += weight
+            cat = KEYWORD_CATEGORIES.get(keyword, "unknown")
+            category_scores[cat] = category_scores.get(cat, 0) + weight
+    for (w1, w2), modifier in CONTEXT_BOOST.items():
+        if w1 in words and w2 in words:
+            total_score += modifier
+            signals.append(f"context({w1}+{w2}) (+{modifier})")
+    for (w1, w2), modifier in CONTEXT_REDUCE.items():
+        if w1 in words and w2 in words:
+            total_score += modifier
+            signals.append(f"context({w1}+{w2}) ({modifier})")
+    score = min(1.0, max(0.0, total_score))
+    top_category = max(category_scores, key=category_scores.get) if category_scores else "none"
+    return {
+        "score": round(score, 2),
+        "category": top_category,
+        "signals": signals,
+        "requires_approval": score >= threshold,
+    }
+
+
+def make_bodies(count: int, size: int) -> list[str]:
+    rng = random.Random(207)
+    bodies = []
+    for _ in range(count):
+        words = []
+        length = 0
+        while length < size:
+            w = rng.choice(VOCAB)
+            if rng.random() < 0.05:
+                w = w.capitalize() + rng.choice([".", ",", "s", "ing"])
+            words.append(w)
+            length += len(w) + 1
+        bodies.append(" ".join(words)[:size])
+    return bodies
+
+
+def bench(fn, bodies: list[str]) -> float:
+    start = time.perf_counter()
+    for b in bodies:
+        fn(b)
+    return len(bodies) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sensitivity scoring")
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=5000)
+    args = parser.parse_args()
+
+    config = load_config()
+    matcher = get_matcher(config)
+    bodies = make_bodies(args.messages, args.size)
+
+    mismatches = sum(1 for b in bodies if legacy_score(b, config) != matcher.score(b))
+    legacy_rate = bench(lambda b: legacy_score(b, config), bodies)
+    matcher_rate = bench(matcher.score, bodies)
+
+    print(f"Bodies: {len(bodies)} x {args.size} chars")
+    print(f"Legacy loop:         {legacy_rate:10,.0f} msg/s")
+    print(f"SensitivityMatcher:  {matcher_rate:10,.0f} msg/s  ({matcher_rate / legacy_rate:.1f}x)")
+    print(f"Result mismatches:   {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
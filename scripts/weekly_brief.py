@@ -3,16 +3,21 @@ Weekly Briefing Script — Gold/Platinum Tier
 Reads Accounting/transactions.csv → generates CEO_Briefing.md + Reports/weekly_YYYYMMDD.md
 """
 import csv
+import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 
 VAULT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(VAULT))
+
+from config_loader import log_event  # noqa: E402
+from log_writer import flush_logs  # noqa: E402
+
 REPORTS = VAULT / "Reports"
 REPORTS.mkdir(exist_ok=True)
 ACCOUNTING = VAULT / "Accounting"
 CSV_PATH = ACCOUNTING / "transactions.csv"
 CEO_BRIEF = VAULT / "CEO_Briefing.md"
-LOG_PATH = VAULT / "Logs" / f"{datetime.now().strftime('%Y-%m-%d')}.md"
 
 
 def read_transactions():
@@ -88,16 +93,14 @@ tier: platinum
     report_file = REPORTS / f"weekly_{now.strftime('%Y%m%d')}.md"
     report_file.write_text(report, encoding="utf-8")
 
-    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with LOG_PATH.open("a", encoding="utf-8") as log:
-        log.write(
-            f"\n## {now.strftime('%H:%M')} - Weekly Briefing Generated\n"
-            f"- Revenue: Rs. {revenue:,.0f}\n"
-            f"- Expenses: Rs. {expenses:,.0f}\n"
-            f"- Net: Rs. {net:,.0f}\n"
-            f"- Pending approvals: {pending}\n"
-            f"- Saved: {CEO_BRIEF} + {report_file}\n"
-        )
+    log_event("Weekly Briefing Generated", [
+        f"Revenue: Rs. {revenue:,.0f}",
+        f"Expenses: Rs. {expenses:,.0f}",
+        f"Net: Rs. {net:,.0f}",
+        f"Pending approvals: {pending}",
+        f"Saved: {CEO_BRIEF} + {report_file}",
+    ])
+    flush_logs()
 
     print(f"[OK] CEO Briefing written: {CEO_BRIEF}")
     print(f"[OK] Weekly report: {report_file}")
@@ -0,0 +1,114 @@
+"""
+AI Employee Vault — Low-Priority Task Batcher (Silver Tier)
+Groups near-identical P2/P3 tasks (same source + type) into one LLM call.
+
+The batch prompt asks for a JSON array with one result per task; results are
+fanned back out to /Tasks plans and /Done (or /Pending_Approval when the local
+sensitivity scorer flags them), exactly like the local reasoner does.
+"""
+
+import json
+from pathlib import Path
+
+from config_loader import load_config, log_event
+from frontmatter_index import get_frontmatter, parse_frontmatter
+from local_reasoner import write_approval, write_done, write_plan
+from sensitivity_scorer import score_sensitivity
+
+
+def get_batching_config() -> dict:
+    cfg = load_config().get("watcher", {}).get("batching", {})
+    return {
+        "enabled": bool(cfg.get("enabled", False)),
+        "priorities": set(cfg.get("priorities", ["P2", "P3"])),
+        "window_seconds": float(cfg.get("window_seconds", 5)),
+        "max_batch_size": int(cfg.get("max_batch_size", 20)),
+    }
+
+
+def batch_key(entry: dict, priorities: set[str]) -> tuple[str, str] | None:
+    """(source, type) for a batchable queue entry, or None.
+
+    WhatsApp tasks are never batched — each needs its own Outbox reply.
+    """
+    if entry.get("priority") not in priorities:
+        return None
+    path = Path(entry["path"])
+    if path.name.upper().startswith("WHATSAPP_"):
+        return None
+    meta = get_frontmatter(path)
+    source = meta.get("source") or path.name.split("_", 1)[0]
+    task_type = meta.get("type", "task")
+    return source.lower(), task_type.lower()
+
+
+def build_batch_prompt(tasks: list[tuple[str, dict, str]]) -> str:
+    """Prompt for a batch of (filename, meta, body) tasks."""
+    lines = [
+        f"You are processing a batch of {len(tasks)} similar low-priority tasks.",
+        "Follow SKILL.md and Company_Handbook.md. Do NOT create or edit any files —",
+        "the watcher writes plans and results from your answer.",
+        "",
+        "Respond with ONLY a JSON array, one object per task, in this shape:",
+        '[{"task": "<filename>", "summary": "<one line>", "result": "<draft reply or outcome>"}]',
+        "",
+    ]
+    for i, (filename, meta, body) in enumerate(tasks, 1):
+        lines.append(f"### Task {i}: {filename}")
+        for k in ("source", "type", "from", "subject", "priority"):
+            if meta.get(k):
+                lines.append(f"{k}: {meta[k]}")
+        lines.append(body.strip()[:2000])
+        lines.append("")
+    return "\n".join(lines)
+
+
+def parse_batch_results(output: str) -> dict[str, dict]:
+    """Map filename -> result object from the LLM's JSON array (tolerates prose around it)."""
+    start, end = output.find("["), output.rfind("]")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        items = json.loads(output[start:end + 1])
+    except json.JSONDecodeError:
+        return {}
+    return {
+        str(item["task"]): item
+        for item in items
+        if isinstance(item, dict) and item.get("task")
+    }
+
+
+def read_task(path: Path) -> tuple[dict, str]:
+    return parse_frontmatter(path.read_text(encoding="utf-8"))
+
+
+def fan_out(path: Path, meta: dict, body: str, result: dict, batch_size: int) -> None:
+    """Write plan + Done/approval for one task from its batch result, then clear it."""
+    stem = path.stem
+    priority = meta.get("priority", "P2")
+    summary = str(result.get("summary") or meta.get("subject") or stem)
+    outcome = str(result.get("result", "")).strip()
+    sensitivity_result = score_sensitivity(f"{summary} {body}")
+
+    write_plan(stem, summary, sensitivity_result, priority)
+    if sensitivity_result["requires_approval"]:
+        write_approval(stem, summary, sensitivity_result, priority)
+        log_event("Approval Requested", [
+            f"Task: {stem}",
+            f"Priority: {priority}",
+            f"Sensitivity: {sensitivity_result['category']} (score: {sensitivity_result['score']})",
+            f"Batch size: {batch_size}",
+        ])
+    else:
+        write_done(stem, priority, sensitivity_result, f"# {summary}\n\n{outcome or 'Draft prepared and completed.'}")
+        log_event("Task Processed", [
+            f"Task: {stem}",
+            f"Priority: {priority}",
+            f"Batch size: {batch_size}",
+            "Result: processed by Claude (batched)",
+        ])
+    try:
+        path.unlink()
+    except OSError:
+        pass
@@ -0,0 +1,213 @@
+"""
+AI Employee Vault — Persistent Task Queue (Silver Tier)
+Heap-backed priority queue for /Needs_Action with an append-only journal.
+
+Ordering: priority (P0 → P3), then SLA deadline, then arrival time.
+The journal (task_queue.jsonl) records every push/pop so the queue order —
+including original arrival times — survives a watcher restart.
+"""
+
+import heapq
+import json
+import threading
+from datetime import datetime
+from itertools import count
+from pathlib import Path
+
+VAULT_PATH = Path(__file__).parent.resolve()
+JOURNAL_FILE = VAULT_PATH / "task_queue.jsonl"
+
+PRIORITY_ORDER = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
+
+
+class TaskQueue:
+    """Thread-safe priority queue of task file paths, journaled to disk."""
+
+    def __init__(self, journal_file: Path | None = JOURNAL_FILE):
+        self.journal_file = journal_file
+        self._heap: list[tuple] = []
+        self._entries: dict[str, dict] = {}
+        self._seq = count()
+        self._journal_ops = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        if self.journal_file is not None:
+            self._load_journal()
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def push(
+        self,
+        filepath: str,
+        priority: str,
+        sla_deadline: datetime,
+        arrived_at: datetime | None = None,
+    ) -> bool:
+        """Add a task. Returns False if the path is already queued."""
+        filepath = str(filepath)
+        with self._cond:
+            if filepath in self._entries:
+                return False
+            entry = {
+                "path": filepath,
+                "priority": priority,
+                "sla_deadline": sla_deadline.isoformat(timespec="seconds"),
+                "arrived_at": (arrived_at or datetime.now()).isoformat(timespec="seconds"),
+            }
+            self._insert(entry)
+            self._append_journal({"op": "push", **entry})
+            self._cond.notify()
+            return True
+
+    def pop(self, timeout: float | None = None) -> dict | None:
+        """Block until a task is available and return its entry.
+
+        Returns None on timeout or once the queue has been closed.
+        """
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                while self._heap:
+                    *_, filepath = heapq.heappop(self._heap)
+                    entry = self._entries.pop(filepath, None)
+                    if entry is None:
+                        continue  # stale heap slot from a discard()
+                    self._append_journal({"op": "pop", "path": filepath})
+                    return entry
+                if not self._cond.wait(timeout):
+                    return None
+
+    def peek(self) -> dict | None:
+        """The entry pop() would return next, without removing it."""
+        with self._cond:
+            while self._heap:
+                filepath = self._heap[0][-1]
+                if filepath in self._entries:
+                    return self._entries[filepath]
+                heapq.heappop(self._heap)  # stale slot
+            return None
+
+    def take(self, predicate, limit: int) -> list[dict]:
+        """Remove and return up to `limit` queued entries matching predicate,
+        in queue order (used to gather a batch of similar tasks)."""
+        with self._cond:
+            # One pass over the heap, then only the matches are ordered
+            slots = [
+                slot for slot in self._heap
+                if slot[-1] in self._entries and predicate(self._entries[slot[-1]])
+            ]
+            matched = [self._entries[slot[-1]] for slot in heapq.nsmallest(limit, slots)]
+            for entry in matched:
+                del self._entries[entry["path"]]
+                self._append_journal({"op": "pop", "path": entry["path"]})
+            return matched
+
+    def discard(self, filepath: str) -> bool:
+        """Drop a queued task (e.g. the file was claimed elsewhere)."""
+        filepath = str(filepath)
+        with self._cond:
+            if self._entries.pop(filepath, None) is None:
+                return False
+            self._append_journal({"op": "pop", "path": filepath})
+            return True
+
+    def close(self) -> None:
+        """Wake every waiting consumer; subsequent pop() calls return None."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def __contains__(self, filepath: str) -> bool:
+        with self._cond:
+            return str(filepath) in self._entries
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._entries)
+
+    def depth_by_priority(self) -> dict[str, int]:
+        with self._cond:
+            return _count_by_priority(self._entries.values())
+
+    # ── Internals ─────────────────────────────────────────────────────────────
+
+    def _insert(self, entry: dict) -> None:
+        self._entries[entry["path"]] = entry
+        heapq.heappush(self._heap, (
+            PRIORITY_ORDER.get(entry["priority"], 2),
+            entry["sla_deadline"],
+            entry["arrived_at"],
+            next(self._seq),
+            entry["path"],
+        ))
+
+    def _load_journal(self) -> None:
+        """Replay the journal, drop tasks whose file is gone, then compact."""
+        for entry in _replay(self.journal_file):
+            if Path(entry["path"]).exists():
+                self._insert(entry)
+        self._compact()
+
+    def _append_journal(self, record: dict) -> None:
+        if self.journal_file is None:
+            return
+        try:
+            with self.journal_file.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._journal_ops += 1
+            # Keep the journal proportional to the live queue
+            if self._journal_ops > 2 * len(self._entries) + 100:
+                self._compact()
+        except OSError:
+            pass
+
+    def _compact(self) -> None:
+        if self.journal_file is None:
+            return
+        tmp = self.journal_file.with_suffix(".tmp")
+        try:
+            with tmp.open("w", encoding="utf-8") as f:
+                for entry in self._entries.values():
+                    f.write(json.dumps({"op": "push", **entry}, ensure_ascii=False) + "\n")
+            tmp.replace(self.journal_file)
+            self._journal_ops = len(self._entries)
+        except OSError:
+            pass
+
+
+def _replay(journal_file: Path) -> list[dict]:
+    """Return live queue entries recorded in a journal, in push order."""
+    live: dict[str, dict] = {}
+    if not journal_file.exists():
+        return []
+    with journal_file.open("r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn last line after a crash
+            path = record.pop("path", None)
+            if not path:
+                continue
+            if record.pop("op", "") == "push":
+                live[path] = {"path": path, **record}
+            else:
+                live.pop(path, None)
+    return list(live.values())
+
+
+def _count_by_priority(entries) -> dict[str, int]:
+    depth = {p: 0 for p in PRIORITY_ORDER}
+    for entry in entries:
+        prio = entry.get("priority", "P2")
+        depth[prio if prio in depth else "P2"] += 1
+    return depth
+
+
+def read_queue_depth(journal_file: Path = JOURNAL_FILE) -> dict[str, int]:
+    """Queue depth per priority as last journaled (for the dashboard)."""
+    try:
+        return _count_by_priority(_replay(journal_file))
+    except OSError:
+        return _count_by_priority([])
@@ -0,0 +1,490 @@
+"""Tests for the vault's root modules.
+
+Covers: task queue, frontmatter index, log writer and records, dedup store,
+atomic writes, completed-file events, backlog replay, channel adapters and
+the watchers' sync cursors. Everything runs against tmp_path; nothing
+touches the real vault folders.
+"""
+
+from datetime import datetime, timedelta
+
+
+# ── 1. Task queue ───────────────────────────────────────────────────────────
+
+def _push_all(queue, items):
+    t0 = datetime(2026, 1, 1)
+    for path, priority, minutes in items:
+        queue.push(path, priority, t0 + timedelta(minutes=minutes), t0)
+
+
+def test_task_queue_take_returns_matches_in_queue_order():
+    from task_queue import TaskQueue
+
+    queue = TaskQueue(journal_file=None)
+    _push_all(queue, [("a", "P3", 1), ("b", "P2", 30), ("c", "P2", 10), ("d", "P2", 20)])
+
+    taken = queue.take(lambda e: e["priority"] == "P2", 2)
+    assert [e["path"] for e in taken] == ["c", "d"]
+    assert "c" not in queue and len(queue) == 2
+    # Taken entries leave stale heap slots that pop() skips
+    assert [queue.pop(0)["path"], queue.pop(0)["path"]] == ["b", "a"]
+
+
+def test_task_queue_replays_its_journal_after_a_crash(tmp_path):
+    import json
+
+    from task_queue import TaskQueue, read_queue_depth
+
+    files = {name: tmp_path / f"{name}.md" for name in "abcd"}
+    for name in "abc":
+        files[name].write_text("task")  # d's file is gone by the restart
+    journal = tmp_path / "task_queue.jsonl"
+    lines = [
+        {"op": "push", "path": str(files["a"]), "priority": "P2", "sla_deadline": "2026-01-01T10:00:00", "arrived_at": "2026-01-01T09:00:00"},
+        {"op": "push", "path": str(files["b"]), "priority": "P1", "sla_deadline": "2026-01-01T12:00:00", "arrived_at": "2026-01-01T09:01:00"},
+        {"op": "push", "path": str(files["c"]), "priority": "P0", "sla_deadline": "2026-01-01T09:30:00", "arrived_at": "2026-01-01T09:02:00"},
+        {"op": "push", "path": str(files["d"]), "priority": "P0", "sla_deadline": "2026-01-01T09:30:00", "arrived_at": "2026-01-01T09:03:00"},
+        {"op": "pop", "path": str(files["c"])},
+    ]
+    journal.write_text("".join(json.dumps(r) + "\n" for r in lines) + '{"op": "push", "path": "torn')
+
+    queue = TaskQueue(journal_file=journal)
+    assert len(queue) == 2
+    first = queue.pop(0)
+    assert first["path"] == str(files["b"])
+    assert first["arrived_at"] == "2026-01-01T09:01:00"  # original arrival time kept
+    # Reload compacted the journal: the torn line and the missing file are gone
+    assert read_queue_depth(journal) == {"P0": 0, "P1": 0, "P2": 1, "P3": 0}
+    assert [e["path"] for e in TaskQueue(journal_file=journal).take(lambda e: True, 5)] == [str(files["a"])]
+
+
+# ── 2. Warm LLM worker requests ─────────────────────────────────────────────
+
+def test_worker_timeout_after_send_is_not_retried_or_rerun(monkeypatch):
+    import socket
+    import subprocess
+
+    import pytest
+
+    import watcher
+    from anthropic_runner import WorkerRequestError, WorkerUnavailable, request_worker
+
+    # Refused connection: nothing was sent, so the CLI may take the prompt
+    with socket.socket() as free:
+        free.bind(("127.0.0.1", 0))
+        closed_port = free.getsockname()[1]
+    with pytest.raises(WorkerUnavailable):
+        request_worker("hi", 1, "127.0.0.1", closed_port)
+
+    # Accepted but unanswered: the worker is still running the prompt
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        port = server.getsockname()[1]
+        with pytest.raises(WorkerRequestError):
+            request_worker("hi", 0.2, "127.0.0.1", port)
+
+        ran = []
+        monkeypatch.setattr(watcher, "request_worker", lambda p, t: request_worker(p, t, "127.0.0.1", port))
+        monkeypatch.setattr(subprocess, "run", lambda *a, **k: ran.append(a))
+        with pytest.raises(WorkerRequestError):
+            watcher.run_llm("hi", 0.2, use_worker=True)
+        assert ran == []
+
+
+# ── 3. Backlog replay ───────────────────────────────────────────────────────
+
+def test_backlog_replay_checkpoint_is_written_before_wait_returns(tmp_path, monkeypatch):
+    import json
+    import threading
+    import time
+
+    import backlog_replay
+    from backlog_replay import BacklogReplay
+
+    monkeypatch.setattr(backlog_replay, "CHECKPOINT_DIR", tmp_path / "Secrets")
+    monkeypatch.setattr(backlog_replay, "log_event", lambda *args, **kwargs: None)
+    write = backlog_replay.write_text_atomic
+
+    def slow_write(*args, **kwargs):  # widen the window a premature wait() return would hit
+        time.sleep(0.2)
+        return write(*args, **kwargs)
+
+    monkeypatch.setattr(backlog_replay, "write_text_atomic", slow_write)
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    for i in range(50):
+        (inbox / f"event_{i:02d}.json").write_text("{}")
+
+    handled = []
+    lock = threading.Lock()
+
+    def handle(path):
+        with lock:
+            handled.append(path.name)
+
+    replay = BacklogReplay("test", inbox, handle, concurrency=3, checkpoint_every=1000).start()
+    replay.offer(inbox / "event_07.json")
+    assert replay.wait(10)
+    checkpoint = json.loads((tmp_path / "Secrets" / "replay_test.json").read_text())
+    assert sorted(checkpoint) == sorted(set(handled)) and len(checkpoint) == 50
+    assert not replay.offer(inbox / "late.json")  # finished: the caller handles it
+
+    again = BacklogReplay("test", inbox, handle, concurrency=3).run()
+    assert again["replayed"] == 0 and again["skipped"] == 50
+
+
+# ── 4. WhatsApp message keys ────────────────────────────────────────────────
+
+class _Page:
+    def wait_for_timeout(self, ms):
+        pass
+
+
+def test_whatsapp_push_keys_survive_cycles_without_a_report(tmp_path):
+    import pytest
+
+    pytest.importorskip("base_watcher")
+    from dedup_store import DedupStore
+    from whatsapp_playwright_watcher import WhatsAppWatcher
+
+    watcher = WhatsAppWatcher.__new__(WhatsAppWatcher)
+    watcher.seen_messages = DedupStore("whatsapp", db_path=tmp_path / "dedup.sqlite")
+    watcher._unread_chats = {}
+    watcher._pushed = None
+    watcher.page = _Page()
+
+    def cycle(*reports):
+        for report in reports:
+            watcher._on_unread_push(None, report)
+        events = watcher._pushed_messages()
+        for event in events:
+            watcher.seen_messages.add(event["key"])
+        return [event["message"] for event in events]
+
+    assert cycle([{"name": "Ali", "message": "ok", "time": "23:59", "unread": "1"}]) == ["ok"]
+    assert cycle() == []  # no report this cycle: Ali is still unread
+    # Label rollover on a chat that stayed unread is the same message
+    assert cycle([{"name": "Ali", "message": "ok", "time": "Yesterday", "unread": "1"}]) == []
+    # Only the latest of several queued reports counts
+    assert cycle(
+        [{"name": "Ali", "message": "ok", "time": "Yesterday", "unread": "1"},
+         {"name": "Sara", "message": "hi", "time": "00:01", "unread": "1"}],
+        [{"name": "Sara", "message": "hi", "time": "00:01", "unread": "1"}],
+    ) == ["hi"]
+    # Ali dropped out of the report: read, so the same text later is new
+    assert cycle([{"name": "Ali", "message": "ok", "time": "09:10", "unread": "1"}]) == ["ok"]
+
+
+# ── 5. Channel adapters ─────────────────────────────────────────────────────
+
+def test_convert_many_skips_a_vanished_file(tmp_path):
+    import json
+
+    from channel_adapters import get_adapter
+
+    inbox = tmp_path / "WhatsApp_Inbox"
+    inbox.mkdir()
+    (inbox / "a.json").write_text(json.dumps({"from": "Ali", "text": "hello"}))
+    (inbox / "c.txt").write_text("plain text drop")
+    paths = [inbox / "a.json", inbox / "gone.json", inbox / "c.txt"]
+
+    # raw_text adapters used to re-read the vanished file and abort the batch
+    written = get_adapter("whatsapp").convert_many(paths, tmp_path / "out", quiet=True)
+    assert len(written) == 2
+    assert all(p.name.startswith("WhatsApp_Inbox-") for p in written)
+    assert get_adapter("facebook").convert_many([inbox / "gone.json"], tmp_path / "fb") == []
+    assert get_adapter("whatsapp").convert(inbox / "gone.json", tmp_path / "out") is None
+
+
+def test_convert_matches_convert_many_and_follows_config_changes(tmp_path, monkeypatch):
+    import json
+
+    import channel_adapters
+    from channel_adapters import get_adapter
+
+    event = tmp_path / "Facebook_Inbox" / "evt.json"
+    event.parent.mkdir()
+    event.write_text(json.dumps({"type": "comment", "from": "Jo", "message": "Nice post", "timestamp": "2026-01-01"}))
+    adapter = get_adapter("facebook")
+
+    single = adapter.convert(event, tmp_path / "single")
+    batch = adapter.convert_many([event], tmp_path / "batch", quiet=True)[0]
+    assert single.name == batch.name
+    assert single.read_text(encoding="utf-8") == batch.read_text(encoding="utf-8")
+
+    # The cached base priority is dropped when a new config snapshot goes live
+    monkeypatch.setattr(channel_adapters, "load_config", lambda: {"channels": {"facebook": {"priority": "P3"}}})
+    assert "priority: P3" in adapter.convert(event, tmp_path / "single").read_text(encoding="utf-8")
+
+
+# ── 6. Sensitivity scoring ──────────────────────────────────────────────────
+
+def test_vault_and_backend_share_one_sensitivity_matcher():
+    import keyword_match
+    import sensitivity_scorer
+    from backend.services import sensitivity
+
+    assert sensitivity_scorer.SensitivityMatcher is keyword_match.SensitivityMatcher
+    assert isinstance(sensitivity._MATCHER, keyword_match.SensitivityMatcher)
+
+    config = {"sensitivity": {"keywords_weighted": dict(sensitivity.KEYWORDS_WEIGHTED), "threshold": 0.6}}
+    texts = [
+        "Send an invoice to the client for $500 payment",
+        "Email the internal team",
+        "",
+        "Delete the production database\0and its draft",
+        "Reset my password",
+    ]
+    batch = sensitivity_scorer.score_sensitivity_batch(texts, config)
+    assert batch == [sensitivity_scorer.score_sensitivity(t, config) for t in texts]
+    assert batch == sensitivity.score_sensitivity_batch(texts)
+
+
+# ── 7. Frontmatter index ────────────────────────────────────────────────────
+
+def test_frontmatter_index_reparses_changed_files_and_persists(tmp_path):
+    import os
+
+    from frontmatter_index import FrontmatterIndex
+
+    folder = tmp_path / "Done"
+    folder.mkdir()
+    task = folder / "task.md"
+    task.write_text("---\ntype: email\npriority: P1\n---\nbody", encoding="utf-8")
+    (folder / "gone.md").write_text("---\ntype: note\n---\n", encoding="utf-8")
+    (folder / ".hidden.md").write_text("---\ntype: hidden\n---\n", encoding="utf-8")
+    index_file = tmp_path / ".frontmatter_index.json"
+
+    index = FrontmatterIndex(index_file)
+    assert sorted(meta["type"] for _, meta in index.scan(folder)) == ["email", "note"]
+    assert index.get(task) is index.get(task)  # unchanged file: served from the cache
+
+    task.write_text("---\ntype: email\npriority: P0\n---\nedited body", encoding="utf-8")
+    os.utime(task, ns=(0, 10**9))
+    assert index.get(task)["priority"] == "P0"
+
+    (folder / "gone.md").unlink()
+    assert [p.name for p, _ in index.scan(folder)] == ["task.md"]
+    index.save()
+
+    # A fresh process picks the saved entries up instead of re-reading the file
+    reloaded = FrontmatterIndex(index_file)
+    assert list(reloaded._entries) == [str(task)]
+    assert reloaded.get(task) == {"type": "email", "priority": "P0"}
+
+
+# ── 8. Log writer ───────────────────────────────────────────────────────────
+
+def test_log_writer_buffers_and_flushes_entries_in_order(tmp_path):
+    import pytest
+
+    from log_writer import LogWriter, format_entry
+
+    with pytest.raises(ValueError):
+        LogWriter(fsync="sometimes")
+
+    writer = LogWriter(flush_interval_ms=60_000, max_buffered=100)
+    day_a, day_b = tmp_path / "Logs" / "a.md", tmp_path / "Logs" / "b.md"
+    when = datetime(2026, 1, 1, 9, 5)
+    for i in range(3):
+        writer.append(day_a, format_entry(f"Entry {i}", [f"n={i}"], when))
+    writer.append(day_b, format_entry("Other day", when=when))
+    assert not day_a.exists()  # queued, not yet written
+
+    writer.close()
+    assert day_a.read_text(encoding="utf-8") == "".join(
+        f"## 09:05 - Entry {i}\n- n={i}\n" for i in range(3))
+    assert day_b.read_text(encoding="utf-8") == "## 09:05 - Other day\n"
+
+    # After close() appends go straight to disk
+    writer.append(day_b, "late\n")
+    assert day_b.read_text(encoding="utf-8").endswith("late\n")
+
+
+def test_log_writer_flushes_when_the_buffer_fills(tmp_path):
+    import time
+
+    from log_writer import LogWriter
+
+    writer = LogWriter(flush_interval_ms=60_000, max_buffered=2)
+    log_file = tmp_path / "day.md"
+    writer.append(log_file, "one\n")
+    writer.append(log_file, "two\n")
+    deadline = time.monotonic() + 5
+    while not (log_file.exists() and log_file.read_text(encoding="utf-8")) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert log_file.read_text(encoding="utf-8") == "one\ntwo\n"
+    writer.close()
+
+
+# ── 9. Log records ──────────────────────────────────────────────────────────
+
+def test_log_records_backfill_and_seek_by_hour(tmp_path):
+    from log_records import backfill_sidecar, load_index, read_range, record_file, record_line
+
+    day = "2026-01-05"
+    (tmp_path / f"{day}.md").write_text(
+        "# Log\n\n"
+        "## 08:10 - Task Processed\n- Task: early\n- Priority: P1\n\n"
+        "## 13:45 - Approval Requested\n- Task: late\n\n"
+        "## Notes\n- hand-written\n",
+        encoding="utf-8",
+    )
+    assert backfill_sidecar(tmp_path, day)
+    assert not backfill_sidecar(tmp_path, day)  # only one process creates it
+
+    # A partially written last line is left for the next reader
+    with record_file(tmp_path, day).open("a", encoding="utf-8") as f:
+        f.write('{"ts": "2026-01-05T15:0')
+    hours = load_index(tmp_path, day)["hours"]
+    assert sorted(hours) == ["00", "08", "13"]
+
+    records = read_range(tmp_path, datetime(2026, 1, 5, 13), datetime(2026, 1, 5, 23, 59))
+    assert [(r["event"], r["task"]) for r in records] == [("Approval Requested", "late")]
+    early = read_range(tmp_path, datetime(2026, 1, 5, 8), datetime(2026, 1, 5, 9))
+    assert early[0]["priority"] == "P1"
+
+    # Completing the line extends the index from where it stopped
+    with record_file(tmp_path, day).open("a", encoding="utf-8") as f:
+        f.write('0:00", "event": "Done", "task": "", "priority": "", "details": []}\n')
+        f.write(record_line({"ts": "2026-01-05T16:00:00", "event": "Later", "details": []}))
+    assert sorted(load_index(tmp_path, day)["hours"]) == ["00", "08", "13", "15", "16"]
+
+
+# ── 10. Dedup store ─────────────────────────────────────────────────────────
+
+def test_dedup_store_persists_per_namespace_and_expires_by_ttl(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    import dedup_store
+    from dedup_store import DedupStore
+
+    db = tmp_path / "dedup.sqlite"
+    gmail = DedupStore("gmail", ttl_seconds=60, db_path=db)
+    gmail.add_many(["msg-1", "msg-2"])
+    assert "msg-1" in gmail and "msg-3" not in gmail
+    gmail.close()
+
+    # A restarted watcher sees the same keys; other channels do not
+    again = DedupStore("gmail", ttl_seconds=60, db_path=db, cache_size=1)
+    whatsapp = DedupStore("whatsapp", ttl_seconds=60, db_path=db)
+    assert "msg-2" in again and "msg-1" in again
+    assert "msg-1" not in whatsapp and len(again) == 2
+
+    # Past the TTL a key counts as unseen (even from the LRU) and is pruned
+    later = dedup_store.time.time() + 120
+    monkeypatch.setattr(dedup_store, "time", SimpleNamespace(time=lambda: later))
+    assert "msg-1" not in again
+    assert again.prune() == 2 and len(again) == 0
+    again.close()
+    whatsapp.close()
+
+
+# ── 11. Atomic writes and completed-file events ─────────────────────────────
+
+def test_atomic_writes_replace_content_and_leave_no_temp_files(tmp_path, monkeypatch):
+    import os
+
+    import pytest
+
+    import atomic_write
+    from atomic_write import write_many_atomic, write_text_atomic
+
+    target = tmp_path / "task.md"
+    target.write_text("old", encoding="utf-8")
+    assert write_text_atomic(target, "new ✓") == target
+    assert target.read_text(encoding="utf-8") == "new ✓"
+
+    monkeypatch.setattr(atomic_write, "BATCH_CHUNK", 2)
+    paths = write_many_atomic([(tmp_path / f"{i}.md", f"task {i}") for i in range(5)])
+    assert [p.read_text(encoding="utf-8") for p in paths] == [f"task {i}" for i in range(5)]
+
+    # A failed rename cleans its temp file up and leaves the old content
+    def fail(src, dst):
+        raise OSError("rename failed")
+    monkeypatch.setattr(atomic_write.os, "replace", fail)
+    with pytest.raises(OSError):
+        write_text_atomic(target, "lost", fsync=False)
+    assert target.read_text(encoding="utf-8") == "new ✓"
+    assert not [name for name in os.listdir(tmp_path) if name.startswith(".")]
+
+
+def test_settle_timers_dispatch_quiet_files_once(tmp_path):
+    import os
+    import time
+
+    from file_events import SettleTimers
+
+    dispatched = []
+    timers = SettleTimers(dispatched.append, delay=0.05)
+
+    def wait_for(count):
+        deadline = time.monotonic() + 5
+        while len(dispatched) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    moved_in = tmp_path / "moved_in.md"
+    moved_in.write_text("task", encoding="utf-8")
+    timers.created(str(moved_in))
+    wait_for(1)
+    assert dispatched == [str(moved_in)]
+    # A close for the same, unchanged file must not dispatch it again
+    assert timers.settled(str(moved_in)) is False
+
+    # An empty file is still being written: skipped, its close dispatches it
+    empty = tmp_path / "empty.md"
+    empty.write_text("", encoding="utf-8")
+    timers.created(str(empty))
+    time.sleep(0.2)
+    assert dispatched == [str(moved_in)]
+    assert timers.settled(str(empty)) is True
+
+    # A close before the timer fires cancels it
+    closed = tmp_path / "closed.md"
+    closed.write_text("task", encoding="utf-8")
+    timers.created(str(closed))
+    assert timers.settled(str(closed)) is True
+    time.sleep(0.2)
+    assert dispatched == [str(moved_in)]
+
+    # Rewritten after a timer dispatch: the close is a new version, not a repeat
+    timers.created(str(moved_in))
+    wait_for(2)
+    with open(moved_in, "a", encoding="utf-8") as f:
+        f.write(" edited")
+    os.utime(moved_in, ns=(0, 10**9))
+    assert timers.settled(str(moved_in)) is True
+
+
+# ── 12. Gmail IMAP sync cursor ──────────────────────────────────────────────
+
+def test_gmail_last_uid_only_advances_past_contiguous_uids(tmp_path, monkeypatch):
+    import json
+
+    import pytest
+
+    pytest.importorskip("base_watcher")
+    import gmail_watcher
+    from gmail_watcher import GmailWatcher
+
+    sync_file = tmp_path / "imap_sync.json"
+    monkeypatch.setattr(gmail_watcher, "IMAP_SYNC_FILE", sync_file)
+    watcher = GmailWatcher.__new__(GmailWatcher)
+    watcher.sync_state = {"uidvalidity": 7, "last_uid": 10}
+    watcher._sync_uids = [11, 12, 13, 14]
+    watcher._done_uids = set()
+    watcher._uid_attempts = {12: 2}
+
+    # 12 and 14 finish first: nothing is safe to skip while 11 is pending
+    watcher._commit_uid(12)
+    watcher._commit_uid(14)
+    assert watcher.sync_state["last_uid"] == 10
+    assert not sync_file.exists()
+    assert 12 not in watcher._uid_attempts
+
+    watcher._commit_uid(11)
+    assert watcher.sync_state["last_uid"] == 12  # 13 failed and is fetched again
+    assert json.loads(sync_file.read_text())["last_uid"] == 12
+
+    watcher._commit_uid(13)
+    assert watcher.sync_state["last_uid"] == 14
+    assert watcher._sync_uids == []
@@ -1,37 +1,81 @@
 """
 AI Employee Vault — Dashboard Generator (Silver Tier)
 Enhanced with SLA performance, priority distribution, overdue tasks, and system config.
+
+Dashboard.md is rendered from a VaultState index: folder listings, priority
+distribution and SLA counters are kept as running totals and updated per file
+event, and only the sections touched by a change are re-rendered.
+`python update_dashboard.py` does a one-shot render; `--watch` keeps the
+engine running and refreshes on vault changes. Long-running processes (the
+watcher) use DashboardRefreshService to coalesce refresh requests.
 """
 
+import argparse
+import os
+import threading
+import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
 from config_loader import load_config, get_path
+from log_records import entry_header, record_file, tail_day
+from log_writer import flush_logs
+from frontmatter_index import get_frontmatter, save_index, scan_frontmatter
+from task_queue import read_queue_depth
 
 VAULT_PATH = Path(__file__).parent.resolve()
 
-
-def count_files(path: Path) -> int:
-    if not path.exists():
-        return 0
-    return sum(1 for p in path.iterdir() if p.is_file() and not p.name.startswith("."))
-
-
-def list_files(path: Path, max_items: int = 10) -> list[str]:
-    if not path.exists():
-        return []
-    items = [p.stem for p in path.iterdir() if p.is_file() and not p.name.startswith(".")]
-    return items[:max_items]
-
-
-def recent_activity(max_rows: int = 8) -> list[tuple[str, str, str]]:
+TRACKED_FOLDERS = ("inbox", "pending", "approved", "tasks", "done", "rejected")
+PRIO_LABELS = {"P0": "Critical", "P1": "High", "P2": "Medium", "P3": "Low"}
+
+# Sections in render order, and the folders whose changes make them stale.
+# Sections mapped to None depend on the clock, logs or the queue journal and
+# are re-rendered on every refresh (each is O(1) or bounded by today's log).
+SECTION_DEPENDENCIES: dict[str, tuple[str, ...] | None] = {
+    "status": None,
+    "priority": ("done",),
+    "sla": ("done",),
+    "overdue": None,
+    "active": ("tasks", "done"),
+    "pending": ("pending",),
+    "completed_today": None,
+    "recent_activity": None,
+    "queue_summary": TRACKED_FOLDERS,
+    "watcher_queue": None,
+    "lifetime": ("inbox", "pending", "approved", "done", "rejected"),
+    "system_config": (),
+}
+
+
+def recent_activity(max_rows: int = 8, tail_bytes: int = 16384) -> list[tuple[str, str, str]]:
+    flush_logs()  # include entries still buffered in this process
     logs_dir = get_path("logs")
     today = datetime.now().strftime("%Y-%m-%d")
     file = logs_dir / f"{today}.md"
     rows: list[tuple[str, str, str]] = []
-    if file.exists():
-        text = file.read_text(encoding="utf-8")
+    if record_file(logs_dir, today).exists():
+        # Structured sidecar: seek straight to the last hours of today
+        for r in tail_day(logs_dir, today, max_rows):
+            details = r["details"]
+            rows.append((
+                entry_header(r),
+                details[0] if details else "",
+                details[1] if len(details) > 1 else "",
+            ))
+    elif file.exists():
+        # Only the tail of today's log is needed for the last few entries
+        with file.open("rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - tail_bytes))
+            text = f.read().decode("utf-8", errors="replace")
         blocks = [b for b in text.split("\n## ") if b.strip()]
+        if size > tail_bytes and blocks:
+            blocks = blocks[1:]  # first block may be cut mid-entry
         for b in blocks[-max_rows:]:
             header, *rest = b.splitlines()
             time_title = header.strip().lstrip("# ").strip()
@@ -41,226 +85,484 @@ def recent_activity(max_rows: int = 8) -> list[tuple[str, str, str]]:
     return rows
 
 
-def read_done_metadata() -> list[dict]:
-    """Read frontmatter from all completed tasks for SLA/priority analysis."""
-    done_dir = get_path("done")
-    results = []
-    if not done_dir.exists():
-        return results
-    for f in done_dir.iterdir():
-        if not f.is_file() or f.name.startswith(".") or not f.name.endswith(".md"):
-            continue
-        try:
-            text = f.read_text(encoding="utf-8")
-            meta = {}
-            if text.startswith("---"):
-                parts = text.split("\n---", 1)
-                fm_block = parts[0].strip("-\n") if len(parts) > 1 else ""
-                for line in fm_block.splitlines():
-                    if ":" in line:
-                        k, v = line.split(":", 1)
-                        meta[k.strip()] = v.strip()
-            meta["_name"] = f.stem
-            results.append(meta)
-        except Exception:
-            pass
-    return results
-
-
-def get_priority_distribution(tasks: list[dict]) -> dict[str, int]:
-    """Count tasks per priority level."""
-    dist: dict[str, int] = {"P0": 0, "P1": 0, "P2": 0, "P3": 0}
-    for t in tasks:
-        prio = t.get("priority", "P2").upper()
-        if prio in dist:
-            dist[prio] += 1
-        else:
-            dist["P2"] += 1
-    return dist
-
-
-def get_overdue_tasks() -> list[tuple[str, str]]:
-    """Find tasks past their SLA deadline in pending/inbox."""
-    overdue = []
-    now = datetime.now()
-    for folder_key in ("inbox", "pending"):
-        folder = get_path(folder_key)
-        if not folder.exists():
-            continue
-        for f in folder.iterdir():
-            if not f.is_file() or f.name.startswith("."):
+def _parse_deadline(value: str) -> datetime | None:
+    if not value or value == "auto":
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M")
+    except ValueError:
+        return None
+
+
+class VaultState:
+    """Running totals over the vault folders, updated one file at a time."""
+
+    def __init__(self):
+        self.folders = {key: get_path(key) for key in TRACKED_FOLDERS}
+        self._dir_to_key = {str(path): key for key, path in self.folders.items()}
+        # folder key -> {filename: stem}, in discovery order
+        self.files: dict[str, dict[str, str]] = {key: {} for key in TRACKED_FOLDERS}
+        # /Done frontmatter and the aggregates derived from it
+        self.done_meta: dict[str, dict] = {}
+        self.done_stems: Counter = Counter()
+        self.prio_dist: Counter = Counter({p: 0 for p in PRIO_LABELS})
+        self.sla_on_time = 0
+        self.sla_total = 0
+        self.sensitive_done = 0
+        self.granted_done = 0
+        self.completed_by_date: dict[str, dict[str, None]] = {}
+        # (folder key, filename) -> (stem, deadline string, deadline) for inbox/pending
+        self.deadlines: dict[tuple[str, str], tuple[str, str, datetime]] = {}
+        self.lock = threading.RLock()
+
+    @classmethod
+    def from_scan(cls) -> "VaultState":
+        """Build the state with one pass over every tracked folder."""
+        state = cls()
+        for key, folder in state.folders.items():
+            if not folder.exists():
                 continue
-            try:
-                text = f.read_text(encoding="utf-8")
-                if "sla_deadline:" in text:
-                    for line in text.splitlines():
-                        if line.strip().startswith("sla_deadline:"):
-                            deadline_str = line.split(":", 1)[1].strip()
-                            if deadline_str and deadline_str != "auto":
-                                deadline = datetime.strptime(deadline_str, "%Y-%m-%d %H:%M")
-                                if now > deadline:
-                                    overdue.append((f.stem, deadline_str))
-                            break
-            except Exception:
-                pass
-    return overdue
-
-
-def compute_sla_stats(tasks: list[dict]) -> dict:
-    """Compute SLA compliance from completed task metadata."""
-    on_time = 0
-    total_with_sla = 0
-    for t in tasks:
-        if "sla_deadline" in t and "detected_at" in t and "completed_date" in t:
-            total_with_sla += 1
+            if key in ("done", "inbox", "pending"):
+                suffix = ".md" if key == "done" else None
+                meta_by_name = {p.name: m for p, m in scan_frontmatter(folder, suffix=suffix)}
+            else:
+                meta_by_name = {}
+            for entry in os.scandir(folder):
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+                state._add(key, Path(entry.path), meta_by_name.get(entry.name))
+        return state
+
+    def folder_for(self, path: str) -> str | None:
+        return self._dir_to_key.get(os.path.dirname(os.path.abspath(path)))
+
+    def apply(self, key: str, path: Path) -> None:
+        """Re-sync one file: drop its old contribution, add the current one."""
+        with self.lock:
+            self._remove(key, path.name)
+            if path.is_file() and not path.name.startswith("."):
+                self._add(key, path)
+
+    def count(self, key: str) -> int:
+        return len(self.files[key])
+
+    def listing(self, key: str, max_items: int) -> list[str]:
+        return list(self.files[key].values())[:max_items]
+
+    def sla_stats(self) -> dict:
+        pct = int(100 * self.sla_on_time / self.sla_total) if self.sla_total > 0 else 100
+        return {"on_time": self.sla_on_time, "total_with_sla": self.sla_total, "compliance_pct": pct}
+
+    def overdue(self, now: datetime) -> list[tuple[str, str]]:
+        return [(stem, value) for stem, value, deadline in self.deadlines.values() if now > deadline]
+
+    # ── Internals ─────────────────────────────────────────────────────────────
+
+    def _add(self, key: str, path: Path, meta: dict | None = None) -> None:
+        self.files[key][path.name] = path.stem
+        if key in ("inbox", "pending"):
+            meta = meta if meta is not None else get_frontmatter(path)
+            deadline = _parse_deadline(meta.get("sla_deadline", ""))
+            if deadline:
+                self.deadlines[(key, path.name)] = (path.stem, meta["sla_deadline"], deadline)
+        elif key == "done" and path.name.endswith(".md"):
+            meta = meta if meta is not None else get_frontmatter(path)
+            self.done_meta[path.name] = meta
+            self._count_done(path.stem, meta, 1)
+
+    def _remove(self, key: str, name: str) -> None:
+        stem = self.files[key].pop(name, None)
+        if stem is None:
+            return
+        self.deadlines.pop((key, name), None)
+        if key == "done":
+            meta = self.done_meta.pop(name, None)
+            if meta is not None:
+                self._count_done(stem, meta, -1)
+
+    def _count_done(self, stem: str, meta: dict, sign: int) -> None:
+        self.done_stems[stem] += sign
+        if self.done_stems[stem] <= 0:
+            del self.done_stems[stem]
+        prio = meta.get("priority", "P2").upper()
+        self.prio_dist[prio if prio in PRIO_LABELS else "P2"] += sign
+        if "sla_deadline" in meta and "detected_at" in meta and "completed_date" in meta:
+            self.sla_total += sign
             # Simplified: if completed_date <= sla_deadline date, it's on time
-            try:
-                completed = t["completed_date"]
-                deadline = t["sla_deadline"]
-                if completed <= deadline[:10]:
-                    on_time += 1
-            except Exception:
-                pass
-    pct = int(100 * on_time / total_with_sla) if total_with_sla > 0 else 100
-    return {"on_time": on_time, "total_with_sla": total_with_sla, "compliance_pct": pct}
-
-
-def write_dashboard() -> None:
-    cfg = load_config()
-    now = datetime.now()
-    today_str = now.strftime("%Y-%m-%d")
-    needs_action = get_path("inbox")
-    pending = get_path("pending")
-    approved = get_path("approved")
-    tasks = get_path("tasks")
-    done = get_path("done")
-    rejected = get_path("rejected")
-
+            if meta["completed_date"] <= meta["sla_deadline"][:10]:
+                self.sla_on_time += sign
+        if meta.get("sensitivity", "none") not in ("none", ""):
+            self.sensitive_done += sign
+        if meta.get("approval", "") == "granted":
+            self.granted_done += sign
+        completed = meta.get("completed_date", "")
+        if completed:
+            names = self.completed_by_date.setdefault(completed, {})
+            if sign > 0:
+                names[stem] = None
+            else:
+                names.pop(stem, None)
+                if not names:
+                    del self.completed_by_date[completed]
+
+
+# ── Section renderers ─────────────────────────────────────────────────────────
+
+def _section_status(state: VaultState, cfg: dict, now: datetime) -> list[str]:
     autonomy = cfg.get("autonomy_level", "MEDIUM")
-    done_meta = read_done_metadata()
-    prio_dist = get_priority_distribution(done_meta)
-    sla_stats = compute_sla_stats(done_meta)
-    overdue = get_overdue_tasks()
-
-    lines = []
-    lines.append("# AI Employee Dashboard")
-    lines.append("")
-    lines.append("## Status")
-    lines.append(f"**Digital FTE Online** | Silver Tier | Autonomy: {autonomy} | Last active: {today_str}")
-    lines.append("")
-
-    # --- Priority Distribution ---
-    lines.append("## Priority Distribution")
+    return [
+        "# AI Employee Dashboard",
+        "",
+        "## Status",
+        f"**Digital FTE Online** | Silver Tier | Autonomy: {autonomy} | Last active: {now.strftime('%Y-%m-%d')}",
+        "",
+    ]
+
+
+def _section_priority(state: VaultState, cfg: dict, now: datetime) -> list[str]:
+    lines = ["## Priority Distribution"]
+    prio_dist = state.prio_dist
     max_count = max(prio_dist.values()) if any(prio_dist.values()) else 1
-    prio_labels = {"P0": "Critical", "P1": "High", "P2": "Medium", "P3": "Low"}
     for prio in ("P0", "P1", "P2", "P3"):
         count = prio_dist[prio]
         bar_len = int(10 * count / max_count) if max_count > 0 else 0
-        bar = "\u2588" * bar_len
-        lines.append(f"- {prio} ({prio_labels[prio]}): {bar} {count}")
+        bar = "█" * bar_len
+        lines.append(f"- {prio} ({PRIO_LABELS[prio]}): {bar} {count}")
     lines.append("")
+    return lines
 
-    # --- SLA Performance ---
-    lines.append("## SLA Performance")
-    lines.append(f"- Compliance: **{sla_stats['compliance_pct']}%** ({sla_stats['on_time']}/{sla_stats['total_with_sla']} on-time)")
-    lines.append("")
 
-    # --- Overdue Tasks ---
-    lines.append("## Overdue Tasks")
+def _section_sla(state: VaultState, cfg: dict, now: datetime) -> list[str]:
+    sla_stats = state.sla_stats()
+    return [
+        "## SLA Performance",
+        f"- Compliance: **{sla_stats['compliance_pct']}%** ({sla_stats['on_time']}/{sla_stats['total_with_sla']} on-time)",
+        "",
+    ]
+
+
+def _section_overdue(state: VaultState, cfg: dict, now: datetime) -> list[str]:
+    lines = ["## Overdue Tasks"]
+    overdue = state.overdue(now)
     if overdue:
         for name, deadline in overdue:
             lines.append(f"- **{name}** — deadline was {deadline}")
     else:
         lines.append("- None — all tasks within SLA")
     lines.append("")
+    return lines
+
 
-    # --- Active Tasks ---
-    lines.append("## Active Tasks")
-    done_names = {t["_name"] for t in done_meta}
-    active = [name for name in list_files(tasks, 20)
-              if name.replace("plan_", "", 1) not in done_names]
+def _section_active(state: VaultState, cfg: dict, now: datetime) -> list[str]:
+    lines = ["## Active Tasks"]
+    active = [name for name in state.listing("tasks", 20)
+              if name.replace("plan_", "", 1) not in state.done_stems]
     if active:
         for a in active:
             lines.append(f"- {a}")
     else:
         lines.append("- None — all tasks processed")
     lines.append("")
+    return lines
 
-    # --- Pending Approvals ---
-    lines.append("## Pending Approvals")
-    pend = list_files(pending, 10)
+
+def _section_pending(state: VaultState, cfg: dict, now: datetime) -> list[str]:
+    lines = ["## Pending Approvals"]
+    pend = state.listing("pending", 10)
     if pend:
         for p in pend:
             lines.append(f"- {p}")
     else:
         lines.append("- None")
     lines.append("")
+    return lines
+
 
-    # --- Completed Today ---
-    lines.append(f"## Completed Today ({today_str})")
-    completed_today = [t["_name"] for t in done_meta if t.get("completed_date", "") == today_str]
+def _section_completed_today(state: VaultState, cfg: dict, now: datetime) -> list[str]:
+    today_str = now.strftime("%Y-%m-%d")
+    lines = [f"## Completed Today ({today_str})"]
+    completed_today = list(state.completed_by_date.get(today_str, {}))
     if completed_today:
         for c in completed_today:
             lines.append(f"- [x] {c}")
     else:
         lines.append("- None")
     lines.append("")
+    return lines
+
 
-    # --- Recent Activity ---
-    lines.append("## Recent Activity")
-    lines.append("| Time | Action | Details |")
-    lines.append("|------|--------|---------|")
+def _section_recent_activity(state: VaultState, cfg: dict, now: datetime) -> list[str]:
+    lines = [
+        "## Recent Activity",
+        "| Time | Action | Details |",
+        "|------|--------|---------|",
+    ]
     for t, a, d in recent_activity():
         lines.append(f"| {t} | {a} | {d} |")
     lines.append("")
-
-    # --- Queue Summary ---
-    lines.append("## Queue Summary")
-    lines.append("| Folder | Count | Status |")
-    lines.append("|--------|-------|--------|")
-    lines.append(f"| `/Needs_Action` | {count_files(needs_action)} | {'Empty' if count_files(needs_action)==0 else 'Pending'} |")
-    lines.append(f"| `/Pending_Approval` | {count_files(pending)} | {'Empty' if count_files(pending)==0 else 'Awaiting sign-off'} |")
-    lines.append(f"| `/Approved` | {count_files(approved)} | Records |")
-    lines.append(f"| `/Tasks` | {count_files(tasks)} | Active plans |")
-    lines.append(f"| `/Done` | {count_files(done)} | Completed |")
-    lines.append(f"| `/Rejected` | {count_files(rejected)} | {'Empty' if count_files(rejected)==0 else 'Declined'} |")
+    return lines
+
+
+def _section_queue_summary(state: VaultState, cfg: dict, now: datetime) -> list[str]:
+    c = {key: state.count(key) for key in TRACKED_FOLDERS}
+    return [
+        "## Queue Summary",
+        "| Folder | Count | Status |",
+        "|--------|-------|--------|",
+        f"| `/Needs_Action` | {c['inbox']} | {'Empty' if c['inbox']==0 else 'Pending'} |",
+        f"| `/Pending_Approval` | {c['pending']} | {'Empty' if c['pending']==0 else 'Awaiting sign-off'} |",
+        f"| `/Approved` | {c['approved']} | Records |",
+        f"| `/Tasks` | {c['tasks']} | Active plans |",
+        f"| `/Done` | {c['done']} | Completed |",
+        f"| `/Rejected` | {c['rejected']} | {'Empty' if c['rejected']==0 else 'Declined'} |",
+        "",
+    ]
+
+
+def _section_watcher_queue(state: VaultState, cfg: dict, now: datetime) -> list[str]:
+    lines = [
+        "## Watcher Queue",
+        "| Priority | Queued |",
+        "|----------|--------|",
+    ]
+    for prio, depth in read_queue_depth().items():
+        lines.append(f"| {prio} | {depth} |")
     lines.append("")
-
-    # --- Lifetime Stats ---
-    lines.append("## Lifetime Stats")
-    lines.append("| Metric | Value |")
-    lines.append("|--------|-------|")
-    total_received = count_files(needs_action) + count_files(done) + count_files(pending)
-    done_count = count_files(done)
-    sensitive_count = sum(1 for t in done_meta if t.get("sensitivity", "none") not in ("none", ""))
-    sensitive_count += count_files(pending)  # currently pending are also sensitive
-    approvals_requested = sum(1 for t in done_meta if t.get("approval", "") == "granted") + count_files(pending)
+    return lines
+
+
+def _section_lifetime(state: VaultState, cfg: dict, now: datetime) -> list[str]:
+    lines = [
+        "## Lifetime Stats",
+        "| Metric | Value |",
+        "|--------|-------|",
+    ]
+    pending_count = state.count("pending")
+    done_count = state.count("done")
+    total_received = state.count("inbox") + done_count + pending_count
+    sensitive_count = state.sensitive_done + pending_count  # currently pending are also sensitive
+    approvals_requested = state.granted_done + pending_count
     lines.append(f"| Total tasks received | {total_received} |")
     lines.append(f"| Tasks completed | {done_count} |")
     lines.append(f"| Sensitive actions flagged | {sensitive_count} |")
     lines.append(f"| Approvals requested | {approvals_requested} |")
-    lines.append(f"| Approvals granted | {count_files(approved)} |")
-    lines.append(f"| Approvals rejected | {count_files(rejected)} |")
+    lines.append(f"| Approvals granted | {state.count('approved')} |")
+    lines.append(f"| Approvals rejected | {state.count('rejected')} |")
     rate = "0%" if total_received == 0 else f"{int(100 * done_count / total_received)}%"
     lines.append(f"| Completion rate | {rate} |")
-    lines.append(f"| SLA compliance | {sla_stats['compliance_pct']}% |")
+    lines.append(f"| SLA compliance | {state.sla_stats()['compliance_pct']}% |")
     lines.append("")
+    return lines
 
-    # --- System Config ---
-    lines.append("## System Config")
-    lines.append("| Setting | Value |")
-    lines.append("|---------|-------|")
-    lines.append(f"| Tier | Silver |")
-    lines.append(f"| Autonomy Level | {autonomy} |")
+
+def _section_system_config(state: VaultState, cfg: dict, now: datetime) -> list[str]:
+    lines = [
+        "## System Config",
+        "| Setting | Value |",
+        "|---------|-------|",
+        "| Tier | Silver |",
+        f"| Autonomy Level | {cfg.get('autonomy_level', 'MEDIUM')} |",
+    ]
     prio_cfg = cfg.get("priority", {})
     for p in ("P0", "P1", "P2", "P3"):
         if isinstance(prio_cfg.get(p), dict):
             lines.append(f"| SLA {p} ({prio_cfg[p].get('label', '')}) | {prio_cfg[p].get('sla_hours', '?')}h |")
     lines.append(f"| Default Priority | {prio_cfg.get('default', 'P2')} |")
+    return lines
+
+
+SECTION_RENDERERS = {
+    "status": _section_status,
+    "priority": _section_priority,
+    "sla": _section_sla,
+    "overdue": _section_overdue,
+    "active": _section_active,
+    "pending": _section_pending,
+    "completed_today": _section_completed_today,
+    "recent_activity": _section_recent_activity,
+    "queue_summary": _section_queue_summary,
+    "watcher_queue": _section_watcher_queue,
+    "lifetime": _section_lifetime,
+    "system_config": _section_system_config,
+}
+
+
+# ── Engine ────────────────────────────────────────────────────────────────────
+
+class _VaultEventHandler(FileSystemEventHandler):
+    """Feeds watchdog events for the tracked folders into a DashboardEngine."""
+
+    def __init__(self, engine: "DashboardEngine"):
+        self.engine = engine
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type in ("opened", "closed_no_write"):
+            return
+        self.engine.file_changed(event.src_path)
+        dest = getattr(event, "dest_path", "")
+        if dest:
+            self.engine.file_changed(dest)
+
+
+class DashboardEngine:
+    """Keeps a VaultState in sync with file events and re-renders Dashboard.md
+    section by section, so a refresh costs O(changes) rather than O(vault)."""
+
+    def __init__(self, state: VaultState | None = None, output: Path = VAULT_PATH / "Dashboard.md"):
+        self.state = state or VaultState.from_scan()
+        self.output = output
+        self._sections: dict[str, list[str]] = {}
+        self._dirty: set[str] = set(SECTION_RENDERERS)
+        self._last_written = ""
+        self._observer: Observer | None = None
+
+    def file_changed(self, path: str) -> None:
+        key = self.state.folder_for(path)
+        if key is None:
+            return
+        with self.state.lock:
+            self.state.apply(key, Path(path))
+            for section, deps in SECTION_DEPENDENCIES.items():
+                if deps and key in deps:
+                    self._dirty.add(section)
+
+    def invalidate(self) -> None:
+        """Mark every section stale (e.g. after a config change)."""
+        with self.state.lock:
+            self._dirty.update(SECTION_RENDERERS)
+
+    def render(self) -> str:
+        cfg = load_config()
+        now = datetime.now()
+        with self.state.lock:
+            for section, renderer in SECTION_RENDERERS.items():
+                if section in self._dirty or SECTION_DEPENDENCIES[section] is None:
+                    self._sections[section] = renderer(self.state, cfg, now)
+            self._dirty.clear()
+            lines = [line for section in SECTION_RENDERERS for line in self._sections[section]]
+        return "\n".join(lines) + "\n"
+
+    def refresh(self) -> bool:
+        """Render and write Dashboard.md. Returns False if nothing changed."""
+        content = self.render()
+        if content == self._last_written:
+            return False
+        # Write-then-rename so Obsidian/readers never see a half-written file
+        tmp = self.output.with_name(f".{self.output.name}.tmp")
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, self.output)
+        self._last_written = content
+        save_index()
+        return True
+
+    def start(self) -> None:
+        """Watch the tracked folders so the state follows file events."""
+        handler = _VaultEventHandler(self)
+        self._observer = Observer()
+        for folder in self.state.folders.values():
+            folder.mkdir(parents=True, exist_ok=True)
+            self._observer.schedule(handler, str(folder), recursive=False)
+        self._observer.start()
+
+    def stop(self) -> None:
+        if self._observer:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+
+
+class DashboardRefreshService:
+    """Coalesces dashboard refresh requests inside a long-running process.
+
+    request() is cheap and thread-safe. A background thread waits until no
+    new request has arrived for `debounce_seconds` (or `max_delay_seconds`
+    since the first pending request) and then refreshes once, so a burst of
+    tasks produces a handful of Dashboard.md writes instead of one per task.
+    """
+
+    def __init__(self, engine: DashboardEngine, debounce_seconds: float = 2.0,
+                 max_delay_seconds: float | None = None):
+        self.engine = engine
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds or debounce_seconds * 5
+        self._cond = threading.Condition()
+        self._first_request: float | None = None
+        self._last_request = 0.0
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="dashboard-refresh", daemon=True)
+        self._thread.start()
+
+    def request(self) -> None:
+        with self._cond:
+            now = time.monotonic()
+            if self._first_request is None:
+                self._first_request = now
+            self._last_request = now
+            self._cond.notify()
+
+    def stop(self) -> None:
+        """Flush any pending refresh, then stop the background thread."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout=30)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._first_request is None and not self._stopping:
+                    self._cond.wait()
+                if self._first_request is None:
+                    return
+                while not self._stopping:
+                    now = time.monotonic()
+                    due = min(self._last_request + self.debounce_seconds,
+                              self._first_request + self.max_delay_seconds)
+                    if now >= due:
+                        break
+                    self._cond.wait(due - now)
+                self._first_request = None
+            try:
+                self.engine.refresh()
+            except Exception as e:
+                print(f"Dashboard refresh failed: {e}")
 
-    (VAULT_PATH / "Dashboard.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+def write_dashboard() -> None:
+    DashboardEngine().refresh()
     print("Dashboard updated.")
 
 
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Regenerate Dashboard.md")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and refresh the dashboard on vault changes")
+    parser.add_argument("--interval", type=float, default=2.0,
+                        help="Seconds between refresh checks in --watch mode (default: 2)")
+    args = parser.parse_args()
+
+    if not args.watch:
+        write_dashboard()
+        return
+
+    engine = DashboardEngine()
+    engine.start()
+    engine.refresh()
+    print("Dashboard engine watching vault. Press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(args.interval)
+            engine.refresh()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.stop()
+
+
 if __name__ == "__main__":
-    write_dashboard()
+    main()
@@ -1,6 +1,8 @@
 from datetime import datetime
 from pathlib import Path
 
+from atomic_write import write_text_atomic
+
 VAULT = Path(__file__).parent.parent.resolve()
 PENDING = VAULT / "Pending_Approval"
 DONE = VAULT / "Done"
@@ -17,7 +19,7 @@ def write_approval(stem: str, summary: str, category: str) -> None:
     lines.append("## Proposed Plan")
     lines.append("- Draft prepared")
     lines.append("- Await manager sign-off before sending/posting")
-    p.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    write_text_atomic(p, "\n".join(lines) + "\n")
 
 def write_done(stem: str, priority: str, category: str, body: str) -> None:
     DONE.mkdir(parents=True, exist_ok=True)
@@ -35,4 +37,4 @@ def write_done(stem: str, priority: str, category: str, body: str) -> None:
     lines.append("---")
     lines.append("")
     lines.append(body.strip() or f"# Completed: {stem}")
-    p.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    write_text_atomic(p, "\n".join(lines) + "\n")
@@ -1,13 +1,15 @@
 """
 AI Employee Vault — File Watcher (Silver Tier)
 Monitors /Needs_Action for new task files and triggers Claude Code processing.
-Features: config-driven, priority queue, SLA tracking, scheduler, approval monitor.
+Features: config-driven, persistent priority queue, worker pool, SLA tracking,
+scheduler, approval monitor.
 """
 
 import time
 import subprocess
 import sys
 import os
+import threading
 from pathlib import Path
 from datetime import datetime
 
@@ -17,11 +19,26 @@ if hasattr(sys.stdout, "reconfigure"):
 if hasattr(sys.stderr, "reconfigure"):
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
+from dotenv import load_dotenv
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+from anthropic_runner import WorkerRequestError, WorkerUnavailable, request_worker
+from backlog_replay import BacklogReplay
 from config_loader import load_config, get_path, get_sla_deadline, log_event
+from file_events import CLOSE_EVENTS, SettleTimers
+from frontmatter_index import get_frontmatter
 from scheduler import check_due_tasks
+from task_batcher import (
+    batch_key,
+    build_batch_prompt,
+    fan_out,
+    get_batching_config,
+    parse_batch_results,
+    read_task,
+)
+from task_queue import PRIORITY_ORDER, TaskQueue
+from update_dashboard import DashboardEngine, DashboardRefreshService
 
 # --- Configuration ---
 VAULT_PATH = Path(__file__).parent.resolve()
@@ -32,15 +49,12 @@ def read_task_priority(filepath: Path) -> str:
     cfg = load_config()
     default_prio = cfg.get("priority", {}).get("default", "P2")
     try:
-        text = filepath.read_text(encoding="utf-8")
-        if text.startswith("---"):
-            fm_block = text.split("\n---", 1)[0].strip("-\n")
-            for line in fm_block.splitlines():
-                if line.strip().startswith("priority:"):
-                    return line.split(":", 1)[1].strip()
+        meta = get_frontmatter(filepath)
+        if meta.get("priority"):
+            return meta["priority"]
         # Check for priority keywords in body
         from config_loader import get_priority_from_keywords
-        detected = get_priority_from_keywords(text)
+        detected = get_priority_from_keywords(filepath.read_text(encoding="utf-8"))
         if detected:
             return detected
     except Exception:
@@ -48,13 +62,34 @@ def read_task_priority(filepath: Path) -> str:
     return default_prio
 
 
-def sort_by_priority(files: list[Path]) -> list[Path]:
-    """Sort task files by priority (P0 first, P3 last)."""
-    priority_order = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
-    def key_fn(f):
-        prio = read_task_priority(f)
-        return priority_order.get(prio, 2)
-    return sorted(files, key=key_fn)
+def resolve_llm_command(prompt: str) -> list[str]:
+    """LLM CLI invocation from CLAUDE_CMD (Secrets/.env), fallback to 'claude'."""
+    llm_cmd = os.getenv("CLAUDE_CMD", "").strip()
+    return (llm_cmd.split() + ["-p", prompt]) if llm_cmd else ["claude", "-p", prompt]
+
+
+def run_llm(prompt: str, timeout: float, use_worker: bool) -> tuple[str, str]:
+    """Run a prompt and return (stdout, stderr).
+
+    With use_worker, the prompt goes to the warm anthropic_runner worker;
+    if it can't be reached we fall back to a fresh CLI subprocess. Failures
+    and timeouts after the prompt was sent raise WorkerRequestError instead:
+    the worker may already have acted on it (or still be running it), so it
+    must not run a second time.
+    """
+    if use_worker:
+        try:
+            return request_worker(prompt, timeout), ""
+        except WorkerUnavailable as e:
+            print(f"  Runner worker unavailable ({e}), falling back to subprocess")
+    result = subprocess.run(
+        resolve_llm_command(prompt),
+        cwd=str(VAULT_PATH),
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    return result.stdout, result.stderr
 
 
 def check_approval_reminders() -> None:
@@ -90,48 +125,288 @@ def check_approval_reminders() -> None:
             pass
 
 
+def read_task_sla_deadline(filepath: Path, priority: str, arrived_at: datetime) -> datetime:
+    """SLA deadline from task frontmatter, else computed from priority + arrival."""
+    value = get_frontmatter(filepath).get("sla_deadline", "")
+    if value and value != "auto":
+        try:
+            return datetime.strptime(value, "%Y-%m-%d %H:%M")
+        except ValueError:
+            pass
+    return get_sla_deadline(priority, arrived_at)
+
+
+class TaskWorkerPool:
+    """Bounded pool of worker threads fed by the persistent TaskQueue.
+
+    Tasks are served P0 first, then by SLA deadline, then arrival time, so
+    a P0 file dropped during a P3 burst is picked up by the next free worker.
+    Each worker spends most of its time waiting on the `claude -p` subprocess,
+    so threads are enough to run N tasks in parallel.
+    """
+
+    def __init__(self, handler: "TaskHandler", workers: int, task_queue: TaskQueue):
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.queue = task_queue
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            t = threading.Thread(target=self._run, name=f"task-worker-{i + 1}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def submit(self, filepath: str, priority: str, arrived_at: datetime | None = None) -> bool:
+        """Queue a task; returns False if the same file is already waiting."""
+        arrived_at = arrived_at or datetime.now()
+        sla_deadline = read_task_sla_deadline(Path(filepath), priority, arrived_at)
+        return self.queue.push(filepath, priority, sla_deadline, arrived_at)
+
+    def depth(self) -> int:
+        return len(self.queue)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Signal workers to exit after their current task, then wait.
+
+        Queued files are not claimed yet, so they stay in /Needs_Action and
+        keep their place in the journal for the next start.
+        """
+        self.queue.close()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads.clear()
+
+    def _run(self) -> None:
+        while True:
+            entry = self.queue.pop()
+            if entry is None:
+                return
+            batch = self._gather_batch(entry)
+            if len(batch) > 1:
+                try:
+                    self.handler.process_batch(batch)
+                except Exception as e:
+                    log_event("Error: Batch Worker", [f"Tasks: {len(batch)}", f"Exception: {e}"])
+                continue
+            filename = os.path.basename(entry["path"])
+            try:
+                detected_at = datetime.fromisoformat(entry["arrived_at"])
+                self.handler.process_task(entry["path"], filename, detected_at)
+            except Exception as e:
+                log_event("Error: Worker", [f"File: {filename}", f"Exception: {e}"])
+
+    def _gather_batch(self, entry: dict) -> list[dict]:
+        """Collect queued tasks with the same (source, type) as entry.
+
+        A task with nothing similar already queued is dispatched at once.
+        Otherwise waits up to the batching window for more to arrive, but
+        stops early if a higher-priority task is waiting so P0/P1 work isn't
+        held up.
+        """
+        batching = get_batching_config()
+        if not batching["enabled"]:
+            return [entry]
+        key = batch_key(entry, batching["priorities"])
+        if key is None:
+            return [entry]
+        rank = PRIORITY_ORDER.get(entry["priority"], 2)
+        batch = [entry]
+        limit = batching["max_batch_size"]
+        deadline = time.monotonic() + batching["window_seconds"]
+        while len(batch) < limit:
+            batch += self.queue.take(
+                lambda e: batch_key(e, batching["priorities"]) == key, limit - len(batch)
+            )
+            if len(batch) == 1:
+                break  # nothing to batch with: don't hold a lone task for the window
+            head = self.queue.peek()
+            if len(batch) >= limit or time.monotonic() >= deadline:
+                break
+            if head is not None and PRIORITY_ORDER.get(head["priority"], 2) < rank:
+                break
+            time.sleep(min(0.25, max(0.0, deadline - time.monotonic())))
+        return batch
+
+
 class TaskHandler(FileSystemEventHandler):
     """Handles new files dropped into /Needs_Action."""
 
+    def __init__(
+        self,
+        workers: int = 1,
+        task_queue: TaskQueue | None = None,
+        dashboard: DashboardRefreshService | None = None,
+    ):
+        super().__init__()
+        self.inbox = get_path("inbox").resolve()
+        self.dashboard = dashboard
+        self.queue = task_queue if task_queue is not None else TaskQueue()
+        self.pool = TaskWorkerPool(self, workers, self.queue)
+        self.pool.start()
+        self.settle = SettleTimers(self.on_new_file)
+
+    def dispatch_task(
+        self,
+        filepath: str,
+        filename: str,
+        priority: str | None = None,
+        arrived_at: datetime | None = None,
+    ) -> None:
+        """Hand a task to the priority queue served by the worker pool."""
+        priority = priority or read_task_priority(Path(filepath))
+        if self.pool.submit(filepath, priority, arrived_at):
+            depth = self.queue.depth_by_priority()
+            print(f"  Queued {filename} (depth: " + ", ".join(f"{p}={n}" for p, n in depth.items()) + ")")
+
+    def shutdown(self) -> None:
+        self.pool.stop()
+        if self.dashboard is not None:
+            self.dashboard.stop()
+
+    def refresh_dashboard(self) -> None:
+        """Queue a debounced in-process refresh, or regenerate via subprocess."""
+        if self.dashboard is not None:
+            self.dashboard.request()
+            return
+        try:
+            subprocess.run([sys.executable, str(VAULT_PATH / "update_dashboard.py")], timeout=30)
+        except Exception:
+            pass
+
+    # Files are picked up once they are complete (see file_events.py):
+    # on_moved for atomic write-then-rename, on_closed for files written in
+    # place, and a settle timer for files moved in from an unwatched folder,
+    # which only report on_created. Where the observer reports no close
+    # events (non-inotify platforms), on_created dispatches directly.
+
     def on_created(self, event):
         if event.is_directory:
             return
-        if not event.src_path.endswith(".md"):
+        if CLOSE_EVENTS:
+            self.settle.created(event.src_path)
+        else:
+            self.on_new_file(event.src_path)
+
+    def on_modified(self, event):
+        if CLOSE_EVENTS and not event.is_directory:
+            self.settle.modified(event.src_path)
+
+    def on_closed(self, event):
+        if self.settle.settled(event.src_path):
+            self.on_new_file(event.src_path)
+
+    def on_moved(self, event):
+        if event.is_directory:
             return
-        filename = os.path.basename(event.src_path)
+        self.settle.settled(event.src_path)
+        # Claims move tasks out of /Needs_Action; only arrivals count
+        if Path(event.dest_path).parent.resolve() == self.inbox:
+            self.on_new_file(event.dest_path)
+
+    def on_new_file(self, src_path: str) -> None:
+        if not src_path.endswith(".md"):
+            return
+        filename = os.path.basename(src_path)
         if filename.startswith(".") or filename.startswith("~"):
             return
+        if not os.path.exists(src_path):
+            return  # already claimed
 
         timestamp = datetime.now().strftime("%H:%M:%S")
-        priority = read_task_priority(Path(event.src_path))
+        priority = read_task_priority(Path(src_path))
         print(f"\n[{timestamp}] New task detected: {filename} [Priority: {priority}]")
-        print(f"  Path: {event.src_path}")
+        print(f"  Path: {src_path}")
         print(f"  Triggering AI Employee...")
 
-        self.process_task(event.src_path, filename)
+        self.dispatch_task(src_path, filename, priority)
 
-    def process_task(self, filepath, filename):
+    def claim_task(self, filepath, filename) -> Path | None:
+        """Move a task into In_Progress/<role>/; returns the new path or None."""
+        in_progress_dir = get_path("in_progress")
+        in_progress_dir.mkdir(parents=True, exist_ok=True)
+        new_path = in_progress_dir / filename
+        if Path(filepath).resolve() == new_path.resolve():
+            return new_path  # already claimed (e.g. a batch falling back to per-task)
+        try:
+            os.rename(filepath, new_path)
+            return new_path
+        except Exception as e:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] ERROR: Could not claim task {filename}: {e}")
+            return None
+
+    def process_batch(self, entries: list[dict]) -> None:
+        """Process similar low-priority tasks with a single LLM call.
+
+        Tasks missing from the LLM's answer (or the whole batch, if the call
+        fails) fall back to regular per-task processing.
+        """
+        cfg = load_config()
+        timeout = cfg.get("watcher", {}).get("timeout", 120)
+        use_worker = cfg.get("llm_runner", {}).get("mode", "subprocess") == "worker"
+        timestamp = datetime.now().strftime("%H:%M:%S")
+
+        claimed = []
+        for entry in entries:
+            filename = os.path.basename(entry["path"])
+            path = self.claim_task(entry["path"], filename)
+            if path is None:
+                continue
+            try:
+                meta, body = read_task(path)
+            except Exception as e:
+                log_event("Error: Batch Read", [f"File: {filename}", f"Exception: {e}"])
+                continue
+            claimed.append((entry, path, meta, body))
+        if not claimed:
+            return
+
+        names = [path.name for _, path, _, _ in claimed]
+        print(f"[{timestamp}] Processing batch of {len(claimed)} task(s): {', '.join(names)}")
+        log_event("Batch Claimed", [f"Tasks: {len(claimed)}", f"Files: {', '.join(names)}"])
+
+        results: dict[str, dict] = {}
+        try:
+            stdout, _ = run_llm(build_batch_prompt([(p.name, m, b) for _, p, m, b in claimed]), timeout, use_worker)
+            results = parse_batch_results(stdout)
+        except WorkerRequestError as e:
+            # The batch may have been acted on: leave the tasks in In_Progress for review
+            log_event("Error: Batch LLM", [
+                f"Tasks: {len(claimed)}",
+                f"Exception: {e}",
+                "Result: not retried (request already sent to the worker)",
+            ])
+            self.refresh_dashboard()
+            return
+        except Exception as e:
+            log_event("Error: Batch LLM", [f"Tasks: {len(claimed)}", f"Exception: {e}"])
+
+        for entry, path, meta, body in claimed:
+            result = results.get(path.name)
+            if result is None:
+                self.process_task(str(path), path.name, datetime.fromisoformat(entry["arrived_at"]))
+                continue
+            try:
+                fan_out(path, meta, body, result, len(claimed))
+            except Exception as e:
+                log_event("Error: Batch Fan-out", [f"File: {path.name}", f"Exception: {e}"])
+        self.refresh_dashboard()
+
+    def process_task(self, filepath, filename, detected_at: datetime | None = None):
         cfg = load_config()
         retry_cfg = cfg.get("retry", {})
         watcher_cfg = cfg.get("watcher", {})
 
         priority = read_task_priority(Path(filepath))
         task_name = Path(filename).stem
-        detected_at = datetime.now()
-        timestamp = detected_at.strftime("%H:%M:%S")
+        detected_at = detected_at or datetime.now()
+        timestamp = datetime.now().strftime("%H:%M:%S")
         sla_deadline = get_sla_deadline(priority, detected_at)
 
-        in_progress_dir = get_path("in_progress")
-        in_progress_dir.mkdir(parents=True, exist_ok=True)
-        new_path = in_progress_dir / filename
-
-        try:
-            # Move file to In_Progress/<role>/ to "claim" it
-            os.rename(filepath, new_path)
-            filepath = str(new_path)
-        except Exception as e:
-            print(f"[{timestamp}] ERROR: Could not claim task {filename}: {e}")
+        claimed = self.claim_task(filepath, filename)
+        if claimed is None:
             return
+        filepath = str(claimed)
 
         # WhatsApp tasks ke liye extra reply instructions
         wa_extra = ""
@@ -177,26 +452,16 @@ class TaskHandler(FileSystemEventHandler):
         backoff = retry_cfg.get("initial_backoff", 2)
         max_backoff = retry_cfg.get("max_backoff", 60)
         timeout = watcher_cfg.get("timeout", 120)
+        use_worker = cfg.get("llm_runner", {}).get("mode", "subprocess") == "worker"
 
         while attempts < max_attempts:
             attempts += 1
             try:
-                # Resolve LLM command from environment, fallback to 'claude'
-                from dotenv import load_dotenv
-                load_dotenv(VAULT_PATH / "Secrets" / ".env")
-                llm_cmd = os.getenv("CLAUDE_CMD", "").strip()
-                cmd = (llm_cmd.split() + ["-p", prompt]) if llm_cmd else ["claude", "-p", prompt]
-                result = subprocess.run(
-                    cmd,
-                    cwd=str(VAULT_PATH),
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                )
+                stdout, stderr = run_llm(prompt, timeout, use_worker)
                 print(f"[{timestamp}] Claude response:")
-                print(result.stdout[:500] if result.stdout else "(no output)")
-                if result.stderr:
-                    print(f"  Errors: {result.stderr[:200]}")
+                print(stdout[:500] if stdout else "(no output)")
+                if stderr:
+                    print(f"  Errors: {stderr[:200]}")
 
                 log_event(
                     "Task Processed",
@@ -207,14 +472,22 @@ class TaskHandler(FileSystemEventHandler):
                         "Result: processed by Claude",
                     ],
                 )
-                try:
-                    subprocess.run([sys.executable, str(VAULT_PATH / "update_dashboard.py")], timeout=30)
-                except Exception:
-                    pass
+                self.refresh_dashboard()
                 break
             except subprocess.TimeoutExpired:
                 print(f"[{timestamp}] Claude timed out processing {filename}")
                 log_event("Error: Timeout", [f"Task: {task_name}", f"Attempt: {attempts}"])
+            except WorkerRequestError as e:
+                # Sent but unanswered: the worker may have acted on it, so don't re-run
+                print(f"[{timestamp}] ERROR: {e}")
+                log_event("Error: LLM Worker", [
+                    f"Task: {task_name}",
+                    f"Attempt: {attempts}",
+                    f"Exception: {e}",
+                    "Result: not retried (request already sent to the worker)",
+                ])
+                self.refresh_dashboard()
+                break
             except FileNotFoundError:
                 print(f"[{timestamp}] ERROR: 'claude' CLI not found in PATH.")
                 print("  Falling back to local reasoner...")
@@ -224,6 +497,7 @@ class TaskHandler(FileSystemEventHandler):
                     log_event("Fallback Local Reasoner Executed", [f"Task: {task_name}"])
                 except Exception as e:
                     log_event("Error: Local Reasoner Failed", [str(e)])
+                self.refresh_dashboard()
                 break
             except Exception as e:
                 print(f"[{timestamp}] ERROR: {e}")
@@ -234,10 +508,12 @@ class TaskHandler(FileSystemEventHandler):
 
 
 def main():
+    load_dotenv(VAULT_PATH / "Secrets" / ".env")
     cfg = load_config()
     inbox_path = get_path("inbox")
     logs_dir = get_path("logs")
     poll_interval = cfg.get("watcher", {}).get("poll_interval", 1)
+    workers = int(cfg.get("watcher", {}).get("workers", 1))
     autonomy = cfg.get("autonomy_level", "MEDIUM")
 
     inbox_path.mkdir(parents=True, exist_ok=True)
@@ -250,13 +526,22 @@ def main():
     print("=" * 60)
     print(f"  Vault:    {VAULT_PATH}")
     print(f"  Watching: {inbox_path}")
+    print(f"  Workers:  {workers}")
     print(f"  Started:  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
     print("\nWaiting for new tasks in /Needs_Action ...")
     print("(Drop a .md file to trigger processing)")
     print("Press Ctrl+C to stop.\n")
 
-    handler = TaskHandler()
+    dashboard_engine = DashboardEngine()
+    dashboard_engine.start()
+    dashboard = DashboardRefreshService(
+        dashboard_engine,
+        debounce_seconds=float(cfg.get("dashboard", {}).get("debounce_seconds", 2)),
+    )
+    dashboard.start()
+
+    handler = TaskHandler(workers=workers, dashboard=dashboard)
     observer = Observer()
     observer.schedule(handler, str(inbox_path), recursive=False)
     observer.start()
@@ -265,16 +550,18 @@ def main():
         "Tier: Silver",
         f"Autonomy: {autonomy}",
         f"Poll interval: {poll_interval}s",
+        f"Workers: {workers}",
     ])
 
     try:
-        # Process existing tasks sorted by priority
-        existing = list(inbox_path.glob("*.md"))
-        if existing:
-            sorted_tasks = sort_by_priority(existing)
-            print(f"Found {len(sorted_tasks)} existing task(s), processing by priority...")
-            for task_file in sorted_tasks:
-                handler.process_task(str(task_file), task_file.name)
+        # Queue existing tasks in the background; the journal keeps arrival order
+        # from the last run, and new tasks still land in the priority queue
+        # as they arrive, so a fresh P0 is not held behind the backlog.
+        def queue_existing(task_file: Path) -> None:
+            arrived_at = datetime.fromtimestamp(task_file.stat().st_mtime)
+            handler.dispatch_task(str(task_file), task_file.name, arrived_at=arrived_at)
+
+        BacklogReplay("needs_action", inbox_path, queue_existing, suffixes=(".md",), checkpoint=False).start()
 
         loop_count = 0
         while True:
@@ -295,11 +582,16 @@ def main():
                 except Exception as e:
                     log_event("Approval Monitor Error", [str(e)])
 
+                # Overdue/"today" sections depend on the clock
+                dashboard.request()
+
     except KeyboardInterrupt:
         print("\nStopping watcher...")
         observer.stop()
 
     observer.join()
+    handler.shutdown()
+    dashboard_engine.stop()
     log_event("Watcher Stopped", ["Reason: KeyboardInterrupt"])
     print("Watcher stopped. AI Employee offline.")
 
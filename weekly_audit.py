@@ -3,34 +3,25 @@ AI Employee Vault — Weekly Audit & CEO Briefing (Silver Tier)
 Enhanced with SLA compliance metrics, priority breakdown, and approval response analysis.
 """
 
-import re
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from config_loader import load_config, get_path
+from frontmatter_index import save_index, scan_frontmatter
+from log_records import entry_header, read_range
 
 VAULT_PATH = Path(__file__).parent.resolve()
 
 
 def read_logs_for_week(end_date: datetime) -> list[tuple[str, list[str]]]:
+    """(header, details) for every log entry in the 7 days ending end_date.
+
+    Reads the structured JSONL sidecar (Markdown for days that predate it).
+    """
     logs_dir = get_path("logs")
-    start_date = end_date - timedelta(days=6)
-    entries: list[tuple[str, list[str]]] = []
-    for i in range(7):
-        day = (start_date + timedelta(days=i)).strftime("%Y-%m-%d")
-        file = logs_dir / f"{day}.md"
-        if not file.exists():
-            continue
-        with file.open("r", encoding="utf-8") as f:
-            content = f.read()
-        for block in re.split(r"\n(?=## )", content):
-            if not block.strip().startswith("## "):
-                continue
-            lines = block.strip().splitlines()
-            header = lines[0][3:].strip()
-            details = [l.strip("- ").strip() for l in lines[1:]]
-            entries.append((header, details))
-    return entries
+    start = (end_date - timedelta(days=6)).replace(hour=0, minute=0, second=0, microsecond=0)
+    end = end_date.replace(hour=23, minute=59, second=59, microsecond=0)
+    return [(entry_header(r), r["details"]) for r in read_range(logs_dir, start, end)]
 
 
 def summarize(entries: list[tuple[str, list[str]]]) -> dict:
@@ -80,29 +71,13 @@ def read_done_sla_data() -> dict:
     done_dir = get_path("done")
     total = 0
     on_time = 0
-    if not done_dir.exists():
-        return {"total": 0, "on_time": 0, "compliance_pct": 100}
-    for f in done_dir.iterdir():
-        if not f.is_file() or f.name.startswith(".") or not f.name.endswith(".md"):
-            continue
-        try:
-            text = f.read_text(encoding="utf-8")
-            has_sla = False
-            completed_date = ""
-            sla_deadline = ""
-            for line in text.splitlines():
-                stripped = line.strip()
-                if stripped.startswith("completed_date:"):
-                    completed_date = stripped.split(":", 1)[1].strip()
-                if stripped.startswith("sla_deadline:"):
-                    sla_deadline = stripped.split(":", 1)[1].strip()
-                    has_sla = True
-            if has_sla and completed_date and sla_deadline and sla_deadline != "auto":
-                total += 1
-                if completed_date <= sla_deadline[:10]:
-                    on_time += 1
-        except Exception:
-            pass
+    for _, meta in scan_frontmatter(done_dir):
+        completed_date = meta.get("completed_date", "")
+        sla_deadline = meta.get("sla_deadline", "")
+        if completed_date and sla_deadline and sla_deadline != "auto":
+            total += 1
+            if completed_date <= sla_deadline[:10]:
+                on_time += 1
     pct = int(100 * on_time / total) if total > 0 else 100
     return {"total": total, "on_time": on_time, "compliance_pct": pct}
 
@@ -222,6 +197,7 @@ def main() -> None:
     briefing_file = VAULT_PATH / "CEO_Briefing.md"
     audit_file.write_text(weekly_audit, encoding="utf-8")
     briefing_file.write_text(ceo_briefing, encoding="utf-8")
+    save_index()
     print(f"Wrote {audit_file} and {briefing_file}")
 
 
@@ -12,10 +12,17 @@ BaseWatcher mapping:
     run()               → sync_playwright() context wrap karta hai, phir super().run()
     connect()           → _launch_browser() + wait_for_login()
     disconnect()        → browser close
-    before_loop()       → wait_for_chat_list()
+    before_loop()       → wait_for_chat_list() + _install_unread_observer()
     check_new_events()  → page-alive + pane recovery + _get_unread_messages()
                           + blacklist/group filtering + check_outbox()
     process_event()     → _create_task_file()
+
+Push mode (channels.whatsapp.push_mode, default on):
+    Page mein ek MutationObserver chat list pe lagta hai; unread badges badalte
+    hi woh page.expose_binding ke zariye unread chats Python ko bhej deta hai.
+    Loop har second pushed chats uthata hai (~1s detection), aur poora DOM scan
+    + pane recovery sirf har fallback_poll_interval seconds pe health check ke
+    taur pe chalta hai.
 """
 
 import argparse
@@ -25,8 +32,10 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+from atomic_write import write_text_atomic
 from base_watcher import BaseWatcher
 from config_loader import load_config, log_event
+from dedup_store import DedupStore, open_store
 
 # ── Constants ─────────────────────────────────────────────────────────────────
 
@@ -48,6 +57,95 @@ GROUP_NAME_KEYWORDS = [
     "Members", "Family", "Friends",
 ]
 
+# Push mode: page → Python binding and the chat-list observer that calls it
+UNREAD_BINDING = "__aiEmployeeUnread"
+PUSH_PUMP_MS   = 200   # lets Playwright deliver queued binding calls each cycle
+
+UNREAD_OBSERVER_JS = """
+() => {
+    const state = window.__aiUnreadObserver || (window.__aiUnreadObserver = {
+        pane: null, observer: null, timer: null, last: '',
+    });
+    const PANES  = ['#pane-side', '#side', '[data-testid="chat-list"]',
+                    'div[aria-label="Chat list"]', 'div[aria-label="Chats"]'];
+    const BADGES = '[data-testid="icon-unread-count"], [data-icon="unread-count"], '
+                 + 'span[aria-label*="unread"], div[aria-label*="unread"]';
+    // Chat-list time label: "10:42", "10:42 PM", "Yesterday", "Monday", "18/10/2026"
+    const TIME_LABEL = /^[0-9]{1,2}:[0-9]{2}( ?[ap]m)?$|^[a-z]+day$|^[0-9]{1,2}[/.][0-9]{1,2}[/.][0-9]{2,4}$/i;
+
+    const rowOf = (badge) => {
+        let row = badge;
+        for (let i = 0; i < 15; i++) {
+            row = row.parentElement;
+            if (!row) return null;
+            const role = row.getAttribute('role');
+            if (role === 'row' || role === 'listitem' ||
+                row.getAttribute('data-testid') === 'cell-frame-container') return row;
+        }
+        return null;
+    };
+
+    const timeOf = (row) => {
+        for (const el of row.querySelectorAll('div, span')) {
+            const t = el.children.length ? '' : el.textContent.trim();
+            if (TIME_LABEL.test(t)) return t;
+        }
+        return '';
+    };
+    const unreadOf = (badge) =>
+        ((badge.textContent || badge.getAttribute('aria-label') || '').match(/[0-9]+/) || [''])[0];
+
+    const report = () => {
+        state.timer = null;
+        if (!state.pane || !state.pane.isConnected) return;
+        const rows = new Set();
+        const chats = [];
+        for (const badge of state.pane.querySelectorAll(BADGES)) {
+            const row = rowOf(badge);
+            if (!row || rows.has(row)) continue;
+            rows.add(row);
+            const texts = Array.from(row.querySelectorAll('span'))
+                .filter(sp => !sp.querySelector('span'))
+                .map(sp => sp.textContent.trim())
+                .filter(t => t.length > 1 && !/^\\d+$/.test(t));
+            const name    = texts[0] || 'Unknown';
+            const message = texts[1] || '';
+            const isGroup = !!(row.querySelector('[data-icon="group"],[data-icon="groups"],[data-icon="community"]')
+                || /group/i.test(row.getAttribute('aria-label') || '')
+                || /^[^:]{1,40}:\\s.+/.test(message));
+            chats.push({ name, message, isGroup, time: timeOf(row), unread: unreadOf(badge) });
+        }
+        const signature = JSON.stringify(chats);
+        if (signature === state.last) return;
+        state.last = signature;
+        // Empty reports too: they tell Python which chats have been read
+        if (window.__aiEmployeeUnread) window.__aiEmployeeUnread(chats);
+    };
+
+    const schedule = () => {
+        if (!state.timer) state.timer = setTimeout(report, 250);
+    };
+
+    const attach = () => {
+        if (state.pane && state.pane.isConnected) return 'attached';
+        let pane = null;
+        for (const sel of PANES) { pane = document.querySelector(sel); if (pane) break; }
+        if (!pane) return 'no-pane';
+        if (state.observer) state.observer.disconnect();
+        state.pane = pane;
+        state.last = '';
+        state.observer = new MutationObserver(schedule);
+        state.observer.observe(pane, { childList: true, subtree: true, characterData: true });
+        schedule();
+        return 'reattached';
+    };
+
+    // WhatsApp re-renders the pane on reconnects; re-attach when it is replaced
+    if (!state.watchdog) state.watchdog = setInterval(attach, 5000);
+    return attach();
+}
+"""
+
 # ── Module-level helpers ───────────────────────────────────────────────────────
 
 def ensure_single_instance() -> None:
@@ -117,10 +215,21 @@ class WhatsAppWatcher(BaseWatcher):
         self.setup_mode       = setup_mode
         self.browser          = None
         self.page             = None
-        self.seen_messages:   set[str] = set()
+        self.seen_messages:   DedupStore = open_store("whatsapp")  # persisted, TTL-bounded
+        self._unread_chats: dict[str, tuple[str, str]] = {}  # chat → (count:text, key)
         self._playwright      = None   # set by run() before connect() is called
         self._no_pane_streak  = 0      # consecutive cycles where chat pane was missing
 
+        # Push mode: the page reports unread chats; full DOM scans become a fallback
+        wa_cfg                  = load_whatsapp_config()
+        self.push_mode          = bool(wa_cfg.get("push_mode", True))
+        self.fallback_interval  = int(wa_cfg.get("fallback_poll_interval", 120))
+        self._pushed: list[dict] | None = None  # latest unread-chat report from the page binding
+        self._push_page         = None   # page the binding is exposed on
+        self._next_full_scan    = 0.0
+        if self.push_mode:
+            self.check_interval = 1      # the observer paces detection
+
     # ── run() override ────────────────────────────────────────────────────────
 
     def run(self, max_restarts: int = 3) -> None:
@@ -161,21 +270,30 @@ class WhatsAppWatcher(BaseWatcher):
         """Called once after connect() — wait for chat list pane to be ready."""
         if self.setup_mode:
             return
-        self.log(f"WhatsApp Watcher active — checking every {self.check_interval}s")
+        if self.push_mode:
+            self.log(f"WhatsApp Watcher active — push mode, full scan every {self.fallback_interval}s")
+        else:
+            self.log(f"WhatsApp Watcher active — checking every {self.check_interval}s")
         self.log(f"Outbox: {OUTBOX}")
         self.wait_for_chat_list(timeout_s=60)
         self._no_pane_streak = 0
+        self._next_full_scan = 0.0
+        if self.push_mode:
+            self._install_unread_observer()
 
     # ── BaseWatcher interface ─────────────────────────────────────────────────
 
     def check_new_events(self) -> list[dict]:
         """
-        One full poll cycle:
+        One poll cycle:
           1. Page-alive check → reconnect if page was closed
           2. Pane recovery   → dismiss "Use Here" dialog if chat list disappeared
           3. Fetch unread messages from DOM
           4. Blacklist + group-mode filtering
           5. check_outbox()  → send any pending outgoing replies
+        In push mode steps 2–3 (the full scan) only run every
+        fallback_poll_interval seconds; other cycles take the unread chats
+        the page's MutationObserver pushed since the last cycle.
         Returns only messages that passed all filters.
         """
 
@@ -184,7 +302,26 @@ class WhatsAppWatcher(BaseWatcher):
             self.log("Page closed — reconnecting ...")
             self.wait_for_login()
             self._no_pane_streak = 0
+            self._next_full_scan = 0.0
 
+        full_scan = not self.push_mode or time.monotonic() >= self._next_full_scan
+        if full_scan:
+            raw = self._full_scan()
+        else:
+            raw = self._pushed_messages()
+
+        processable = self._filter_messages(raw)
+
+        if full_scan and not raw:
+            self.log("No new unread messages.")
+
+        # ── 5. Outbox: send pending replies ───────────────────────────────────
+        self.check_outbox()
+
+        return processable
+
+    def _full_scan(self) -> list[dict]:
+        """Pane recovery + full DOM scan; in push mode also the observer health check."""
         # ── 2. Pane recovery ─────────────────────────────────────────────────
         try:
             pane_visible = self.page.evaluate(
@@ -205,9 +342,15 @@ class WhatsAppWatcher(BaseWatcher):
         else:
             self._no_pane_streak = 0
 
+        if self.push_mode:
+            self._install_unread_observer()
+            self._next_full_scan = time.monotonic() + self.fallback_interval
+
         # ── 3. Fetch raw unread messages from DOM ─────────────────────────────
-        raw = self._get_unread_messages()
+        return self._get_unread_messages()
 
+    def _filter_messages(self, raw: list[dict]) -> list[dict]:
+        """Blacklist + group-mode filtering; skipped chats are marked seen."""
         # ── 4. Blacklist + group-mode filtering ───────────────────────────────
         wa_cfg    = load_whatsapp_config()
         blacklist = wa_cfg.get("group_blacklist", [])
@@ -247,12 +390,6 @@ class WhatsAppWatcher(BaseWatcher):
 
             processable.append(msg)
 
-        if not raw:
-            self.log("No new unread messages.")
-
-        # ── 5. Outbox: send pending replies ───────────────────────────────────
-        self.check_outbox()
-
         return processable
 
     def process_event(self, event: dict) -> None:
@@ -451,7 +588,7 @@ class WhatsAppWatcher(BaseWatcher):
                             : '';
                         debug.push('NO_PANE. aria=' + ariaEls);
                         debug.push('roles=' + roleEls);
-                        return { msgs, debug };
+                        return { msgs, debug, noPane: true };
                     }
 
                     const badgeSelectors = [
@@ -488,6 +625,7 @@ class WhatsAppWatcher(BaseWatcher):
                         return { msgs, debug };
                     }
 
+                    const timeLabel = /^[0-9]{1,2}:[0-9]{2}( ?[ap]m)?$|^[a-z]+day$|^[0-9]{1,2}[/.][0-9]{1,2}[/.][0-9]{2,4}$/i;
                     const processedRows = new Set();
                     for (const badge of badges) {
                         let row   = badge;
@@ -533,10 +671,18 @@ class WhatsAppWatcher(BaseWatcher):
                         const isGroupByAria = /group/i.test(ariaLabel);
                         const isGroup      = !!(groupIcon || isGroupByAria || hasGroupPrefix);
 
+                        let time = '';
+                        for (const el of row.querySelectorAll('div, span')) {
+                            const t = el.children.length ? '' : el.textContent.trim();
+                            if (timeLabel.test(t)) { time = t; break; }
+                        }
+                        const unread = ((badge.textContent || badge.getAttribute('aria-label') || '')
+                            .match(/[0-9]+/) || [''])[0];
+
                         debug.push('CHAT name=' + name.substring(0,20).replace(/[^\x20-\x7E]/g,'?')
                             + ' msg=' + message.substring(0,20).replace(/[^\x20-\x7E]/g,'?')
                             + ' group=' + isGroup);
-                        msgs.push({ name, message, isGroup });
+                        msgs.push({ name, message, isGroup, time, unread });
                     }
 
                     return { msgs, debug };
@@ -546,25 +692,88 @@ class WhatsAppWatcher(BaseWatcher):
             for d in result.get("debug", []):
                 self.log(f"[DOM] {d}")
 
-            for item in result.get("msgs", []):
-                chat_name = item.get("name",    "Unknown")
-                message   = item.get("message", "")
-                key       = f"{chat_name}:{message}"
-                if key in self.seen_messages:
-                    continue
-                messages.append({
-                    "chat_name": chat_name,
-                    "sender":    chat_name,
-                    "message":   message,
-                    "is_group":  item.get("isGroup", False),
-                    "key":       key,
-                })
+            # No pane says nothing about which chats were read
+            if not result.get("noPane"):
+                messages = self._to_messages(result.get("msgs", []))
 
         except Exception as e:
             self.log(f"Error reading chats: {e}")
 
         return messages
 
+    def _to_messages(self, items: list[dict]) -> list[dict]:
+        """Unread chats from the page → message events, minus ones already seen.
+
+        items is the page's complete list of unread chats. A message is keyed
+        by its chat, preview time label, unread count and text, so the same
+        short text sent again later is a new message. While a chat stays
+        unread its key is kept, so a label rolling over (e.g. "23:59" to
+        "Yesterday") does not re-create the task; once the chat drops out of
+        the list it has been read and its key is forgotten.
+        """
+        messages: list[dict] = []
+        keys: set[str] = set()
+        unread_chats: dict[str, tuple[str, str]] = {}
+        for item in items:
+            chat_name = item.get("name",    "Unknown")
+            message   = item.get("message", "")
+            content   = f"{item.get('unread', '')}:{message}"
+            previous  = self._unread_chats.get(chat_name)
+            if previous is not None and previous[0] == content:
+                key = previous[1]
+            else:
+                key = f"{chat_name}:{item.get('time', '')}:{content}"
+            unread_chats[chat_name] = (content, key)
+            if key in keys or key in self.seen_messages:
+                continue
+            keys.add(key)
+            messages.append({
+                "chat_name": chat_name,
+                "sender":    chat_name,
+                "message":   message,
+                "is_group":  item.get("isGroup", False),
+                "key":       key,
+            })
+        self._unread_chats = unread_chats
+        return messages
+
+    # ── Push mode ─────────────────────────────────────────────────────────────
+
+    def _install_unread_observer(self) -> None:
+        """Expose the unread binding (once per page) and (re)attach the observer."""
+        try:
+            if self._push_page is not self.page:
+                self.page.expose_binding(UNREAD_BINDING, self._on_unread_push)
+                # Survives reloads: the observer re-attaches once the pane renders
+                self.page.add_init_script(f"({UNREAD_OBSERVER_JS})()")
+                self._push_page = self.page
+            state = self.page.evaluate(UNREAD_OBSERVER_JS)
+            if state != "attached":
+                self.log(f"Unread observer: {state}")
+        except Exception as e:
+            self.log(f"Unread observer install failed ({e}) — full scans continue")
+
+    def _on_unread_push(self, source, chats) -> None:
+        """Binding callback: runs on Playwright's dispatch, so it only stores.
+
+        Each report is the page's complete unread list, so a newer one
+        replaces any not yet read instead of being appended to it.
+        """
+        if isinstance(chats, list):
+            self._pushed = [c for c in chats if isinstance(c, dict)]
+
+    def _pushed_messages(self) -> list[dict]:
+        """Unread chats from the observer's latest report since the last cycle."""
+        try:
+            self.page.wait_for_timeout(PUSH_PUMP_MS)  # deliver queued binding calls
+        except Exception:
+            self._next_full_scan = 0.0  # page trouble: let the full scan recover it
+            return []
+        chats, self._pushed = self._pushed, None
+        if chats is None:
+            return []  # no report: the unread list is unchanged
+        return self._to_messages(chats)
+
     # ── Task file creation ────────────────────────────────────────────────────
 
     def _create_task_file(
@@ -608,8 +817,7 @@ class WhatsAppWatcher(BaseWatcher):
             f"{reply_note}"
             f"- [ ] Log outcome in /Logs/{datetime.now().strftime('%Y-%m-%d')}.md\n"
         )
-        with open(filepath, "w", encoding="utf-8", errors="replace", newline="\n") as fh:
-            fh.write(content)
+        write_text_atomic(filepath, content.encode("utf-8", errors="replace"))
         self.log(f"Task created: {filepath.name}")
         log_event("WhatsAppWatcher Task Created", [
             f"Chat: {chat_name}",
@@ -790,16 +998,13 @@ class WhatsAppWatcher(BaseWatcher):
 
                 success = self.send_reply(chat_name, message)
 
-                log_path = VAULT_PATH / "Logs" / f"{datetime.now().strftime('%Y-%m-%d')}.md"
                 try:
-                    with open(log_path, "a", encoding="utf-8") as lf:
-                        status = "SENT" if success else "FAILED"
-                        lf.write(
-                            f"\n## {datetime.now().strftime('%H:%M')} - WhatsApp Reply {status}\n"
-                            f"- Chat: {chat_name}\n"
-                            f"- Task: {task_ref}\n"
-                            f"- Message: {message[:100]}\n"
-                        )
+                    status = "SENT" if success else "FAILED"
+                    log_event(f"WhatsApp Reply {status}", [
+                        f"Chat: {chat_name}",
+                        f"Task: {task_ref}",
+                        f"Message: {message[:100]}",
+                    ])
                 except Exception:
                     pass
 
@@ -4,7 +4,7 @@ from pathlib import Path
 from datetime import datetime
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
-from channel_event_to_task import event_to_task
+from channel_adapters import get_adapter
 
 VAULT_PATH = Path(__file__).parent.resolve()
 INBOX = VAULT_PATH / "Channels" / "WhatsApp_Inbox"
@@ -17,7 +17,7 @@ class Handler(FileSystemEventHandler):
             return
         p = Path(event.src_path)
         try:
-            event_to_task(p)
+            get_adapter("whatsapp").convert(p)  # same adapter as ingestion_daemon.py
         except Exception:
             pass
 